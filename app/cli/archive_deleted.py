@@ -0,0 +1,44 @@
+"""
+삭제 행 보관 CLI
+
+보존 기간이 지난 soft delete 사용자/유치원을 보관 테이블(users_archive, kindergartens_archive)로
+배치 단위로 옮기고, 테이블별 이동 행 수와 배치별 소요 시간을 JSON으로 출력합니다.
+중단 후 다시 실행하면 남은 행부터 이어서 처리합니다.
+
+    python -m app.cli.archive_deleted
+    python -m app.cli.archive_deleted --retention-days 90 --batch-size 5000 --max-batches 10
+"""
+import argparse
+import asyncio
+import json
+import sys
+import time
+
+from app.db.database import AsyncSessionLocal
+from app.services.archive_service import ArchiveReport, archive_deleted_rows
+from app.utils.config import settings
+
+
+async def run(retention_days: int, batch_size: int, max_batches) -> ArchiveReport:
+    async with AsyncSessionLocal() as db:
+        return await archive_deleted_rows(db, retention_days, batch_size, max_batches)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--retention-days", type=int, default=settings.ARCHIVE_RETENTION_DAYS)
+    parser.add_argument("--batch-size", type=int, default=settings.ARCHIVE_BATCH_SIZE)
+    parser.add_argument("--max-batches", type=int, help="테이블마다 처리할 최대 배치 수 (생략 시 모두)")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    report = asyncio.run(run(args.retention_days, args.batch_size, args.max_batches))
+    elapsed = time.perf_counter() - started
+
+    print(json.dumps(report.to_dict(), ensure_ascii=False, indent=2))
+    total = sum(report.moved.values())
+    print(f"{total:,}행 보관 ({len(report.batches)}배치, {elapsed:.2f}s)", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
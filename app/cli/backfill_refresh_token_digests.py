@@ -0,0 +1,44 @@
+"""
+refresh token digest 전환 CLI (migrations/001 적용 + 신 버전 배포 후 실행)
+
+만료/폐기된 refresh token을 삭제하고, 남은 행 중 digest가 없는 행(001 적용 전에 저장된 토큰)의
+digest를 배치 단위로 채운 뒤 결과를 JSON으로 출력합니다.
+remaining이 0이면 migrations/006_refresh_token_digest_contract.sql을 적용할 수 있습니다.
+
+    python -m app.cli.backfill_refresh_token_digests
+    python -m app.cli.backfill_refresh_token_digests --batch-size 5000
+"""
+import argparse
+import asyncio
+import json
+import sys
+import time
+
+from app.db.database import AsyncSessionLocal
+from app.services.auth_service import backfill_refresh_token_digests
+from app.utils.config import settings
+
+
+async def run(batch_size: int) -> dict:
+    async with AsyncSessionLocal() as db:
+        return await backfill_refresh_token_digests(db, batch_size)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--batch-size", type=int, default=settings.REFRESH_TOKEN_SWEEP_BATCH_SIZE)
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    report = asyncio.run(run(args.batch_size))
+    elapsed = time.perf_counter() - started
+
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+    print(f"{report['backfilled']:,}행 digest 채움, {report['purged']:,}행 삭제 ({elapsed:.2f}s)", file=sys.stderr)
+    if report["remaining"]:
+        print(f"digest가 없는 행 {report['remaining']:,}개 남음 - 다시 실행하세요", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+유치원 일괄 등록 CLI (CSV / NDJSON 파일)
+
+파일을 청크 단위로 읽어 API와 같은 경로(배치 검증 → COPY → business_number 병합)로
+적재하고, 결과 보고서를 JSON으로 출력합니다.
+
+    python -m app.cli.import_kindergartens partners.csv
+    python -m app.cli.import_kindergartens partners.ndjson --batch-size 10000 --report report.json
+"""
+import argparse
+import asyncio
+import json
+import sys
+import time
+
+from app.db.database import AsyncSessionLocal
+from app.services.import_service import IMPORT_FORMATS, ImportReport, import_kindergartens, iter_records
+from app.utils.config import settings
+
+CHUNK_SIZE = 1024 * 1024
+
+
+async def read_chunks(path: str, chunk_size: int = CHUNK_SIZE):
+    """ 파일을 chunk_size 바이트씩 읽음 (파일 읽기는 스레드에서 실행) """
+    with open(path, "rb") as file:
+        while True:
+            chunk = await asyncio.to_thread(file.read, chunk_size)
+            if not chunk:
+                return
+            yield chunk
+
+
+def detect_format(path: str) -> str:
+    return "ndjson" if path.endswith((".ndjson", ".jsonl")) else "csv"
+
+
+async def run(path: str, format: str, batch_size: int, max_errors: int) -> ImportReport:
+    async with AsyncSessionLocal() as db:
+        return await import_kindergartens(
+            db, iter_records(read_chunks(path), format), batch_size, ImportReport(max_errors=max_errors)
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("path")
+    parser.add_argument("--format", choices=IMPORT_FORMATS)
+    parser.add_argument("--batch-size", type=int, default=settings.IMPORT_BATCH_SIZE)
+    parser.add_argument("--max-errors", type=int, default=settings.IMPORT_MAX_ERRORS)
+    parser.add_argument("--report", help="결과 보고서를 저장할 JSON 파일 (생략 시 표준 출력)")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    report = asyncio.run(run(args.path, args.format or detect_format(args.path), args.batch_size, args.max_errors))
+    elapsed = time.perf_counter() - started
+
+    output = json.dumps(report.to_dict(), ensure_ascii=False, indent=2)
+    if args.report:
+        with open(args.report, "w", encoding="utf-8") as file:
+            file.write(output)
+    else:
+        print(output)
+    print(f"{report.total:,}행 처리 ({report.total / elapsed:,.0f} rows/s, {elapsed:.2f}s)", file=sys.stderr)
+    sys.exit(1 if report.failed else 0)
+
+
+if __name__ == "__main__":
+    main()
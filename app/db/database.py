@@ -1,23 +1,269 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+import asyncio
+import json
+import logging
+import threading
+import time
+import uuid
+from typing import Optional
+from fastapi import Request
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool, QueuePool
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from dotenv import load_dotenv
+from app.db.routing import Replica, SessionRouter, track_write
 from app.utils.config import settings  # 설정 불러오기
+from app.utils.logging_config import instrument_engine
+from app.utils.metrics import DB_POOL_CHECKOUT_DURATION, REGISTRY
 from sqlalchemy.ext.declarative import declarative_base
 
 
+logger = logging.getLogger(__name__)
+
 # Load environment variables from .env
 load_dotenv()
 
-# Construct the SQLAlchemy connection string
-DATABASE_URL = settings.DATABASE_URL
-
 Base = declarative_base()
 
-# SQLAlchemy 엔진 생성 (Transaction Pooler 사용 시, Pooling 해제)
-engine = create_engine(DATABASE_URL, pool_pre_ping=True, echo=True)
 
-# 세션 팩토리 생성
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+class _TimedCheckoutMixin:
+    """ 커넥션 체크아웃 대기 시간(새 연결 생성 포함)을 db_pool_checkout_seconds에 기록 """
+    metrics_label = "sync"
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            DB_POOL_CHECKOUT_DURATION.labels(self.metrics_label).observe(time.perf_counter() - started)
+
+
+class TimedQueuePool(_TimedCheckoutMixin, QueuePool):
+    metrics_label = "sync"
+
+
+class TimedAsyncAdaptedQueuePool(_TimedCheckoutMixin, AsyncAdaptedQueuePool):
+    metrics_label = "async"
+
+
+class TimedNullPool(_TimedCheckoutMixin, NullPool):
+    """ 체크아웃마다 새 연결을 열고 반납 시 닫는 풀 (열려 있는 연결 수를 db_pool_connections로 노출) """
+    metrics_label = "sync"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._checked_out = 0
+
+    def _do_get(self):
+        connection = super()._do_get()
+        self._checked_out += 1
+        return connection
+
+    def _do_return_conn(self, record):
+        self._checked_out -= 1
+        super()._do_return_conn(record)
+
+    def checkedout(self) -> int:
+        return self._checked_out
+
+
+class TimedAsyncNullPool(TimedNullPool):
+    metrics_label = "async"
+
+
+def _pool_options(asynchronous: bool) -> dict:
+    """ DB_POOL_MODE에 맞는 엔진 풀 설정
+
+    - null: transaction pooler가 이미 연결을 공유하므로 애플리케이션에서는 풀을 두지 않음
+    - queue: pool_recycle로 idle timeout 전에 연결을 교체하고, LIFO로 한가할 때 남는 연결을 줄임
+    체크아웃마다 ping하는 pool_pre_ping은 기본으로 끄고 monitor_database_forever로 대체합니다.
+    """
+    if settings.DB_POOL_MODE == "null":
+        return {"poolclass": TimedAsyncNullPool if asynchronous else TimedNullPool}
+    return {
+        "poolclass": TimedAsyncAdaptedQueuePool if asynchronous else TimedQueuePool,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE_SECONDS,
+        "pool_use_lifo": settings.DB_POOL_LIFO,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+
+
+def _asyncpg_connect_args() -> dict:
+    """ transaction pooler에서는 트랜잭션마다 서버 연결이 바뀌므로 prepared statement를 재사용하지 않음
+
+    asyncpg 문장 캐시와 SQLAlchemy prepared statement 캐시를 끄고, 이름 충돌
+    (prepared statement "__asyncpg_stmt_1__" already exists)이 나지 않도록 매번 고유한 이름을 사용합니다.
+    """
+    if settings.DB_POOL_MODE != "null":
+        return {}
+    return {
+        "statement_cache_size": 0,
+        "prepared_statement_cache_size": 0,
+        "prepared_statement_name_func": lambda: f"__asyncpg_{uuid.uuid4()}__",
+    }
+
+
+def create_db_engine(url: str):
+    """ 동기(psycopg2) 엔진 (DB_POOL_MODE 풀 설정 적용) """
+    return create_engine(url, echo=settings.SQL_ECHO, **_pool_options(asynchronous=False))
+
+
+def create_async_db_engine(url: str):
+    """ 비동기(asyncpg) 엔진 (DB_POOL_MODE 풀 설정 및 prepared statement 설정 적용) """
+    return create_async_engine(
+        url,
+        echo=settings.SQL_ECHO,  # SQL 로그는 디버그 시에만 출력
+        connect_args=_asyncpg_connect_args(),
+        **_pool_options(asynchronous=True),
+    )
+
+def _require_url(url: Optional[str], name: str) -> str:
+    """ 접속 문자열이 없으면 빠진 설정을 알려주는 오류 (None 포트 같은 잘못된 URL을 만들지 않음) """
+    if url:
+        return url
+    missing = ", ".join(settings.missing_database_settings())
+    raise RuntimeError(f"{name}이(가) 설정되지 않았습니다: {name} 또는 DB 접속 정보({missing})를 지정하세요")
+
+
+# ✅ 엔진/세션 팩토리는 첫 사용 시 생성 (import 시점에는 설정 검증/엔진 생성을 하지 않음)
+# 엔진 생성은 접속하지 않으며, 실제 연결은 워밍업(lifespan) 또는 첫 쿼리 시점에 열림
+_init_lock = threading.Lock()
+_engine: Optional[Engine] = None
+_session_factory: Optional[sessionmaker] = None
+_async_engine: Optional[AsyncEngine] = None
+_async_session_factory: Optional[async_sessionmaker] = None
+_session_router: Optional[SessionRouter] = None
+
+
+def get_engine() -> Engine:
+    """ 동기(psycopg2) 엔진 (Transaction Pooler 사용 시 DB_POOL_MODE=null로 Pooling 해제) """
+    global _engine, _session_factory
+    if _engine is None:
+        with _init_lock:
+            if _engine is None:
+                engine = create_db_engine(_require_url(settings.DATABASE_URL, "DATABASE_URL"))
+                # 요청별 DB 시간 측정 (구조화 로그의 db_ms)
+                instrument_engine(engine)
+                _session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+                _engine = engine
+    return _engine
+
+
+def get_async_engine() -> AsyncEngine:
+    """ ✅ 비동기 엔진 (asyncpg) - 이벤트 루프를 막지 않고 여러 요청의 DB 대기를 겹쳐서 처리 """
+    global _async_engine, _async_session_factory
+    if _async_engine is None:
+        with _init_lock:
+            if _async_engine is None:
+                engine = create_async_db_engine(_require_url(settings.ASYNC_DATABASE_URL, "ASYNC_DATABASE_URL"))
+                instrument_engine(engine.sync_engine)
+                # commit 이후에도 ORM 객체 속성에 접근할 수 있도록 expire 비활성화
+                _async_session_factory = async_sessionmaker(
+                    bind=engine,
+                    class_=AsyncSession,
+                    autoflush=False,
+                    expire_on_commit=False,
+                )
+                _async_engine = engine
+    return _async_engine
+
+
+def SessionLocal() -> Session:
+    """ 동기 세션 생성 (첫 호출 시 엔진 생성) """
+    get_engine()
+    return _session_factory()
+
+
+def AsyncSessionLocal() -> AsyncSession:
+    """ 비동기 세션 생성 (첫 호출 시 엔진 생성) """
+    get_async_engine()
+    return _async_session_factory()
+
+
+def _create_replica(name: str, url: str) -> Replica:
+    """ 읽기 전용 replica 엔진/세션 팩토리 (primary와 같은 풀 설정) """
+    replica_engine = create_async_db_engine(url)
+    instrument_engine(replica_engine.sync_engine)
+    sessions = async_sessionmaker(bind=replica_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False)
+    return Replica(name=name, engine=replica_engine, sessionmaker=sessions)
+
+
+def get_session_router() -> SessionRouter:
+    """ ✅ 읽기 세션 라우터 (DB_REPLICA_URLS가 비어 있으면 모든 읽기가 primary) """
+    global _session_router
+    if _session_router is None:
+        with _init_lock:
+            if _session_router is None:
+                _session_router = SessionRouter(
+                    primary=AsyncSessionLocal,
+                    replicas=[
+                        _create_replica(f"replica{i}", url)
+                        for i, url in enumerate(json.loads(settings.DB_REPLICA_URLS or "[]"), start=1)
+                    ],
+                    max_lag_seconds=settings.DB_REPLICA_MAX_LAG_SECONDS,
+                    read_your_writes_seconds=settings.DB_READ_YOUR_WRITES_SECONDS,
+                    check_seconds=settings.DB_REPLICA_CHECK_SECONDS,
+                )
+    return _session_router
+
+
+async def close_database():
+    """ 생성된 엔진의 커넥션 풀 정리 (lifespan 종료 시) """
+    global _engine, _session_factory, _async_engine, _async_session_factory, _session_router
+    engines = [_async_engine] if _async_engine is not None else []
+    if _session_router is not None:
+        engines += [replica.engine for replica in _session_router.replicas]
+    await asyncio.gather(*(engine.dispose() for engine in engines), return_exceptions=True)
+    if _engine is not None:
+        _engine.dispose()
+    _engine = _session_factory = _async_engine = _async_session_factory = _session_router = None
+
+
+@event.listens_for(Session, "after_commit")
+def _mark_committed_writes(session: Session):
+    """ 커밋된 세션에 track_write로 표시된 사용자의 읽기를 잠시 primary로 보냄 """
+    for uid in session.info.pop("written_uids", ()):
+        get_session_router().mark_write(uid)
+
+def _pool_stats():
+    """ 커넥션 풀 상태 (scrape 시점에 조회, 아직 생성되지 않은 엔진은 제외) """
+    rows = []
+    pools = []
+    if _engine is not None:
+        pools.append(("sync", _engine.pool))
+    if _async_engine is not None:
+        pools.append(("async", _async_engine.sync_engine.pool))
+    if _session_router is not None:
+        pools += [(replica.name, replica.engine.sync_engine.pool) for replica in _session_router.replicas]
+    for label, pool in pools:
+        if isinstance(pool, NullPool):
+            # 풀 없이 체크아웃마다 연결을 열고 닫으므로 열린 연결 수만 의미가 있음
+            rows.append(((label, "checked_out"), pool.checkedout()))
+            continue
+        rows.extend([
+            ((label, "size"), pool.size()),
+            ((label, "checked_out"), pool.checkedout()),
+            ((label, "idle"), pool.checkedin()),
+            ((label, "overflow"), pool.overflow()),
+        ])
+    return rows
+
+REGISTRY.callback("db_pool_connections", "DB connection pool state", "gauge", ("engine", "state"), _pool_stats)
+
+# 백그라운드 상태 확인 결과 (1 = 마지막 확인 성공, 확인 전에는 노출하지 않음)
+_health: dict[str, float] = {}
+REGISTRY.callback(
+    "db_health", "Last background DB health check result", "gauge", ("engine",),
+    lambda: [((label,), value) for label, value in _health.items()],
+)
+REGISTRY.callback(
+    "db_replica_state", "Read replica lag and availability", "gauge", ("replica", "state"),
+    lambda: _session_router.replica_stats() if _session_router is not None else [],
+)
 
 # 데이터베이스 세션을 관리하는 의존성 함수
 def get_db():
@@ -30,3 +276,70 @@ def get_db():
         yield db
     finally:
         db.close()
+
+def _request_uid(request: Request) -> Optional[str]:
+    user = getattr(request.state, "user", None)
+    return user["uid"] if user else None
+
+async def get_async_db(request: Request):
+    """
+    async 엔드포인트에서 사용할 AsyncSession(primary)을 반환하는 의존성 함수.
+    요청이 끝나면 세션을 자동으로 닫음.
+    커밋하면 요청 사용자의 이후 읽기가 잠시 primary로 전달됨 (read-your-writes).
+    """
+    async with AsyncSessionLocal() as db:
+        track_write(db, _request_uid(request))
+        yield db
+
+async def get_read_db(request: Request):
+    """
+    읽기 전용 엔드포인트에서 사용할 AsyncSession을 반환하는 의존성 함수.
+    지연이 작은 replica가 있으면 replica, 없거나 요청 사용자가 방금 쓰기를 했으면 primary 세션.
+    """
+    async with get_session_router().read_session(_request_uid(request)) as db:
+        yield db
+
+async def check_database():
+    """ DB 연결 확인 (SELECT 1) - /ready 준비 상태 확인용 """
+    async with get_async_engine().connect() as conn:
+        await conn.execute(text("SELECT 1"))
+
+async def monitor_database_forever(interval: float = settings.DB_HEALTH_CHECK_SECONDS):
+    """ 체크아웃마다 ping(pool_pre_ping)하는 대신 주기적으로 DB 연결을 확인하는 백그라운드 태스크
+
+    확인 쿼리가 끊긴 연결 오류로 실패하면 SQLAlchemy가 그 시점 이전에 열린 풀 연결을 모두
+    무효화하므로(DB 재시작/페일오버) 이후 요청은 새 연결을 엽니다.
+    서버/풀러의 idle timeout으로 하나씩 끊기는 연결은 pool_recycle로 미리 교체됩니다.
+    """
+    while True:
+        try:
+            await check_database()
+            if _health.get("async") == 0.0:
+                logger.info("DB 연결 복구")
+            _health["async"] = 1.0
+        except Exception as e:
+            if _health.get("async") != 0.0:
+                logger.warning("DB 상태 확인 실패: %s", e)
+            _health["async"] = 0.0
+        await asyncio.sleep(interval)
+
+async def warm_up_database(connections: int = settings.DB_WARMUP_CONNECTIONS):
+    """ 커넥션 풀에 connections개의 연결을 동시에 미리 열어둠 (첫 요청의 TLS/인증 지연 제거)
+
+    DB_POOL_MODE=null이면 반납한 연결이 바로 닫히므로 접속 확인만 한 번 합니다.
+    """
+    if settings.DB_POOL_MODE == "null":
+        connections = 1
+    engine = get_async_engine()
+    opened = []
+    try:
+        for _ in range(max(1, min(connections, settings.DB_POOL_SIZE))):
+            opened.append(engine.connect())
+        await asyncio.gather(*(_ping(conn) for conn in opened))
+    finally:
+        # 반납된 연결은 풀에 idle 상태로 남음
+        await asyncio.gather(*(conn.close() for conn in opened), return_exceptions=True)
+
+async def _ping(conn):
+    await conn.start()
+    await conn.execute(text("SELECT 1"))
@@ -1,2 +1,5 @@
 from .user import User
 from .kindergarten import Kindergarten
+from .refresh_tokens import RefreshToken
+from .geocoded_address import GeocodedAddress
+from .archive import users_archive, kindergartens_archive
@@ -0,0 +1,24 @@
+from sqlalchemy import Column, Table, TIMESTAMP
+from sqlalchemy.sql import func
+from app.db.database import Base
+from app.db.models.kindergarten import Kindergarten
+from app.db.models.user import User
+
+
+def _archive_table(source: Table) -> Table:
+    """ 원본 테이블과 같은 컬럼 + archived_at을 가진 보관 테이블 (인덱스/unique/FK 없음) """
+    columns = [
+        Column(column.name, column.type, primary_key=column.primary_key, nullable=column.nullable)
+        for column in source.columns
+    ]
+    return Table(
+        f"{source.name}_archive",
+        Base.metadata,
+        *columns,
+        Column("archived_at", TIMESTAMP(timezone=True), server_default=func.now(), nullable=False),
+    )
+
+
+# ✅ 보존 기간이 지난 soft delete 행을 옮겨두는 보관 테이블 (archive_service)
+users_archive = _archive_table(User.__table__)
+kindergartens_archive = _archive_table(Kindergarten.__table__)
@@ -0,0 +1,19 @@
+from sqlalchemy import Column, String, Float, TIMESTAMP
+import datetime
+from app.db.database import Base
+from app.utils.geohash import GEOHASH_PRECISION
+
+class GeocodedAddress(Base):
+    """ ✅ 오프라인 지오코딩 테이블 (정규화된 주소 → 좌표)
+
+    외부 지오코딩 결과를 배치로 적재해 두고, 유치원 저장 시점에는
+    외부 API 호출 없이 이 테이블에서 좌표와 geohash 셀을 조회합니다.
+    """
+    __tablename__ = "geocoded_addresses"
+
+    # 공백을 정리한 주소 (geocoding_service.normalize_address)
+    address = Column(String, primary_key=True)
+    latitude = Column(Float, nullable=False)
+    longitude = Column(Float, nullable=False)
+    geohash = Column(String(GEOHASH_PRECISION), nullable=False)
+    updated_at = Column(TIMESTAMP, default=datetime.datetime.utcnow, nullable=False)
@@ -1,27 +1,30 @@
-from sqlalchemy import Column, String, Boolean, TIMESTAMP, ForeignKey
+from sqlalchemy import Column, String, Boolean, Float, TIMESTAMP, ForeignKey, Index, event
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
-from sqlalchemy.orm import declarative_base
 import uuid
 import datetime
-
-Base = declarative_base()
+from app.db.database import Base
+from app.utils import geohash
 
 class Kindergarten(Base):
     """유치원 정보를 저장하는 데이터베이스 모델"""
     __tablename__ = "kindergartens"
 
     # 기본 식별자
-    id = Column(PG_UUID, primary_key=True, default=uuid.uuid4)
+    id = Column(PG_UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     # 유치원 소유자(원장) ID (users 테이블 참조)
-    owner_id = Column(PG_UUID, ForeignKey("users.id"), nullable=False)
+    owner_id = Column(PG_UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
     # 유치원 이름
     name = Column(String, nullable=False)
-    # 사업자 등록 번호
-    business_number = Column(String, unique=True, nullable=False)
+    # 사업자 등록 번호 (삭제되지 않은 유치원 사이에서만 unique)
+    business_number = Column(String, nullable=False)
     # 유치원 유형 (공립/사립 등)
     type = Column(String, nullable=False)
     # 유치원 주소
     address = Column(String, nullable=False)
+    # 좌표 (geocoded_addresses에서 저장 시점에 채움) 및 근처 검색용 geohash 셀
+    latitude = Column(Float, nullable=True)
+    longitude = Column(Float, nullable=True)
+    geohash = Column(String(geohash.GEOHASH_PRECISION), nullable=True)
     # 연락처
     contact = Column(String, nullable=False)
     # 이메일 주소
@@ -29,7 +32,7 @@ class Kindergarten(Base):
 
     # 인증 상태
     certificate_status = Column(String, nullable=False)
-    
+
     # 계정 상태 관련 필드
     is_active = Column(Boolean, default=True, nullable=False)     # 활성화 상태
     is_suspended = Column(Boolean, default=False, nullable=False)  # 정지 상태
@@ -37,5 +40,53 @@ class Kindergarten(Base):
     suspended_at = Column(TIMESTAMP, nullable=True)               # 계정 정지 일시
     deleted_at = Column(TIMESTAMP, nullable=True)                 # 계정 삭제 일시
 
-    # 생성 일시
-    created_at = Column(TIMESTAMP, default=datetime.datetime.utcnow)
+    # 생성 일시 (목록 keyset 페이지네이션 기준이므로 NOT NULL)
+    created_at = Column(TIMESTAMP, default=datetime.datetime.utcnow, nullable=False)
+    # 수정 일시 (근처 검색 인덱스의 증분 갱신 기준)
+    updated_at = Column(
+        TIMESTAMP, default=datetime.datetime.utcnow, onupdate=datetime.datetime.utcnow, nullable=False
+    )
+
+    # 목록/검색 인덱스 - 모두 (created_at, id) 순서로 끝나서 keyset 페이지네이션을 인덱스 순서대로 처리
+    __table_args__ = (
+        # 일괄 등록 upsert(ON CONFLICT) 기준 - 삭제된 행은 인덱스에 넣지 않음
+        Index(
+            "uq_kindergartens_business_number_live", business_number,
+            unique=True, postgresql_where=is_deleted == False,
+        ),
+        # 보관(archive) 대상 조회 (삭제된 행만)
+        Index("ix_kindergartens_deleted_at", deleted_at, postgresql_where=is_deleted == True),
+        # 원장별 목록 (삭제된 유치원 포함 조회도 지원)
+        Index("ix_kindergartens_owner_created", owner_id, created_at, id),
+        # 전체 목록 (삭제되지 않은 유치원만)
+        Index("ix_kindergartens_live_created", created_at, id, postgresql_where=is_deleted == False),
+        # 유형/인증 상태 필터
+        Index("ix_kindergartens_type_created", type, created_at, id, postgresql_where=is_deleted == False),
+        Index(
+            "ix_kindergartens_certificate_created", certificate_status, created_at, id,
+            postgresql_where=is_deleted == False,
+        ),
+        # 이름/주소 prefix 검색 (LIKE 'prefix%')
+        Index(
+            "ix_kindergartens_name_prefix", name,
+            postgresql_ops={"name": "text_pattern_ops"}, postgresql_where=is_deleted == False,
+        ),
+        Index(
+            "ix_kindergartens_address_prefix", address,
+            postgresql_ops={"address": "text_pattern_ops"}, postgresql_where=is_deleted == False,
+        ),
+        # 근처 검색 (geohash 셀 IN (...))
+        Index("ix_kindergartens_geohash", geohash, postgresql_where=is_deleted == False),
+        # 공간 인덱스 증분 갱신 (updated_at 워터마크 이후 변경분)
+        Index("ix_kindergartens_updated", updated_at, id),
+    )
+
+
+@event.listens_for(Kindergarten, "before_insert")
+@event.listens_for(Kindergarten, "before_update")
+def _sync_geohash(mapper, connection, target):
+    """ 좌표가 바뀌면 geohash 셀도 함께 갱신 (ORM 저장 경로) """
+    if target.latitude is None or target.longitude is None:
+        target.geohash = None
+    else:
+        target.geohash = geohash.encode(target.latitude, target.longitude)
@@ -1,16 +1,35 @@
-from sqlalchemy import Column, String, Boolean, TIMESTAMP, ForeignKey
+from sqlalchemy import Column, Boolean, TIMESTAMP, ForeignKey, Index, LargeBinary
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 import uuid
 from app.db.database import Base
 
 class RefreshToken(Base):
-    """ ✅ Refresh Token 테이블 모델 """
+    """ ✅ Refresh Token 테이블 모델
+
+    토큰 원문 대신 고정 길이 SHA-256 digest(32바이트)만 저장하고 인덱싱합니다.
+    """
     __tablename__ = "refresh_tokens"
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
-    refresh_token = Column(String, nullable=False, unique=True)
+    token_digest = Column(LargeBinary(32), nullable=False)
     expires_at = Column(TIMESTAMP(timezone=True), nullable=False)
     created_at = Column(TIMESTAMP(timezone=True), server_default=func.now(), nullable=False)
     revoked = Column(Boolean, default=False, nullable=False)
+
+    __table_args__ = (
+        # /refresh, /logout 조회용 (revoked, expires_at을 INCLUDE하여 테이블 접근 없이 유효성 확인)
+        Index(
+            "uq_refresh_tokens_token_digest", token_digest,
+            unique=True, postgresql_include=["user_id", "expires_at", "revoked"],
+        ),
+        # 로그인 시 사용자의 유효한 토큰 일괄 폐기용 (revoked = false AND expires_at > now())
+        Index(
+            "ix_refresh_tokens_user_active", user_id, expires_at,
+            postgresql_where=revoked == False,
+        ),
+        # 만료/폐기 토큰 정리(sweeper)용
+        Index("ix_refresh_tokens_expires_at", expires_at),
+        Index("ix_refresh_tokens_revoked", expires_at, postgresql_where=revoked == True),
+    )
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Boolean, TIMESTAMP, CheckConstraint
+from sqlalchemy import Column, String, Boolean, TIMESTAMP, CheckConstraint, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 import uuid
@@ -9,8 +9,9 @@ class User(Base):
     __tablename__ = "users"
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    firebase_uid = Column(String, unique=True, nullable=False)
-    email = Column(String, unique=True, nullable=False)
+    # 삭제되지 않은 사용자 사이에서만 unique (아래 부분 인덱스)
+    firebase_uid = Column(String, nullable=False)
+    email = Column(String, nullable=False)
     role = Column(String(20), nullable=False)
 
     # 계정 상태 관리
@@ -21,8 +22,15 @@ class User(Base):
     deleted_at = Column(TIMESTAMP(timezone=True), nullable=True)
 
     created_at = Column(TIMESTAMP(timezone=True), server_default=func.now(), nullable=False)
+    # 수정 일시 (조건부 조회 ETag의 버전, UPDATE마다 갱신)
+    updated_at = Column(TIMESTAMP(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
 
-    # CHECK 제약 조건 추가
+    # CHECK 제약 조건 및 인덱스
     __table_args__ = (
         CheckConstraint(role.in_(['user', 'owner', 'staff', 'superadmin', 'admin_staff']), name="valid_user_role"),
+        # 로그인 upsert(ON CONFLICT) / 토큰 uid 조회 - 삭제된 행은 인덱스에 넣지 않음
+        Index("uq_users_firebase_uid_live", firebase_uid, unique=True, postgresql_where=is_deleted == False),
+        Index("uq_users_email_live", email, unique=True, postgresql_where=is_deleted == False),
+        # 보관(archive) 대상 조회 (삭제된 행만)
+        Index("ix_users_deleted_at", deleted_at, postgresql_where=is_deleted == True),
     )
@@ -0,0 +1,158 @@
+import asyncio
+import itertools
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from app.utils.metrics import REGISTRY
+
+logger = logging.getLogger(__name__)
+
+DB_READ_ROUTES = REGISTRY.counter(
+    "db_read_routes_total", "Read-only DB session routing decisions", ("target", "reason"),
+)
+
+# replica 지연 시간 (primary와 WAL 재생 위치가 같으면 0, 재생 기록이 없으면 NULL = 알 수 없음)
+_REPLICA_LAG_SQL = text(
+    """
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp())
+    END
+    """
+)
+
+
+async def postgres_replica_lag(engine: AsyncEngine) -> Optional[float]:
+    """ PostgreSQL replica의 복제 지연(초) 조회 """
+    async with engine.connect() as conn:
+        lag = (await conn.execute(_REPLICA_LAG_SQL)).scalar()
+    return None if lag is None else float(lag)
+
+
+def track_write(db, uid: Optional[str]):
+    """ 세션이 커밋되면 uid 사용자의 읽기를 잠시 primary로 보내도록 표시 (read-your-writes) """
+    if uid:
+        db.info.setdefault("written_uids", set()).add(uid)
+
+
+@dataclass
+class Replica:
+    """ 읽기 전용 replica와 마지막 지연 확인 결과 """
+    name: str
+    engine: AsyncEngine
+    sessionmaker: async_sessionmaker
+    lag_seconds: Optional[float] = None  # None = 아직 확인 전이거나 확인 실패
+    checked_at: float = 0.0
+
+
+class SessionRouter:
+    """ ✅ 읽기/쓰기 세션 라우터
+
+    쓰기와 트랜잭션은 항상 primary 세션(get_async_db)을 사용하고,
+    읽기 전용 의존성(get_read_db)만 이 라우터로 replica를 고릅니다.
+
+    - 지연이 max_lag_seconds 이하로 확인된 replica를 라운드 로빈으로 사용
+    - 확인 전/확인 실패/확인이 오래된 replica는 제외하고, 남은 replica가 없으면 primary
+    - 같은 사용자가 커밋한 뒤 read_your_writes_seconds 동안은 그 사용자의 읽기를 primary로 보냄
+      (쓰기 기록은 프로세스 내에만 있으므로 다른 워커로 간 요청은 지연 기준으로만 보호됨)
+    - 결정은 db_read_routes_total{target, reason}으로 집계
+    """
+
+    def __init__(
+        self,
+        primary: async_sessionmaker,
+        replicas: list[Replica],
+        max_lag_seconds: float,
+        read_your_writes_seconds: float,
+        check_seconds: float,
+        probe: Callable[[AsyncEngine], Awaitable[Optional[float]]] = postgres_replica_lag,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.primary = primary
+        self.replicas = replicas
+        self.max_lag_seconds = max_lag_seconds
+        self.read_your_writes_seconds = read_your_writes_seconds
+        self.check_seconds = check_seconds
+        self.probe = probe
+        self.clock = clock
+        # uid -> primary로 읽어야 하는 기한 (기한 순서로 정렬되어 앞에서부터 정리)
+        self._recent_writes: OrderedDict[str, float] = OrderedDict()
+        self._round_robin = itertools.count()
+
+    def mark_write(self, uid: str):
+        now = self.clock()
+        self._recent_writes[uid] = now + self.read_your_writes_seconds
+        self._recent_writes.move_to_end(uid)
+        while self._recent_writes:
+            oldest_uid, deadline = next(iter(self._recent_writes.items()))
+            if deadline > now:
+                break
+            del self._recent_writes[oldest_uid]
+
+    def _wrote_recently(self, uid: Optional[str]) -> bool:
+        deadline = self._recent_writes.get(uid) if uid else None
+        return deadline is not None and deadline > self.clock()
+
+    def _eligible(self, replica: Replica, now: float) -> bool:
+        # 모니터가 멈춰 확인 결과가 오래되면 지연을 알 수 없으므로 제외
+        fresh = now - replica.checked_at <= self.check_seconds * 3
+        return fresh and replica.lag_seconds is not None and replica.lag_seconds <= self.max_lag_seconds
+
+    def choose(self, uid: Optional[str] = None) -> tuple[str, async_sessionmaker]:
+        """ 읽기 세션을 만들 대상 (이름, 세션 팩토리) """
+        if not self.replicas:
+            return self._route("primary", "no_replica", self.primary)
+        if self._wrote_recently(uid):
+            return self._route("primary", "read_your_writes", self.primary)
+        now = self.clock()
+        eligible = [replica for replica in self.replicas if self._eligible(replica, now)]
+        if not eligible:
+            return self._route("primary", "replica_unavailable", self.primary)
+        replica = eligible[next(self._round_robin) % len(eligible)]
+        return self._route(replica.name, "replica", replica.sessionmaker)
+
+    @staticmethod
+    def _route(target: str, reason: str, sessionmaker: async_sessionmaker) -> tuple[str, async_sessionmaker]:
+        DB_READ_ROUTES.labels(target, reason).inc()
+        return target, sessionmaker
+
+    def read_session(self, uid: Optional[str] = None) -> AsyncSession:
+        _, sessionmaker = self.choose(uid)
+        return sessionmaker()
+
+    async def check_replicas(self):
+        """ 모든 replica의 지연을 동시에 확인 """
+        async def check(replica: Replica):
+            try:
+                replica.lag_seconds = await self.probe(replica.engine)
+            except Exception as e:
+                if replica.lag_seconds is not None:
+                    logger.warning("replica %s 지연 확인 실패: %s", replica.name, e)
+                replica.lag_seconds = None
+            replica.checked_at = self.clock()
+
+        await asyncio.gather(*(check(replica) for replica in self.replicas))
+
+    async def monitor_forever(self):
+        """ 백그라운드에서 check_seconds마다 replica 지연을 확인하는 태스크 """
+        while True:
+            await self.check_replicas()
+            await asyncio.sleep(self.check_seconds)
+
+    def replica_stats(self) -> list:
+        """ replica별 지연/사용 가능 여부 (scrape 시점에 조회) """
+        now = self.clock()
+        rows = []
+        for replica in self.replicas:
+            rows.append(((replica.name, "available"), float(self._eligible(replica, now))))
+            if replica.lag_seconds is not None:
+                rows.append(((replica.name, "lag_seconds"), replica.lag_seconds))
+        return rows
+
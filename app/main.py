@@ -1,26 +1,96 @@
+import asyncio
+import logging
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.utils.config import settings
-from app.db.database import engine  # database.py에서 생성한 engine을 가져옴
+from app.utils.logging_config import setup_logging
+
+# 큐 기반 구조화 로깅 설정 (다른 모듈이 로그를 남기기 전에 설정)
+setup_logging(level=settings.LOG_LEVEL, json_logs=settings.LOG_JSON)
+logger = logging.getLogger(__name__)
+
 from app.routers.auth import router as auth_router  # 🔹 인증 관련 API 추가
+from app.routers.kindergarten import router as kindergarten_router
+from app.routers.admin import router as admin_router
+from app.utils.security import refresh_firebase_certificates_forever
+from app.utils.redis_client import close_redis
+from app.utils.revocation import token_revocation
+from app.db.database import close_database, get_session_router, monitor_database_forever
+from app.services.auth_service import sweep_refresh_tokens_forever
+from app.services.archive_service import archive_deleted_rows_forever
+from app.services.spatial_index import refresh_spatial_index_forever
 
 # 미들웨어 추가
 from app.middleware.logging import LoggingMiddleware
 from app.middleware.auth import AuthMiddleware
+from app.middleware.rate_limit import RateLimitMiddleware
+from app.middleware.metrics import MetricsMiddleware
+from app.middleware.compression import CompressionMiddleware
+from app.utils.metrics import REGISTRY
+from app.utils.startup import Readiness, default_checks
+from app.utils.jwt_keys import get_key_set
+from fastapi.responses import JSONResponse, PlainTextResponse, Response
 
 
 import os
 
+# 외부 의존성(DB/Firebase/Redis) 준비 상태
+readiness = Readiness(default_checks())
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """ 애플리케이션 시작/종료 시 외부 의존성 워밍업 및 백그라운드 태스크 관리 """
+    # DB 커넥션/Firebase 인증서/Redis 워밍업을 병렬로 실행 (완료 전에도 요청은 받고, /ready는 완료 후 200)
+    warm_up = asyncio.create_task(readiness.warm_up())
+    # Google 서명 인증서 주기적 갱신
+    cert_refresher = asyncio.create_task(refresh_firebase_certificates_forever())
+    # 만료/폐기된 refresh token 주기적 정리
+    token_sweeper = asyncio.create_task(sweep_refresh_tokens_forever())
+    # 다른 워커의 access token 폐기(로그아웃/정지/삭제) 수신
+    revocation_sync = asyncio.create_task(token_revocation.sync_forever())
+    # 체크아웃마다 ping하는 대신 주기적으로 DB 연결 확인
+    db_health = asyncio.create_task(monitor_database_forever())
+    tasks = [warm_up, cert_refresher, token_sweeper, revocation_sync, db_health]
+    # 근처 검색용 공간 인덱스 적재 및 증분 갱신
+    if settings.SPATIAL_INDEX_ENABLED:
+        tasks.append(asyncio.create_task(refresh_spatial_index_forever()))
+    # 보존 기간이 지난 삭제 행 보관
+    if settings.ARCHIVE_ENABLED:
+        tasks.append(asyncio.create_task(archive_deleted_rows_forever()))
+    # 읽기 replica 지연 확인 (지연이 큰 replica는 읽기 라우팅에서 제외)
+    session_router = get_session_router()
+    if session_router.replicas:
+        tasks.append(asyncio.create_task(session_router.monitor_forever()))
+    yield
+    for task in tasks:
+        task.cancel()
+    # 취소된 태스크가 실제로 끝난 뒤에 엔진/Redis를 닫음 (정리 중인 태스크가 닫힌 연결을 쓰지 않도록)
+    await asyncio.gather(*tasks, return_exceptions=True)
+    await close_database()
+    await close_redis()
+
 # FastAPI 애플리케이션 초기화
 app = FastAPI(
     title=settings.APP_NAME,
     version=settings.APP_VERSION,
     description="Doggy Backend API with Firebase Authentication & JWT",
+    lifespan=lifespan,
 )
 
 # ✅ 미들웨어 등록
-app.add_middleware(LoggingMiddleware)
+# 압축은 가장 안쪽에 등록 (바깥 미들웨어는 압축 전 상태 코드/헤더를 그대로 보고, 압축은 라우트 응답에만 적용)
+if settings.COMPRESSION_ENABLED:
+    app.add_middleware(CompressionMiddleware)
+# Rate Limit은 사용자 기준 제한을 위해 AuthMiddleware 안쪽에 등록
+if settings.RATE_LIMIT_ENABLED:
+    app.add_middleware(RateLimitMiddleware)
 app.add_middleware(AuthMiddleware)
+# 인증 실패(401)/요청 제한(429) 응답도 기록되고 X-Request-ID가 붙도록 Auth/RateLimit 바깥쪽에 등록
+app.add_middleware(LoggingMiddleware)
+# 인증 실패(401)도 집계되도록 AuthMiddleware 바깥쪽에 등록
+if settings.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
 
 
 # ✅ CORS 설정 추가 (Next.js 개발 환경 허용)
@@ -32,13 +102,28 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# 데이터베이스 연결 확인 (별도 engine 생성 없이 database.py의 engine 사용)
-try:
-    conn = engine.connect()
-    print("데이터베이스 연결 성공!")
-    conn.close()
-except Exception as e:
-    print("데이터베이스 연결 실패:", e)
+# 준비 상태 확인 엔드포인트 (로드밸런서/오케스트레이터 readiness probe)
+@app.get("/ready", include_in_schema=False)
+async def ready():
+    """ 워밍업이 끝나고 DB/Firebase/Redis가 모두 응답하면 200, 아니면 503 """
+    is_ready, checks = await readiness.check()
+    return JSONResponse(
+        status_code=200 if is_ready else 503,
+        content={"status": "ready" if is_ready else "not_ready", "checks": checks},
+    )
+
+_EMPTY_JWKS = b'{"keys":[]}'
+
+# access token 검증용 공개 키 (다른 서비스가 캐싱하여 /me 호출 없이 로컬 검증)
+@app.get("/.well-known/jwks.json", include_in_schema=False)
+async def jwks():
+    """ 서명 키의 공개 키 목록 (HS256만 사용 중이면 빈 목록) """
+    key_set = get_key_set()
+    return Response(
+        content=key_set.jwks_json if key_set else _EMPTY_JWKS,
+        media_type="application/json",
+        headers={"Cache-Control": f"public, max-age={settings.JWKS_CACHE_SECONDS}"},
+    )
 
 # 환경변수 확인용 엔드포인트
 @app.get("/config-check")
@@ -52,8 +137,17 @@ def check_config():
         "JWT_SECRET_KEY": settings.JWT_SECRET_KEY[:10] + "****"
     }
 
+# Prometheus 메트릭 엔드포인트 (접근 제어는 AuthMiddleware - METRICS_TOKEN / METRICS_ALLOWED_IPS)
+if settings.METRICS_ENABLED:
+    @app.get("/metrics", include_in_schema=False)
+    async def metrics():
+        """ Prometheus text format으로 메트릭 출력 """
+        return PlainTextResponse(REGISTRY.render(), media_type="text/plain; version=0.0.4")
+
 # ✅ 인증 관련 API 추가 (기존 main.py 변경 없이)
 app.include_router(auth_router, prefix="/api/v1/auth", tags=["Authentication"])
+app.include_router(kindergarten_router, prefix="/api/v1/kindergartens", tags=["Kindergarten"])
+app.include_router(admin_router, prefix="/api/v1/admin", tags=["Admin"])
 
 # 기본 라우트
 @app.get("/")
@@ -1,41 +1,86 @@
-from fastapi import Request, HTTPException
-from starlette.middleware.base import BaseHTTPMiddleware
-from app.utils.security import verify_jwt_token
-
-class AuthMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-        """ JWT 인증 미들웨어 """
-        
-        is_development = False
-        
-        # 인증 없이 접근 허용할 경로들을 화이트리스트로 지정합니다.
-        whitelist = [
-            "/api/v1/auth/login",  # 로그인 엔드포인트
-            "/api/v1/auth/logout",  # 로그아웃 엔드포인트 추가
-            "/docs",               # Swagger UI
-            "/openapi.json",       # OpenAPI 스펙
-            "/favicon.ico",        # 파비콘
-        ]
-        
-        if is_development:
-            whitelist.extend([
-                "/api/v1/",
-            ])
-        
+from fastapi import HTTPException
+from fastapi.responses import JSONResponse
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Receive, Scope, Send
+from app.utils.revocation import token_revocation
+from app.utils.security import is_metrics_client, verify_jwt_token
+
+# 인증 없이 접근 허용할 경로들을 화이트리스트로 지정합니다.
+AUTH_WHITELIST = (
+    "/api/v1/auth/login",  # 로그인 엔드포인트
+    "/api/v1/auth/logout",  # 로그아웃 엔드포인트 추가
+    "/docs",               # Swagger UI
+    "/openapi.json",       # OpenAPI 스펙
+    "/favicon.ico",        # 파비콘
+    "/ready",              # 준비 상태 확인 (readiness probe)
+    "/.well-known/",       # JWKS (access token 검증용 공개 키)
+)
+
+# 사용자 JWT 대신 수집기 인증(METRICS_TOKEN / METRICS_ALLOWED_IPS)으로 보호하는 경로
+METRICS_PATH = "/metrics"
+
+# 개발 환경에서 추가로 허용할 경로
+DEVELOPMENT_WHITELIST = (
+    "/api/v1/",
+)
+
+class AuthMiddleware:
+    """ JWT 인증 미들웨어 (순수 ASGI 구현) """
+
+    def __init__(self, app: ASGIApp, is_development: bool = False):
+        self.app = app
+        # 요청마다 리스트를 만들지 않도록 prefix 튜플을 미리 구성 (str.startswith는 튜플을 한 번에 비교)
+        whitelist = AUTH_WHITELIST + (DEVELOPMENT_WHITELIST if is_development else ())
+        self.whitelist = tuple(sorted(set(whitelist)))
+
+    def is_whitelisted(self, path: str) -> bool:
+        return path.startswith(self.whitelist)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # Prometheus 메트릭은 수집기 토큰 또는 허용된 네트워크에서만 접근
+        if scope["path"] == METRICS_PATH:
+            client = scope.get("client")
+            if is_metrics_client(client[0] if client else None, Headers(scope=scope).get("Authorization")):
+                await self.app(scope, receive, send)
+            else:
+                await self._unauthorized(scope, receive, send, "Unauthorized: Metrics access denied")
+            return
+
         # 현재 요청 경로가 whitelist에 해당하면 토큰 검사를 건너뜁니다.
-        if any(request.url.path.startswith(path) for path in whitelist):
-            return await call_next(request)
-        
-        auth_header = request.headers.get("Authorization")
+        if self.is_whitelisted(scope["path"]):
+            await self.app(scope, receive, send)
+            return
+
+        auth_header = Headers(scope=scope).get("Authorization")
         if not auth_header or not auth_header.startswith("Bearer "):
-            raise HTTPException(status_code=401, detail="Unauthorized: Missing token")
+            await self._unauthorized(scope, receive, send, "Unauthorized: Missing token")
+            return
 
         token = auth_header.split("Bearer ")[1]
-        user_payload = verify_jwt_token(token)
+        try:
+            user_payload = verify_jwt_token(token)
+        except HTTPException as e:
+            await self._unauthorized(scope, receive, send, e.detail)
+            return
 
         if not user_payload:
-            raise HTTPException(status_code=401, detail="Unauthorized: Invalid token")
+            await self._unauthorized(scope, receive, send, "Unauthorized: Invalid token")
+            return
+
+        # 로그아웃/정지/삭제로 폐기된 토큰 (프로세스 내 폐기 목록 조회, DB 접근 없음)
+        if token_revocation.is_revoked(user_payload):
+            await self._unauthorized(scope, receive, send, "Token has been revoked")
+            return
+
+        scope.setdefault("state", {})["user"] = {"uid": user_payload["uid"], "role": user_payload["role"]}
+        await self.app(scope, receive, send)
 
-        request.state.user = {"uid": user_payload["uid"], "role": user_payload["role"]}
-        response = await call_next(request)
-        return response
+    @staticmethod
+    async def _unauthorized(scope: Scope, receive: Receive, send: Send, detail: str):
+        """ 401 응답 전송 (HTTPException 기본 핸들러와 같은 형식) """
+        response = JSONResponse(status_code=401, content={"detail": detail})
+        await response(scope, receive, send)
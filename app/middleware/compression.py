@@ -0,0 +1,226 @@
+import json
+import zlib
+from dataclasses import dataclass, field
+from typing import Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.utils.config import settings
+
+# 서버 선호 순서 (같은 q 값이면 앞쪽을 선택)
+ENCODINGS = ("gzip", "deflate")
+
+# 압축 대상 Content-Type (이미지/압축 파일 등은 다시 압축해도 작아지지 않음)
+COMPRESSIBLE_TYPES = (
+    "application/json",
+    "application/x-ndjson",
+    "application/javascript",
+    "application/xml",
+    "image/svg+xml",
+    "text/",
+)
+
+# 미리 압축해 두는 응답은 한 번만 압축하므로 최대 압축률 사용
+CACHED_LEVEL = 9
+
+
+def negotiate_encoding(accept_encoding: str) -> Optional[str]:
+    """ Accept-Encoding에서 지원하는 인코딩 중 q 값이 가장 높은 것 (없으면 None = 압축 안 함) """
+    if not accept_encoding:
+        return None
+    qualities = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.partition(";")
+        name = name.strip().lower()
+        quality = 1.0
+        for param in params.split(";"):
+            key, _, value = param.partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if name:
+            qualities[name] = quality
+    wildcard = qualities.get("*", 0.0)
+    best, best_quality = None, 0.0
+    for encoding in ENCODINGS:
+        quality = qualities.get(encoding, wildcard)
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+def compressor(encoding: str, level: int):
+    """ zlib 압축기 (gzip: gzip 헤더, deflate: zlib 형식 - RFC 9110) """
+    wbits = zlib.MAX_WBITS | 16 if encoding == "gzip" else zlib.MAX_WBITS
+    return zlib.compressobj(level, zlib.DEFLATED, wbits)
+
+
+def compress(body: bytes, encoding: str, level: int) -> bytes:
+    obj = compressor(encoding, level)
+    return obj.compress(body) + obj.flush()
+
+
+def is_compressible(headers: Headers, status: int) -> bool:
+    """ 압축 대상 응답인지 (본문이 있고, 인코딩 전이고, no-transform이 아닌 텍스트 계열) """
+    if status < 200 or status in (204, 304):
+        return False
+    if "content-encoding" in headers:
+        return False
+    if "no-transform" in headers.get("cache-control", "").lower():
+        return False
+    content_type = headers.get("content-type", "").lower()
+    return content_type.startswith(COMPRESSIBLE_TYPES)
+
+
+def _set_encoded_headers(headers: MutableHeaders, encoding: str, length: Optional[int]):
+    headers["Content-Encoding"] = encoding
+    if length is None:
+        del headers["Content-Length"]
+    else:
+        headers["Content-Length"] = str(length)
+    headers.add_vary_header("Accept-Encoding")
+    # 본문 바이트가 달라지므로 strong ETag는 weak로 변환
+    etag = headers.get("etag")
+    if etag and not etag.startswith("W/"):
+        headers["ETag"] = f"W/{etag}"
+
+
+class _CompressionResponder:
+    """ 응답 하나의 압축 상태 (첫 본문 메시지를 보고 압축 여부 결정) """
+
+    def __init__(self, send: Send, encoding: str, level: int, min_size: int):
+        self.send = send
+        self.encoding = encoding
+        self.level = level
+        self.min_size = min_size
+        self.start: Optional[Message] = None
+        self.compressor = None
+        self.passthrough = False
+
+    async def __call__(self, message: Message):
+        if message["type"] == "http.response.start":
+            self.start = message
+            return
+        if message["type"] != "http.response.body" or self.passthrough:
+            await self.send(message)
+            return
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self.compressor is None:
+            headers = MutableHeaders(scope=self.start)
+            compressible = is_compressible(headers, self.start["status"])
+            if not compressible or (not more_body and len(body) < self.min_size):
+                self.passthrough = True
+                await self.send(self.start)
+                await self.send(message)
+                return
+            self.compressor = compressor(self.encoding, self.level)
+            if not more_body:
+                # 단일 본문 - 한 번에 압축하고 Content-Length 갱신
+                compressed = self.compressor.compress(body) + self.compressor.flush()
+                _set_encoded_headers(headers, self.encoding, len(compressed))
+                await self.send(self.start)
+                await self.send({"type": "http.response.body", "body": compressed})
+                return
+            # 스트리밍 응답 - 전체 길이를 모르므로 Content-Length 제거
+            _set_encoded_headers(headers, self.encoding, None)
+            await self.send(self.start)
+
+        if more_body:
+            if not body:
+                return
+            # 청크마다 sync flush하여 NDJSON 행이 압축 버퍼에 머물지 않고 바로 전달되도록
+            chunk = self.compressor.compress(body) + self.compressor.flush(zlib.Z_SYNC_FLUSH)
+            await self.send({"type": "http.response.body", "body": chunk, "more_body": True})
+        else:
+            chunk = self.compressor.compress(body) + self.compressor.flush()
+            await self.send({"type": "http.response.body", "body": chunk})
+
+
+@dataclass
+class _CachedResponse:
+    """ 미리 압축해 둔 고정 응답 (인코딩별 본문은 처음 요청될 때 한 번만 압축) """
+    status: int
+    headers: list[tuple[bytes, bytes]]
+    body: bytes
+    encoded: dict[str, bytes] = field(default_factory=dict)
+
+    def body_for(self, encoding: str) -> bytes:
+        if encoding not in self.encoded:
+            self.encoded[encoding] = compress(self.body, encoding, CACHED_LEVEL)
+        return self.encoded[encoding]
+
+
+class CompressionMiddleware:
+    """ ✅ 응답 압축 미들웨어 (순수 ASGI 구현)
+
+    - Accept-Encoding(q 값 포함)으로 gzip / deflate 중 하나를 선택
+    - min_size 바이트 미만의 단일 본문, 텍스트 계열이 아닌 응답, 이미 인코딩된 응답은 그대로 전달
+    - 응답에 Cache-Control: no-transform이 있으면 압축하지 않음 (라우트별 opt-out)
+    - 스트리밍 응답(NDJSON/CSV 내보내기)은 청크마다 sync flush하여 행 단위 전달을 유지
+    - cached_paths의 GET 응답은 처음 한 번 만든 본문과 인코딩별 압축 결과를 재사용
+      (/openapi.json처럼 프로세스 안에서 바뀌지 않고 사용자와 무관한 응답만 등록)
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        min_size: int = settings.COMPRESSION_MIN_SIZE,
+        level: int = settings.COMPRESSION_LEVEL,
+        cached_paths: Optional[tuple[str, ...]] = None,
+    ):
+        self.app = app
+        self.min_size = min_size
+        self.level = level
+        if cached_paths is None:
+            cached_paths = json.loads(settings.COMPRESSION_CACHED_PATHS or "[]")
+        self.cached_paths = frozenset(cached_paths)
+        self._cache: dict[str, _CachedResponse] = {}
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if scope["path"] in self.cached_paths and scope["method"] == "GET":
+            await self._send_cached(scope, receive, send, encoding)
+            return
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        await self.app(scope, receive, _CompressionResponder(send, encoding, self.level, self.min_size))
+
+    async def _send_cached(self, scope: Scope, receive: Receive, send: Send, encoding: Optional[str]):
+        cached = self._cache.get(scope["path"])
+        if cached is None:
+            messages = []
+
+            async def capture(message: Message):
+                messages.append(message)
+
+            await self.app(scope, receive, capture)
+            start = messages[0]
+            body = b"".join(m.get("body", b"") for m in messages[1:] if m["type"] == "http.response.body")
+            if start["status"] != 200 or not is_compressible(Headers(raw=start["headers"]), 200):
+                # 캐싱 대상이 아닌 응답(오류 등)은 받은 그대로 전달
+                for message in messages:
+                    await send(message)
+                return
+            cached = self._cache[scope["path"]] = _CachedResponse(start["status"], list(start["headers"]), body)
+
+        start = {"type": "http.response.start", "status": cached.status, "headers": list(cached.headers)}
+        headers = MutableHeaders(scope=start)
+        body = cached.body
+        if len(body) >= self.min_size:
+            if encoding is None:
+                headers.add_vary_header("Accept-Encoding")
+            else:
+                body = cached.body_for(encoding)
+                _set_encoded_headers(headers, encoding, len(body))
+        await send(start)
+        await send({"type": "http.response.body", "body": body})
@@ -1,20 +1,73 @@
+import random
 import time
 import logging
-from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware
+import uuid
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from app.utils.config import settings
+from app.utils.logging_config import DBTimer, db_timer_var, request_id_var
 
-# 로깅 설정
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-class LoggingMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-        start_time = time.time()
-        response = await call_next(request)
-        process_time = time.time() - start_time
-
-        logger.info(
-            f"📌 [Request] {request.method} {request.url.path} "
-            f"Status: {response.status_code} Time: {process_time:.2f}s"
-        )
-        return response
+class LoggingMiddleware:
+    """ 요청 로깅 미들웨어 (순수 ASGI 구현)
+
+    요청 ID(X-Request-ID)를 부여하고, 요청마다 경로/상태/지연 시간/DB 시간을
+    구조화된 필드로 기록합니다. 성공 요청은 sample_rate 비율만 기록하고
+    오류(4xx/5xx)와 느린 요청은 항상 기록합니다.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        sample_rate: float = settings.LOG_SAMPLE_RATE,
+        slow_request_ms: float = settings.LOG_SLOW_REQUEST_MS,
+    ):
+        self.app = app
+        self.sample_rate = sample_rate
+        self.slow_request_ms = slow_request_ms
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = Headers(scope=scope).get("x-request-id", "")[:128] or uuid.uuid4().hex
+        request_id_token = request_id_var.set(request_id)
+        timer = DBTimer()
+        timer_token = db_timer_var.set(timer)
+        start_time = time.perf_counter()
+        status_code = 500
+
+        async def send_wrapper(message: Message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                MutableHeaders(scope=message).append("X-Request-ID", request_id)
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            latency_ms = (time.perf_counter() - start_time) * 1000
+            if (
+                status_code >= 400
+                or latency_ms >= self.slow_request_ms
+                or random.random() < self.sample_rate
+            ):
+                route = scope.get("route")
+                logger.info(
+                    "📌 [Request]",
+                    extra={
+                        "request_id": request_id,
+                        "method": scope["method"],
+                        "route": getattr(route, "path", None),
+                        "path": scope["path"],
+                        "status": status_code,
+                        "latency_ms": round(latency_ms, 3),
+                        "db_ms": round(timer.seconds * 1000, 3),
+                        "db_queries": timer.queries,
+                    },
+                )
+            request_id_var.reset(request_id_token)
+            db_timer_var.reset(timer_token)
@@ -0,0 +1,42 @@
+import time
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from app.utils.metrics import HTTP_REQUEST_DURATION, HTTP_REQUESTS_IN_FLIGHT
+
+# 메서드 레이블로 사용할 값 (그 외 임의의 메서드는 "other"로 묶어 레이블 수를 고정)
+KNOWN_METHODS = frozenset({"GET", "POST", "PUT", "PATCH", "DELETE", "HEAD", "OPTIONS"})
+
+class MetricsMiddleware:
+    """ 요청 지연 시간 히스토그램과 처리 중 요청 수를 기록하는 미들웨어 (순수 ASGI 구현)
+
+    라우트 레이블은 경로 템플릿(/items/{item_id})을 사용하여 레이블 수가 늘어나지 않도록 하고,
+    매칭되는 라우트가 없으면 "unmatched"로 기록합니다.
+    메서드도 클라이언트가 임의로 보낼 수 있으므로 KNOWN_METHODS 외에는 "other"로 기록합니다.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        HTTP_REQUESTS_IN_FLIGHT.inc()
+        start_time = time.perf_counter()
+        status_code = 500
+
+        async def send_wrapper(message: Message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            HTTP_REQUESTS_IN_FLIGHT.dec()
+            route = scope.get("route")
+            method = scope["method"] if scope["method"] in KNOWN_METHODS else "other"
+            HTTP_REQUEST_DURATION.labels(
+                method, getattr(route, "path", "unmatched"), str(status_code)
+            ).observe(time.perf_counter() - start_time)
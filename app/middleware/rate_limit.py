@@ -1,25 +1,207 @@
-from fastapi import Request, HTTPException
-from starlette.middleware.base import BaseHTTPMiddleware
-import aioredis
+import json
+import logging
+import math
+import time
+from dataclasses import dataclass
+from typing import Optional
 
-redis = None
+from fastapi.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
 
-async def init_redis():
-    global redis
-    redis = await aioredis.from_url("redis://localhost", encoding="utf-8", decode_responses=True)
+from app.utils.cache import ExpiringCache
+from app.utils.config import settings
+from app.utils.redis_client import get_redis
 
-class RateLimitMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-        client_ip = request.client.host
-        key = f"rate_limit:{client_ip}"
+logger = logging.getLogger(__name__)
 
-        # Redis에서 현재 요청 횟수 조회
-        count = await redis.get(key)
-        count = int(count) if count else 0
+# ✅ 토큰 버킷을 원자적으로 갱신하는 Lua 스크립트 (요청당 Redis 왕복 1회)
+# KEYS[1]: 버킷 키 / ARGV: capacity, refill_rate(초당 토큰), requested
+# 반환값: 실제로 지급된 토큰 수 (0이면 제한 초과)
+TOKEN_BUCKET_SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local requested = tonumber(ARGV[3])
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or capacity
+local ts = tonumber(state[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+local granted = math.min(requested, math.floor(tokens))
+tokens = tokens - granted
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('PEXPIRE', KEYS[1], math.ceil(capacity / rate * 1000))
+return granted
+"""
 
-        if count >= 10:  # 10초 동안 10개 요청 제한
-            raise HTTPException(status_code=429, detail="Too many requests")
 
-        await redis.setex(key, 10, count + 1)  # 10초 TTL 설정
-        response = await call_next(request)
-        return response
+@dataclass(frozen=True)
+class RateLimitPolicy:
+    """ 요청 제한 정책 (period초 동안 limit개) """
+    limit: int
+    period: float
+
+    @classmethod
+    def parse(cls, value: str) -> "RateLimitPolicy":
+        """ "10/10" 형식의 문자열을 정책으로 변환 """
+        limit, period = value.split("/")
+        return cls(limit=int(limit), period=float(period))
+
+    @property
+    def refill_rate(self) -> float:
+        return self.limit / self.period
+
+
+class InMemoryTokenBucketBackend:
+    """ 프로세스 내 토큰 버킷 백엔드
+
+    Redis 스크립트와 같은 알고리즘을 사용하며, 테스트용 Redis 대체재이자
+    Redis 장애 시 프로세스 단위 제한으로 동작하는 폴백으로 사용합니다.
+    """
+
+    def __init__(self, clock=time.monotonic):
+        self._clock = clock
+        self._buckets: dict[str, tuple[float, float]] = {}
+
+    async def acquire(self, key: str, policy: RateLimitPolicy, requested: int) -> int:
+        now = self._clock()
+        tokens, ts = self._buckets.get(key, (float(policy.limit), now))
+        tokens = min(policy.limit, tokens + max(0.0, now - ts) * policy.refill_rate)
+        granted = min(requested, math.floor(tokens))
+        self._buckets[key] = (tokens - granted, now)
+        return granted
+
+
+class RedisTokenBucketBackend:
+    """ Redis Lua 스크립트 기반 토큰 버킷 백엔드 (여러 워커가 같은 버킷 공유) """
+
+    def __init__(self, redis=None):
+        self._redis = redis
+        self._script = None
+
+    async def acquire(self, key: str, policy: RateLimitPolicy, requested: int) -> int:
+        if self._script is None:
+            redis = self._redis or get_redis()
+            self._script = redis.register_script(TOKEN_BUCKET_SCRIPT)
+        granted = await self._script(keys=[key], args=[policy.limit, policy.refill_rate, requested])
+        return int(granted)
+
+
+@dataclass
+class _Lease:
+    """ Redis에서 미리 받아둔 토큰 (denied이면 다음 토큰이 생길 때까지 거부) """
+    tokens: int
+    denied: bool = False
+
+
+class RateLimiter:
+    """ ✅ 로컬 토큰 버킷 + Redis 동기화 요청 제한기
+
+    Redis에서 토큰을 batch개씩 받아두고(lease) 로컬에서 차감하므로
+    대부분의 요청은 Redis 왕복 없이 처리됩니다. 토큰을 받지 못하면
+    다음 토큰이 생길 때까지 거부 결과를 로컬에 캐싱합니다.
+    Redis 호출이 실패하면 일정 시간 동안 프로세스 내 버킷으로 대체합니다.
+    """
+
+    def __init__(
+        self,
+        backend,
+        batch: int = 1,
+        fallback: Optional[InMemoryTokenBucketBackend] = None,
+        max_keys: int = 100_000,
+        retry_after_failure: float = 5.0,
+        clock=time.monotonic,
+    ):
+        self.backend = backend
+        self.batch = max(1, batch)
+        self.fallback = fallback or InMemoryTokenBucketBackend(clock=clock)
+        self.retry_after_failure = retry_after_failure
+        self._clock = clock
+        self._leases = ExpiringCache(maxsize=max_keys, clock=clock)
+        self._backend_down_until = 0.0
+        self.backend_calls = 0
+
+    async def allow(self, key: str, policy: RateLimitPolicy) -> bool:
+        lease = self._leases.get(key)
+        if lease is not None:
+            if lease.denied:
+                return False
+            if lease.tokens > 0:
+                lease.tokens -= 1
+                return True
+
+        requested = min(self.batch, policy.limit)
+        granted = await self._acquire(key, policy, requested)
+        now = self._clock()
+        if granted <= 0:
+            # 토큰 1개가 다시 채워질 때까지 로컬에서 거부
+            self._leases.set(key, _Lease(tokens=0, denied=True), now + 1 / policy.refill_rate)
+            return False
+        # 받아둔 토큰은 그 토큰들이 다시 채워지는 시간 동안만 로컬에서 사용
+        self._leases.set(key, _Lease(tokens=granted - 1), now + granted / policy.refill_rate)
+        return True
+
+    async def _acquire(self, key: str, policy: RateLimitPolicy, requested: int) -> int:
+        if self._clock() >= self._backend_down_until:
+            try:
+                self.backend_calls += 1
+                return await self.backend.acquire(key, policy, requested)
+            except Exception as e:
+                self._backend_down_until = self._clock() + self.retry_after_failure
+                logger.warning("Rate limit 백엔드 호출 실패, 로컬 버킷으로 대체합니다: %s", e)
+        return await self.fallback.acquire(key, policy, requested)
+
+
+class RateLimitMiddleware:
+    """ 요청 제한 미들웨어 (순수 ASGI 구현)
+
+    인증된 요청은 사용자(uid) 기준, 그 외에는 IP 기준으로 제한하며
+    경로 prefix별 정책(RATE_LIMIT_ROUTES)이 있으면 그 정책을 우선 적용합니다.
+    request.state.user를 사용하므로 AuthMiddleware 안쪽에 등록해야 합니다.
+    """
+
+    def __init__(self, app: ASGIApp, limiter: Optional[RateLimiter] = None):
+        self.app = app
+        self.limiter = limiter or RateLimiter(
+            RedisTokenBucketBackend(), batch=settings.RATE_LIMIT_LOCAL_BATCH
+        )
+        self.default_policy = RateLimitPolicy.parse(settings.RATE_LIMIT_DEFAULT)
+        self.user_policy = RateLimitPolicy.parse(settings.RATE_LIMIT_USER)
+        routes = {
+            prefix: RateLimitPolicy.parse(value)
+            for prefix, value in json.loads(settings.RATE_LIMIT_ROUTES or "{}").items()
+        }
+        # 긴 prefix부터 비교하여 가장 구체적인 경로 정책을 적용
+        self.route_policies = sorted(routes.items(), key=lambda item: len(item[0]), reverse=True)
+
+    def resolve(self, scope: Scope) -> tuple[str, RateLimitPolicy]:
+        """ 요청에 적용할 버킷 키와 정책 결정 """
+        user = scope.get("state", {}).get("user")
+        if user:
+            subject, policy = f"user:{user['uid']}", self.user_policy
+        else:
+            client_ip = scope["client"][0] if scope.get("client") else "unknown"
+            subject, policy = f"ip:{client_ip}", self.default_policy
+
+        path = scope["path"]
+        for prefix, route_policy in self.route_policies:
+            if path.startswith(prefix):
+                return f"rate_limit:{prefix}:{subject}", route_policy
+        return f"rate_limit:{subject}", policy
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        key, policy = self.resolve(scope)
+        if not await self.limiter.allow(key, policy):
+            response = JSONResponse(
+                status_code=429,
+                content={"detail": "Too many requests"},
+                headers={"Retry-After": str(math.ceil(1 / policy.refill_rate))},
+            )
+            await response(scope, receive, send)
+            return
+
+        await self.app(scope, receive, send)
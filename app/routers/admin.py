@@ -0,0 +1,78 @@
+import uuid
+from datetime import datetime
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
+
+from app.services.export_service import (
+    MEDIA_TYPES,
+    UserFilter,
+    build_kindergarten_export_query,
+    build_user_export_query,
+    stream_export,
+)
+from app.services.kindergarten_service import KindergartenFilter
+from app.utils.security import ADMIN_ROLES, require_roles
+
+router = APIRouter(dependencies=[Depends(require_roles(*ADMIN_ROLES))])
+
+FORMAT_QUERY = Query("ndjson", pattern="^(ndjson|csv)$", description="ndjson 또는 csv")
+
+
+def _export_response(query, format: str, name: str) -> StreamingResponse:
+    """ 내보내기 스트리밍 응답 (파일 다운로드) """
+    filename = f"{name}-{datetime.utcnow():%Y%m%d%H%M%S}.{format}"
+    return StreamingResponse(
+        stream_export(query, format),
+        media_type=MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+@router.get("/export/users")
+async def export_users(
+    format: str = FORMAT_QUERY,
+    role: Optional[str] = None,
+    is_active: Optional[bool] = None,
+    is_suspended: Optional[bool] = None,
+    is_deleted: Optional[bool] = None,
+    created_from: Optional[datetime] = Query(None, description="가입 일시 시작 (포함)"),
+    created_to: Optional[datetime] = Query(None, description="가입 일시 끝 (미포함)"),
+):
+    """
+    ✅ 사용자 내보내기 API (관리자 전용)
+    NDJSON 또는 CSV로 가입순 전체 사용자를 스트리밍합니다.
+    """
+    filters = UserFilter(
+        role=role,
+        is_active=is_active,
+        is_suspended=is_suspended,
+        is_deleted=is_deleted,
+        created_from=created_from,
+        created_to=created_to,
+    )
+    return _export_response(build_user_export_query(filters), format, "users")
+
+@router.get("/export/kindergartens")
+async def export_kindergartens(
+    format: str = FORMAT_QUERY,
+    owner_id: Optional[uuid.UUID] = None,
+    type: Optional[str] = None,
+    certificate_status: Optional[str] = None,
+    is_active: Optional[bool] = None,
+    is_suspended: Optional[bool] = None,
+    is_deleted: Optional[bool] = None,
+):
+    """
+    ✅ 유치원 내보내기 API (관리자 전용)
+    NDJSON 또는 CSV로 등록순 유치원을 스트리밍합니다 (삭제된 유치원 포함, is_deleted로 필터).
+    """
+    filters = KindergartenFilter(
+        owner_id=owner_id,
+        type=type,
+        certificate_status=certificate_status,
+        is_active=is_active,
+        is_suspended=is_suspended,
+        is_deleted=is_deleted,
+    )
+    return _export_response(build_kindergarten_export_query(filters), format, "kindergartens")
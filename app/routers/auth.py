@@ -1,69 +1,52 @@
+import logging
 from fastapi import APIRouter, Depends, HTTPException, Response, Request
-from sqlalchemy.orm import Session
-from datetime import datetime, timedelta, timezone
-import uuid
-from app.utils.security import verify_firebase_token, create_jwt_token, create_refresh_token
-from app.db.database import get_db
-from app.db.models.user import User
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.utils.security import token_digest, verify_jwt_token
+from app.utils.revocation import token_revocation
+from app.utils.conditional import ConditionalGet, make_etag
+from app.db.database import get_async_db
 from app.db.models.refresh_tokens import RefreshToken
 from pydantic import BaseModel
-from app.utils.response_utils import success_response, error_response
-from app.utils.security import verify_jwt_token
+from app.utils.response_utils import success_response, prebuilt_response
+from app.utils.security import get_current_user
+from app.services.auth_service import InactiveUserError, login_with_firebase_token, refresh_access_token
+from app.services.user_service import get_user_profile_by_uid
 
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter()
 class LoginRequest(BaseModel):
     firebase_token: str  # Next.js가 전달하는 Firebase ID Token
     
     
+# 고정 응답은 본문을 미리 인코딩해두고 재사용
+_status_response = prebuilt_response(data={"status": "running"}, msg="Server is running")
+_error_test_response = prebuilt_response(data=None, msg="This is a test error", code=400)
+
 @router.get("/status")
 async def check_status():
     """✅ 서버 상태 체크 API"""
-    return success_response(data={"status": "running"}, msg="Server is running")
+    return _status_response()
 
 @router.get("/error_test")
 async def error_test():
     """❌ 강제 에러 테스트 API"""
-    return error_response(400, "This is a test error")
+    return _error_test_response()
 
 @router.post("/login")
-async def login(request: LoginRequest, db: Session = Depends(get_db)) -> Response:
+async def login(request: LoginRequest) -> Response:
     """
     ✅ Firebase 로그인 및 Refresh Token 저장 후,
        Refresh Token을 httpOnly 쿠키에 설정하는 엔드포인트
+    같은 Firebase 토큰으로 동시에 들어온 로그인은 한 번만 처리되어 같은 토큰 쌍을 받습니다.
     """
-    print(f'request: {request}')
-    
-    firebase_user = verify_firebase_token(request.firebase_token)
-    print(f'firebase_user: {firebase_user}')
-
-    uid = firebase_user["uid"]
-    email = firebase_user["email"]
-
-    user = db.query(User).filter(User.firebase_uid == uid).first()
-    
-    if not user:
-        user = User(firebase_uid=uid, email=email, role="user", created_at=datetime.utcnow())
-        db.add(user)
-        db.commit()
-        db.refresh(user)
-    # JWT Access Token 생성 (Next.js 클라이언트에 전달)
-    jwt_token = create_jwt_token(uid, user.role)
-    
-    # Refresh Token 생성 (httpOnly 쿠키에 저장)
-    refresh_token = create_refresh_token(uid)
-
-    db.query(RefreshToken).filter(RefreshToken.user_id == user.id).update({"revoked": True})
-    new_refresh_token = RefreshToken(
-        id=uuid.uuid4(),
-        user_id=user.id,
-        refresh_token=refresh_token,
-        expires_at=datetime.now(timezone.utc) + timedelta(days=7),
-        created_at=datetime.now(timezone.utc),
-        revoked=False
-    )
-    db.add(new_refresh_token)
-    db.commit()
+    # 사용자 upsert + 기존 토큰 폐기 + 새 토큰 저장을 한 트랜잭션으로 처리하고 JWT Access Token 생성
+    try:
+        jwt_token, refresh_token = await login_with_firebase_token(request.firebase_token)
+    except InactiveUserError:
+        raise HTTPException(status_code=403, detail="Forbidden: Account suspended or inactive")
     
     # JSON 응답에는 Access Token만 포함
     response = success_response(
@@ -83,80 +66,83 @@ async def login(request: LoginRequest, db: Session = Depends(get_db)) -> Respons
     return response
 
 @router.post("/refresh")
-async def refresh_token(request: Request, db: Session = Depends(get_db)):
+async def refresh_token(request: Request):
     """
     ✅ httpOnly 쿠키에 저장된 Refresh Token을 사용하여
        새로운 Access Token을 발급하는 엔드포인트
+    같은 Refresh Token으로 동시에 들어온 요청은 한 번의 조회 결과를 공유합니다.
     """
     
     # 쿠키에서 refresh token 읽기
     refresh_token = request.cookies.get("refresh_token")
     if not refresh_token:
         raise HTTPException(status_code=401, detail="Refresh token not provided")
-    
-    
-    token_entry = db.query(RefreshToken).filter(
-        RefreshToken.refresh_token == refresh_token,
-        RefreshToken.revoked == False,
-        RefreshToken.expires_at > datetime.now(timezone.utc)
-    ).first()
 
-    if not token_entry:
+    new_access_token = await refresh_access_token(refresh_token)
+    if not new_access_token:
         raise HTTPException(status_code=401, detail="Invalid or expired refresh token")
-
-    user = db.query(User).filter(User.id == token_entry.user_id).first()
-    new_access_token = create_jwt_token(user.firebase_uid, user.role)
     return success_response(
         data={"access_token": new_access_token},
         msg="Token refreshed 성공"
     )
 
 @router.post("/logout")
-async def logout(request: Request, db: Session = Depends(get_db)):
+async def logout(request: Request, db: AsyncSession = Depends(get_async_db)):
     """
-    ✅ Refresh Token 무효화 후,
+    ✅ Refresh Token 및 Access Token 무효화 후,
        클라이언트 쿠키에서 Refresh Token을 삭제하는 엔드포인트
     """
+    # 로그아웃은 화이트리스트 경로이므로 Authorization 헤더의 access token을 직접 확인하여 폐기
+    auth_header = request.headers.get("Authorization")
+    if auth_header and auth_header.startswith("Bearer "):
+        try:
+            payload = verify_jwt_token(auth_header.split("Bearer ")[1])
+        except HTTPException:
+            payload = None  # 이미 만료/무효인 토큰은 폐기할 필요 없음
+        if payload and payload.get("jti"):
+            await token_revocation.revoke_token(payload["jti"], payload["exp"])
+
     refresh_token = request.cookies.get("refresh_token")
     if refresh_token:
-        db.query(RefreshToken).filter(RefreshToken.refresh_token == refresh_token).update({"revoked": True})
-        db.commit()
+        await db.execute(
+            update(RefreshToken)
+            .where(RefreshToken.token_digest == token_digest(refresh_token))
+            .values(revoked=True)
+        )
+        await db.commit()
     response = success_response(data=None, msg="Logged out 성공")
     # 클라이언트 쿠키에서 refresh token 삭제
     response.delete_cookie("refresh_token")
     return response
 
 @router.get("/me")
-async def get_user_info(request: Request, db: Session = Depends(get_db)):
+async def get_user_info(
+    request: Request,
+    current_user: dict = Depends(get_current_user),
+    conditional: ConditionalGet = Depends(),
+):
     """
     현재 로그인한 사용자의 정보를 반환하는 엔드포인트.
     
     클라이언트는 Authorization 헤더에 Bearer 토큰을 포함하여 요청해야 합니다.
-    해당 토큰을 검증한 후, 데이터베이스에서 사용자 정보를 조회하여 반환합니다.
+    토큰은 AuthMiddleware에서 한 번만 검증되며, 검증된 payload(request.state.user)를 기준으로
+    사용자 프로필 캐시(미스 시 데이터베이스)에서 사용자 정보를 조회하여 반환합니다.
+    If-None-Match가 현재 버전(updated_at)과 같으면 응답을 만들지 않고 304를 반환합니다.
     """
-    print(f'request: {request}')
-    # Authorization 헤더에서 토큰 추출
-    auth_header = request.headers.get("Authorization")
-    if not auth_header or not auth_header.startswith("Bearer "):
-        raise HTTPException(status_code=401, detail="Unauthorized: Missing token")
-    
-    token = auth_header.split("Bearer ")[1]
-    
-    # JWT 토큰 검증 (유효하지 않거나 만료된 경우 HTTPException 발생)
-    payload = verify_jwt_token(token)
-    
-    # 데이터베이스에서 firebase_uid를 기준으로 사용자 조회
-    user = db.query(User).filter(User.firebase_uid == payload["uid"]).first()
+    # firebase_uid를 기준으로 사용자 조회 (캐시 우선)
+    user = await get_user_profile_by_uid(current_user["uid"])
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
     
-    # 반환할 사용자 정보를 구성 (민감한 정보는 제외)
-    user_info = {
-        "uid": user.firebase_uid,
-        "display_name": user.email,
-        "email": user.email,
-        "role": user.role,
-        "created_at": user.created_at.isoformat() if user.created_at else None,
-    }
-    print(f'user_info: {user_info}')
-    return success_response(data=user_info, msg="사용자 정보 조회 성공")
\ No newline at end of file
+    def build():
+        # 반환할 사용자 정보를 구성 (민감한 정보는 제외)
+        user_info = {
+            "uid": user["firebase_uid"],
+            "display_name": user["email"],
+            "email": user["email"],
+            "role": user["role"],
+            "created_at": user["created_at"],
+        }
+        return success_response(data=user_info, msg="사용자 정보 조회 성공")
+
+    return conditional.respond(make_etag("me", user["id"], user.get("updated_at")), build)
\ No newline at end of file
@@ -0,0 +1,117 @@
+import uuid
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.database import get_async_db, get_read_db
+from app.services.kindergarten_service import (
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    KindergartenFilter,
+    get_kindergarten,
+    list_kindergartens,
+)
+from app.services.import_service import IMPORT_FORMATS, import_kindergartens, iter_records
+from app.services.spatial_index import find_nearby_kindergartens
+from app.utils.conditional import ConditionalGet, make_etag
+from app.utils.config import settings
+from app.utils.response_utils import success_response
+from app.utils.security import ADMIN_ROLES, get_current_user, require_roles
+
+router = APIRouter()
+
+@router.get("")
+async def get_kindergartens(
+    owner_id: Optional[uuid.UUID] = None,
+    type: Optional[str] = None,
+    certificate_status: Optional[str] = None,
+    is_active: Optional[bool] = None,
+    is_suspended: Optional[bool] = None,
+    is_deleted: Optional[bool] = False,
+    name: Optional[str] = Query(None, description="이름 prefix 검색"),
+    address: Optional[str] = Query(None, description="주소 prefix 검색"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    db: AsyncSession = Depends(get_read_db),
+    user: dict = Depends(get_current_user),
+):
+    """
+    ✅ 유치원 목록 조회 API (keyset 페이지네이션)
+    최신 등록순으로 정렬하며, 응답의 next_cursor를 cursor로 넘기면 다음 페이지를 조회합니다.
+    삭제된 유치원/원장(owner_id) 조건과 사업자 번호/연락처는 관리자만 조회할 수 있습니다.
+    """
+    is_admin = user.get("role") in ADMIN_ROLES
+    if not is_admin and (owner_id is not None or is_deleted is not False):
+        raise HTTPException(status_code=403, detail="Forbidden: Insufficient role")
+    filters = KindergartenFilter(
+        owner_id=owner_id,
+        type=type,
+        certificate_status=certificate_status,
+        is_active=is_active,
+        is_suspended=is_suspended,
+        is_deleted=is_deleted,
+        name_prefix=name,
+        address_prefix=address,
+    )
+    try:
+        items, next_cursor = await list_kindergartens(db, filters, cursor, limit, include_private=is_admin)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return success_response(data={"items": items, "next_cursor": next_cursor}, msg="유치원 목록 조회 성공")
+
+@router.get("/nearby")
+async def get_nearby_kindergartens(
+    lat: float = Query(..., ge=-90, le=90, description="위도"),
+    lon: float = Query(..., ge=-180, le=180, description="경도"),
+    radius_m: Optional[float] = Query(None, gt=0, le=settings.NEARBY_MAX_RADIUS_M, description="검색 반경 (미터)"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    db: AsyncSession = Depends(get_read_db),
+):
+    """
+    ✅ 근처 유치원 검색 API
+    가까운 순으로 limit개를 반환하며, radius_m을 생략하면 최대 반경 안의 가장 가까운 limit개를 찾습니다.
+    """
+    items = await find_nearby_kindergartens(db, lat, lon, limit, radius_m)
+    return success_response(data={"items": items}, msg="근처 유치원 조회 성공")
+
+@router.post("/import")
+async def import_kindergartens_api(
+    request: Request,
+    format: Optional[str] = Query(None, description="csv 또는 ndjson (생략 시 Content-Type으로 판단)"),
+    db: AsyncSession = Depends(get_async_db),
+    user: dict = Depends(require_roles(*ADMIN_ROLES)),
+):
+    """
+    ✅ 유치원 일괄 등록 API (CSV / NDJSON 요청 본문 스트리밍)
+    business_number 기준으로 신규 등록 또는 기존 정보를 갱신하고, 행별 오류 목록을 반환합니다.
+    """
+    if format is None:
+        content_type = request.headers.get("content-type", "")
+        format = "ndjson" if "ndjson" in content_type or "jsonl" in content_type else "csv"
+    if format not in IMPORT_FORMATS:
+        raise HTTPException(status_code=400, detail="Unsupported format")
+    report = await import_kindergartens(db, iter_records(request.stream(), format))
+    return success_response(data=report.to_dict(), msg="유치원 일괄 등록 완료")
+
+@router.get("/{kindergarten_id}")
+async def get_kindergarten_detail(
+    kindergarten_id: uuid.UUID,
+    db: AsyncSession = Depends(get_read_db),
+    conditional: ConditionalGet = Depends(),
+    user: dict = Depends(get_current_user),
+):
+    """
+    ✅ 유치원 단건 조회 API (ETag / If-None-Match 지원)
+    관리자가 아니면 삭제된 유치원은 404이고, 사업자 번호/연락처는 제외합니다.
+    """
+    is_admin = user.get("role") in ADMIN_ROLES
+    kindergarten = await get_kindergarten(db, kindergarten_id, include_deleted=is_admin, include_private=is_admin)
+    if not kindergarten:
+        raise HTTPException(status_code=404, detail="Kindergarten not found")
+    # 관리자/일반 사용자 응답의 내용이 다르므로 태그도 구분
+    view = "admin" if is_admin else "public"
+    return conditional.respond(
+        make_etag("kindergarten", kindergarten_id, kindergarten["updated_at"].isoformat(), view),
+        lambda: success_response(data=kindergarten, msg="유치원 정보 조회 성공"),
+    )
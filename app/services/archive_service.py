@@ -0,0 +1,130 @@
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from sqlalchemy import Table, delete, exists, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.database import AsyncSessionLocal
+from app.db.models.archive import kindergartens_archive, users_archive
+from app.db.models.kindergarten import Kindergarten
+from app.db.models.user import User
+from app.utils.config import settings
+from app.utils.metrics import REGISTRY
+
+logger = logging.getLogger(__name__)
+
+ARCHIVED_ROWS = REGISTRY.counter(
+    "archived_rows_total", "Soft-deleted rows moved to archive tables", ("table",),
+)
+ARCHIVE_BATCH_DURATION = REGISTRY.histogram(
+    "archive_batch_seconds", "Time per archive batch (one transaction)", ("table",),
+)
+
+
+@dataclass
+class ArchiveReport:
+    """ 보관 작업 결과 (테이블별 이동 행 수, 배치별 (테이블, 행 수, 소요 시간 ms)) """
+    moved: dict[str, int] = field(default_factory=dict)
+    batches: list[tuple[str, int, float]] = field(default_factory=list)
+
+    def to_dict(self) -> dict:
+        return {
+            "moved": self.moved,
+            "batches": [{"table": table, "rows": rows, "ms": round(ms, 1)} for table, rows, ms in self.batches],
+        }
+
+
+def _archive_statement(source: Table, archive: Table, cutoff: datetime, batch_size: int, *criteria):
+    """ 보존 기간이 지난 삭제 행 batch_size개를 원본에서 지우고 보관 테이블에 넣는 한 문장
+
+    WITH batch AS (SELECT id ... ORDER BY deleted_at LIMIT n FOR UPDATE SKIP LOCKED),
+         moved AS (DELETE FROM source WHERE id IN batch RETURNING *)
+    INSERT INTO archive (...) SELECT ... FROM moved
+    """
+    batch = (
+        select(source.c.id)
+        .where(source.c.is_deleted == True, source.c.deleted_at < cutoff, *criteria)
+        .order_by(source.c.deleted_at)
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)
+        .cte("batch")
+    )
+    moved = (
+        delete(source)
+        .where(source.c.id.in_(select(batch.c.id)))
+        .returning(*source.c)
+        .cte("moved")
+    )
+    names = [column.name for column in source.c]
+    return insert(archive).from_select(names, select(*(moved.c[name] for name in names)))
+
+
+def _archive_targets(retention_days: int) -> list[tuple[Table, Table, datetime, tuple]]:
+    """ 보관 순서대로 (원본, 보관 테이블, 기준 시각, 추가 조건)
+
+    유치원을 먼저 옮겨야 그 유치원의 원장(사용자)이 FK 참조 없이 옮겨질 수 있습니다.
+    유치원이 남아 있는 사용자는 옮기지 않습니다 (refresh_tokens는 ON DELETE CASCADE).
+    """
+    cutoff = datetime.now(timezone.utc) - timedelta(days=retention_days)
+    kindergartens, users = Kindergarten.__table__, User.__table__
+    return [
+        # kindergartens.deleted_at은 timezone 없는 UTC 시각
+        (kindergartens, kindergartens_archive, cutoff.replace(tzinfo=None), ()),
+        (users, users_archive, cutoff, (~exists().where(kindergartens.c.owner_id == users.c.id),)),
+    ]
+
+
+async def archive_deleted_rows(
+    db: AsyncSession,
+    retention_days: int = settings.ARCHIVE_RETENTION_DAYS,
+    batch_size: int = settings.ARCHIVE_BATCH_SIZE,
+    max_batches: Optional[int] = None,
+) -> ArchiveReport:
+    """ ✅ 삭제된 지 retention_days가 지난 행을 batch_size개씩 보관 테이블로 옮기고 결과를 반환
+
+    배치마다 별도 트랜잭션으로 커밋하므로 중간에 중단되어도 이미 옮긴 행은 유지되고,
+    다시 실행하면 남은 행부터 이어서 처리합니다 (진행 상태를 따로 저장하지 않음).
+    SKIP LOCKED로 다른 워커가 처리 중인 행은 건너뛰므로 여러 워커에서 동시에 실행해도 안전합니다.
+    max_batches를 지정하면 테이블마다 그 수만큼만 처리합니다 (한 번에 오래 실행되지 않도록).
+    """
+    report = ArchiveReport()
+    for source, archive, cutoff, criteria in _archive_targets(retention_days):
+        statement = _archive_statement(source, archive, cutoff, batch_size, *criteria)
+        report.moved[source.name] = 0
+        batches = 0
+        while max_batches is None or batches < max_batches:
+            started = time.perf_counter()
+            result = await db.execute(statement)
+            await db.commit()
+            elapsed = time.perf_counter() - started
+            batches += 1
+
+            report.moved[source.name] += result.rowcount
+            report.batches.append((source.name, result.rowcount, elapsed * 1000))
+            ARCHIVED_ROWS.labels(source.name).inc(result.rowcount)
+            ARCHIVE_BATCH_DURATION.labels(source.name).observe(elapsed)
+            logger.debug("%s 보관 배치: %d행 (%.1fms)", source.name, result.rowcount, elapsed * 1000)
+            if result.rowcount < batch_size:
+                break
+    return report
+
+
+async def archive_deleted_rows_forever(
+    interval: int = settings.ARCHIVE_INTERVAL_SECONDS,
+    max_batches: int = settings.ARCHIVE_MAX_BATCHES,
+):
+    """ 백그라운드에서 주기적으로 보존 기간이 지난 삭제 행을 보관하는 태스크 """
+    while True:
+        try:
+            async with AsyncSessionLocal() as db:
+                report = await archive_deleted_rows(db, max_batches=max_batches)
+            if any(report.moved.values()):
+                total_ms = sum(ms for _, _, ms in report.batches)
+                logger.info("삭제 행 보관: %s (%d배치, %.0fms)", report.moved, len(report.batches), total_ms)
+        except Exception as e:
+            logger.warning("삭제 행 보관 실패: %s", e)
+        await asyncio.sleep(interval)
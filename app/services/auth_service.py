@@ -0,0 +1,199 @@
+import asyncio
+import logging
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from sqlalchemy import delete, func, select, text, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.database import AsyncSessionLocal
+from app.db.models.refresh_tokens import RefreshToken
+from app.db.models.user import User
+from app.db.routing import track_write
+from app.services.user_service import get_user_profile_by_id
+from app.utils.config import settings
+from app.utils.security import create_jwt_token, create_refresh_token, token_digest, verify_firebase_token
+from app.utils.singleflight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+# 같은 토큰으로 동시에 들어온 요청 병합 (여러 탭 / 재시도)
+# 결과가 토큰 원문(access/refresh token)이므로 Redis로 공유하지 않고 프로세스 안에서만 병합
+# (Redis에 남은 결과는 로그아웃으로 refresh token이 폐기된 뒤에도 다른 워커가 받아갈 수 있음)
+refresh_flight = SingleFlight("refresh")
+login_flight = SingleFlight("login")
+
+
+class InactiveUserError(Exception):
+    """ 정지되었거나 비활성화된 사용자의 로그인 (라우터에서 403으로 변환) """
+
+async def login_user(
+    db: AsyncSession,
+    firebase_uid: str,
+    email: str,
+    refresh_token: str,
+    expires_at: datetime,
+) -> tuple[uuid.UUID, str]:
+    """ ✅ 로그인 쓰기 경로를 하나의 트랜잭션으로 처리하고 (user_id, role)을 반환
+
+    1) INSERT ... ON CONFLICT (firebase_uid) WHERE is_deleted = false DO UPDATE ... RETURNING 으로
+       사용자 조회/생성 (동시에 같은 사용자가 처음 로그인해도 중복 생성 경합이 없음,
+       삭제된 사용자가 다시 로그인하면 새 사용자로 생성)
+    2) 기존 유효 토큰 폐기(CTE) + 새 refresh token 저장을 한 문장으로 실행
+    3) COMMIT
+    정지/비활성 사용자는 토큰을 저장하지 않고 롤백한 뒤 InactiveUserError를 발생시킵니다
+    (정지 시 폐기된 세션이 다시 로그인으로 살아나지 않도록).
+    """
+    user_stmt = pg_insert(User).values(firebase_uid=firebase_uid, email=email, role="user")
+    user_stmt = user_stmt.on_conflict_do_update(
+        index_elements=[User.firebase_uid],
+        index_where=User.is_deleted == False,  # uq_users_firebase_uid_live 부분 인덱스
+        # 기존 행을 RETURNING으로 돌려받기 위한 no-op 업데이트
+        set_={"firebase_uid": user_stmt.excluded.firebase_uid},
+    ).returning(User.id, User.role, User.is_active, User.is_suspended)
+    user_id, role, is_active, is_suspended = (await db.execute(user_stmt)).one()
+    if is_suspended or not is_active:
+        await db.rollback()
+        raise InactiveUserError(firebase_uid)
+
+    revoked_tokens = (
+        update(RefreshToken)
+        .where(RefreshToken.user_id == user_id, RefreshToken.revoked == False)
+        .values(revoked=True)
+        .cte("revoked_tokens")
+    )
+    token_stmt = pg_insert(RefreshToken).values(
+        user_id=user_id,
+        token_digest=token_digest(refresh_token),
+        expires_at=expires_at,
+        revoked=False,
+    ).add_cte(revoked_tokens)
+    await db.execute(token_stmt)
+    # 로그인 직후 /me가 아직 사용자 행이 없는 replica에서 조회되지 않도록
+    track_write(db, firebase_uid)
+    await db.commit()
+    return user_id, role
+
+async def login_with_firebase_token(firebase_token: str) -> tuple[str, str]:
+    """ ✅ Firebase 토큰으로 로그인하고 (access token, refresh token)을 반환
+
+    같은 Firebase 토큰의 동시 로그인은 한 번만 검증/저장하고 같은 토큰 쌍을 돌려줍니다.
+    요청마다 처리하면 각 요청이 refresh token을 회전시켜 먼저 응답받은 탭의 토큰이 바로 폐기됩니다.
+    """
+    return await login_flight.do(token_digest(firebase_token).hex(), lambda: _login(firebase_token))
+
+async def _login(firebase_token: str) -> tuple[str, str]:
+    firebase_user = await verify_firebase_token(firebase_token)
+    logger.debug("firebase login uid=%s", firebase_user["uid"])
+    uid = firebase_user["uid"]
+
+    refresh_token = create_refresh_token(uid)
+    # 공유 실행은 요청의 세션(의존성)과 수명이 다르므로 별도 세션 사용
+    async with AsyncSessionLocal() as db:
+        _, role = await login_user(
+            db,
+            firebase_uid=uid,
+            email=firebase_user["email"],
+            refresh_token=refresh_token,
+            expires_at=datetime.now(timezone.utc) + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS),
+        )
+    return create_jwt_token(uid, role), refresh_token
+
+async def refresh_access_token(refresh_token: str) -> Optional[str]:
+    """ ✅ refresh token으로 새 access token 발급 (유효하지 않으면 None)
+
+    같은 refresh token의 동시 요청은 한 번의 DB 조회 결과(같은 access token)를 공유합니다.
+    """
+    digest = token_digest(refresh_token)
+    return await refresh_flight.do(digest.hex(), lambda: _refresh(digest))
+
+async def _refresh(digest: bytes) -> Optional[str]:
+    # digest 인덱스(INCLUDE user_id)만으로 처리되도록 user_id만 조회
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(
+            select(RefreshToken.user_id).where(
+                RefreshToken.token_digest == digest,
+                RefreshToken.revoked == False,
+                RefreshToken.expires_at > datetime.now(timezone.utc),
+            )
+        )
+        user_id = result.scalars().first()
+    if not user_id:
+        return None
+    user = await get_user_profile_by_id(user_id)
+    # 정지/비활성 사용자는 남아 있는 refresh token으로도 access token을 받을 수 없음
+    if not user or user["is_suspended"] or not user["is_active"]:
+        return None
+    return create_jwt_token(user["firebase_uid"], user["role"])
+
+async def _execute_in_batches(db: AsyncSession, statement, batch_size: int) -> int:
+    """ batch_size행씩 처리하는 문장을 남은 행이 없을 때까지 반복 실행 (배치마다 커밋) - 처리한 행 수 반환 """
+    total = 0
+    while True:
+        result = await db.execute(statement)
+        await db.commit()
+        total += result.rowcount
+        if result.rowcount < batch_size:
+            return total
+
+async def purge_dead_refresh_tokens(db: AsyncSession, batch_size: int) -> int:
+    """ ✅ 만료/폐기된 refresh token을 batch_size개씩 삭제하고 삭제한 행 수를 반환
+
+    배치마다 별도 트랜잭션으로 커밋하고 SKIP LOCKED로 사용 중인 행은 건너뛰므로
+    로그인/refresh 요청과 긴 잠금 경합이 생기지 않습니다.
+    """
+    total = 0
+    for condition in (RefreshToken.expires_at < func.now(), RefreshToken.revoked == True):
+        dead_ids = (
+            select(RefreshToken.id)
+            .where(condition)
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+            .scalar_subquery()
+        )
+        total += await _execute_in_batches(db, delete(RefreshToken).where(RefreshToken.id.in_(dead_ids)), batch_size)
+    return total
+
+# migrations/001 적용 전의 행 digest 채우기 (refresh_token 컬럼은 006에서 제거되므로 모델에 없음)
+_BACKFILL_DIGEST_SQL = text(
+    """
+    UPDATE refresh_tokens
+       SET token_digest = sha256(convert_to(refresh_token, 'UTF8'))
+     WHERE id IN (
+        SELECT id FROM refresh_tokens
+         WHERE token_digest IS NULL
+         LIMIT :batch_size
+           FOR UPDATE SKIP LOCKED
+     )
+    """
+)
+_MISSING_DIGEST_SQL = text("SELECT count(*) FROM refresh_tokens WHERE token_digest IS NULL")
+
+async def backfill_refresh_token_digests(db: AsyncSession, batch_size: int) -> dict:
+    """ ✅ digest 전환(migrations/001 → 006) 중 기존 행 정리 - {"purged", "backfilled", "remaining"} 반환
+
+    옮길 필요가 없는 만료/폐기 토큰을 먼저 삭제한 뒤 남은 행의 digest를 채웁니다.
+    둘 다 purge_dead_refresh_tokens와 같이 배치마다 커밋하므로 로그인/refresh를 오래 막지 않습니다.
+    remaining이 0이 되면 migrations/006을 적용할 수 있습니다 (SKIP LOCKED로 건너뛴 행이 있으면 다시 실행).
+    """
+    purged = await purge_dead_refresh_tokens(db, batch_size)
+    backfilled = await _execute_in_batches(db, _BACKFILL_DIGEST_SQL.bindparams(batch_size=batch_size), batch_size)
+    remaining = (await db.execute(_MISSING_DIGEST_SQL)).scalar()
+    return {"purged": purged, "backfilled": backfilled, "remaining": remaining}
+
+async def sweep_refresh_tokens_forever(
+    interval: int = settings.REFRESH_TOKEN_SWEEP_INTERVAL_SECONDS,
+    batch_size: int = settings.REFRESH_TOKEN_SWEEP_BATCH_SIZE,
+):
+    """ 백그라운드에서 주기적으로 만료/폐기된 refresh token을 정리하는 태스크 """
+    while True:
+        try:
+            async with AsyncSessionLocal() as db:
+                deleted = await purge_dead_refresh_tokens(db, batch_size)
+            if deleted:
+                logger.info("만료/폐기된 refresh token %d개 삭제", deleted)
+        except Exception as e:
+            logger.warning("refresh token 정리 실패: %s", e)
+        await asyncio.sleep(interval)
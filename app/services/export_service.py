@@ -0,0 +1,113 @@
+import csv
+import io
+import uuid
+from dataclasses import dataclass
+from datetime import datetime
+from typing import AsyncIterator, Optional
+
+from pydantic_core import to_json
+from sqlalchemy import Select, select
+
+from app.db.database import AsyncSessionLocal
+from app.db.models.kindergarten import Kindergarten
+from app.db.models.user import User
+from app.services.kindergarten_service import KindergartenFilter, apply_filters
+from app.utils.config import settings
+
+EXPORT_FORMATS = ("ndjson", "csv")
+
+MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
+# 내보내기 컬럼 (ORM 객체 대신 컬럼만 조회하여 행마다 객체를 만들지 않음)
+USER_COLUMNS = (
+    User.id, User.firebase_uid, User.email, User.role,
+    User.is_active, User.is_suspended, User.is_deleted,
+    User.suspended_at, User.deleted_at, User.created_at,
+)
+KINDERGARTEN_COLUMNS = (
+    Kindergarten.id, Kindergarten.owner_id, Kindergarten.name, Kindergarten.business_number,
+    Kindergarten.type, Kindergarten.address, Kindergarten.contact, Kindergarten.email,
+    Kindergarten.certificate_status, Kindergarten.latitude, Kindergarten.longitude,
+    Kindergarten.is_active, Kindergarten.is_suspended, Kindergarten.is_deleted,
+    Kindergarten.created_at, Kindergarten.updated_at,
+)
+
+
+@dataclass
+class UserFilter:
+    """ 사용자 내보내기 조건 (None이면 조건 없음) """
+    role: Optional[str] = None
+    is_active: Optional[bool] = None
+    is_suspended: Optional[bool] = None
+    is_deleted: Optional[bool] = None
+    created_from: Optional[datetime] = None
+    created_to: Optional[datetime] = None
+
+
+def build_user_export_query(filters: UserFilter) -> Select:
+    query = select(*USER_COLUMNS)
+    if filters.role is not None:
+        query = query.where(User.role == filters.role)
+    if filters.is_active is not None:
+        query = query.where(User.is_active == filters.is_active)
+    if filters.is_suspended is not None:
+        query = query.where(User.is_suspended == filters.is_suspended)
+    if filters.is_deleted is not None:
+        query = query.where(User.is_deleted == filters.is_deleted)
+    if filters.created_from is not None:
+        query = query.where(User.created_at >= filters.created_from)
+    if filters.created_to is not None:
+        query = query.where(User.created_at < filters.created_to)
+    return query.order_by(User.created_at, User.id)
+
+
+def build_kindergarten_export_query(filters: KindergartenFilter) -> Select:
+    return apply_filters(select(*KINDERGARTEN_COLUMNS), filters).order_by(Kindergarten.created_at, Kindergarten.id)
+
+
+def _csv_value(value):
+    if value is None:
+        return ""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    return value
+
+
+def encode_ndjson(keys: list[str], rows) -> bytes:
+    """ 행 묶음을 NDJSON 바이트로 인코딩 (pydantic-core 직렬화) """
+    return b"".join(to_json(dict(zip(keys, row))) + b"\n" for row in rows)
+
+
+def encode_csv(rows) -> bytes:
+    """ 행 묶음을 CSV 바이트로 인코딩 """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    writer.writerows([_csv_value(value) for value in row] for row in rows)
+    return buffer.getvalue().encode()
+
+
+async def stream_export(
+    query: Select,
+    format: str,
+    batch_size: int = settings.EXPORT_BATCH_SIZE,
+) -> AsyncIterator[bytes]:
+    """ ✅ 서버 사이드 커서로 조회 결과를 batch_size행씩 인코딩하여 전송
+
+    의존성(get_async_db)의 세션은 응답 본문 전송 전에 닫히므로 생성기 안에서
+    별도 세션을 엽니다. 전체 결과를 메모리에 올리지 않고 배치 하나만 유지하며,
+    CSV 헤더는 쿼리 실행 전에 먼저 보내 첫 바이트가 바로 도착합니다.
+    """
+    keys = [column.key for column in query.selected_columns]
+    if format == "csv":
+        yield encode_csv([keys])
+    async with AsyncSessionLocal() as db:
+        result = await db.stream(query.execution_options(yield_per=batch_size))
+        async for rows in result.partitions():
+            yield encode_ndjson(keys, rows) if format == "ndjson" else encode_csv(rows)
@@ -0,0 +1,88 @@
+import re
+from typing import Iterable
+
+from sqlalchemy import select, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models.geocoded_address import GeocodedAddress
+from app.db.models.kindergarten import Kindergarten
+from app.utils import geohash
+
+_WHITESPACE = re.compile(r"\s+")
+
+# 주소가 바뀌었거나 좌표가 없는 유치원에 geocoded_addresses 좌표를 채우는 SQL
+# (normalize_address와 같은 규칙으로 주소를 정규화하여 조인)
+BACKFILL_COORDINATES_SQL = """
+UPDATE kindergartens AS k
+SET latitude = g.latitude, longitude = g.longitude, geohash = g.geohash, updated_at = now() AT TIME ZONE 'utc'
+FROM geocoded_addresses AS g
+WHERE g.address = regexp_replace(btrim(k.address), '\\s+', ' ', 'g')
+  AND k.geohash IS DISTINCT FROM g.geohash
+"""
+
+
+def normalize_address(address: str) -> str:
+    """ 지오코딩 테이블 조회용 주소 정규화 (앞뒤 공백 제거, 연속 공백을 하나로) """
+    return _WHITESPACE.sub(" ", address.strip())
+
+
+async def lookup_coordinates(db: AsyncSession, addresses: Iterable[str]) -> dict[str, tuple[float, float]]:
+    """ ✅ 주소 목록의 좌표를 한 번의 쿼리로 조회 (정규화된 주소 → (위도, 경도)) """
+    keys = {normalize_address(address) for address in addresses if address}
+    if not keys:
+        return {}
+    rows = await db.execute(
+        select(GeocodedAddress.address, GeocodedAddress.latitude, GeocodedAddress.longitude)
+        .where(GeocodedAddress.address.in_(keys))
+    )
+    return {address: (latitude, longitude) for address, latitude, longitude in rows}
+
+
+async def assign_coordinates(db: AsyncSession, kindergartens: list[Kindergarten]) -> int:
+    """ 저장 전 유치원들에 좌표를 채움 (geohash는 모델 저장 이벤트에서 계산) - 좌표를 찾은 개수 반환 """
+    coordinates = await lookup_coordinates(db, [kindergarten.address for kindergarten in kindergartens])
+    found = 0
+    for kindergarten in kindergartens:
+        point = coordinates.get(normalize_address(kindergarten.address))
+        if point is None:
+            kindergarten.latitude = kindergarten.longitude = None
+            continue
+        kindergarten.latitude, kindergarten.longitude = point
+        found += 1
+    return found
+
+
+async def upsert_geocoded_addresses(db: AsyncSession, rows: Iterable[tuple[str, float, float]]) -> int:
+    """ 오프라인 지오코딩 결과 (주소, 위도, 경도) 적재 - 같은 주소는 좌표 갱신 """
+    values = [
+        {
+            "address": normalize_address(address),
+            "latitude": latitude,
+            "longitude": longitude,
+            "geohash": geohash.encode(latitude, longitude),
+        }
+        for address, latitude, longitude in rows
+    ]
+    if not values:
+        return 0
+    statement = pg_insert(GeocodedAddress).values(values)
+    statement = statement.on_conflict_do_update(
+        index_elements=[GeocodedAddress.address],
+        set_={
+            "latitude": statement.excluded.latitude,
+            "longitude": statement.excluded.longitude,
+            "geohash": statement.excluded.geohash,
+            "updated_at": text("now() AT TIME ZONE 'utc'"),
+        },
+    )
+    await db.execute(statement)
+    await db.commit()
+    return len(values)
+
+
+async def backfill_coordinates(db: AsyncSession) -> int:
+    """ 기존 유치원 좌표 일괄 채움 (지오코딩 테이블 적재 후 1회 실행) """
+    result = await db.execute(text(BACKFILL_COORDINATES_SQL))
+    await db.commit()
+    return result.rowcount
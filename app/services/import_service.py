@@ -0,0 +1,285 @@
+import codecs
+import csv
+import json
+import uuid
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Optional
+
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, ValidationError
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.services.geocoding_service import normalize_address
+from app.utils.config import settings
+
+IMPORT_FORMATS = ("csv", "ndjson")
+
+STAGING_TABLE = "kindergarten_import_staging"
+STAGING_COLUMNS = (
+    "line_no", "id", "owner_id", "name", "business_number", "type",
+    "address", "address_key", "contact", "email", "certificate_status",
+)
+
+# 세션(커넥션)별 임시 테이블 - 커밋할 때마다 비워지므로 배치마다 재사용
+CREATE_STAGING_SQL = f"""
+CREATE TEMP TABLE IF NOT EXISTS {STAGING_TABLE} (
+    line_no integer NOT NULL,
+    id uuid NOT NULL,
+    owner_id uuid NOT NULL,
+    name text NOT NULL,
+    business_number text NOT NULL,
+    type text NOT NULL,
+    address text NOT NULL,
+    address_key text NOT NULL,
+    contact text NOT NULL,
+    email text NOT NULL,
+    certificate_status text
+) ON COMMIT DELETE ROWS
+"""
+
+MISSING_OWNER_SQL = f"""
+SELECT s.line_no FROM {STAGING_TABLE} AS s
+WHERE NOT EXISTS (SELECT 1 FROM users AS u WHERE u.id = s.owner_id)
+ORDER BY s.line_no
+"""
+
+# ✅ 스테이징 → kindergartens 병합 (business_number 기준 upsert)
+# - 파일 안에서 같은 business_number가 여러 번 나오면 마지막 행을 적용
+# - 좌표/geohash는 오프라인 지오코딩 테이블에서 채움
+# - 기존 유치원은 소유자/인증 상태/계정 상태를 유지하고 기본 정보만 갱신
+# - 삭제된 유치원과 같은 business_number는 새 유치원으로 등록 (uq_kindergartens_business_number_live)
+MERGE_SQL = f"""
+INSERT INTO kindergartens AS k (
+    id, owner_id, name, business_number, type, address, contact, email, certificate_status,
+    latitude, longitude, geohash, is_active, is_suspended, is_deleted, created_at, updated_at
+)
+SELECT DISTINCT ON (s.business_number)
+       s.id, s.owner_id, s.name, s.business_number, s.type, s.address, s.contact, s.email,
+       COALESCE(s.certificate_status, 'pending'),
+       g.latitude, g.longitude, g.geohash, true, false, false,
+       now() AT TIME ZONE 'utc', now() AT TIME ZONE 'utc'
+FROM {STAGING_TABLE} AS s
+JOIN users AS u ON u.id = s.owner_id
+LEFT JOIN geocoded_addresses AS g ON g.address = s.address_key
+ORDER BY s.business_number, s.line_no DESC
+ON CONFLICT (business_number) WHERE is_deleted = false DO UPDATE SET
+    name = excluded.name,
+    type = excluded.type,
+    address = excluded.address,
+    contact = excluded.contact,
+    email = excluded.email,
+    latitude = excluded.latitude,
+    longitude = excluded.longitude,
+    geohash = excluded.geohash,
+    updated_at = excluded.updated_at
+RETURNING (xmax = 0) AS inserted
+"""
+
+
+class KindergartenImportRow(BaseModel):
+    """ 일괄 등록 입력 행 (CSV 헤더 / NDJSON 키 이름과 동일) """
+    model_config = ConfigDict(str_strip_whitespace=True, extra="ignore")
+
+    owner_id: uuid.UUID
+    name: str = Field(min_length=1, max_length=200)
+    business_number: str = Field(min_length=1, max_length=32)
+    type: str = Field(min_length=1, max_length=50)
+    address: str = Field(min_length=1, max_length=500)
+    contact: str = Field(min_length=1, max_length=50)
+    email: str = Field(pattern=r"^[^@\s]+@[^@\s]+\.[^@\s]+$", max_length=320)
+    certificate_status: Optional[str] = Field(None, max_length=50)
+
+
+_ROWS_ADAPTER = TypeAdapter(list[KindergartenImportRow])
+
+
+@dataclass
+class ImportReport:
+    """ 일괄 등록 결과 (행 번호는 1부터, CSV는 헤더 포함 파일 기준) """
+    total: int = 0
+    inserted: int = 0
+    updated: int = 0
+    skipped: int = 0  # 같은 파일의 뒤쪽 행으로 대체된 중복 business_number
+    failed: int = 0
+    errors: list[dict] = field(default_factory=list)
+    errors_truncated: bool = False
+    max_errors: int = settings.IMPORT_MAX_ERRORS
+
+    def add_error(self, line: int, messages: list[str]):
+        self.failed += 1
+        # 오류가 많은 파일도 응답 크기가 커지지 않도록 max_errors개까지만 상세 보관
+        if len(self.errors) < self.max_errors:
+            self.errors.append({"line": line, "errors": messages})
+        else:
+            self.errors_truncated = True
+
+    def to_dict(self) -> dict:
+        return {
+            "total": self.total,
+            "inserted": self.inserted,
+            "updated": self.updated,
+            "skipped": self.skipped,
+            "failed": self.failed,
+            "errors": self.errors,
+            "errors_truncated": self.errors_truncated,
+        }
+
+
+async def iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    """ 바이트 청크 스트림을 줄 단위 문자열로 변환 (UTF-8, BOM/CRLF 허용) """
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    buffer = ""
+    async for chunk in chunks:
+        buffer += decoder.decode(chunk)
+        if "\n" not in buffer:
+            continue
+        *lines, buffer = buffer.split("\n")
+        for line in lines:
+            yield line.rstrip("\r")
+    buffer += decoder.decode(b"", final=True)
+    if buffer:
+        yield buffer.rstrip("\r")
+
+
+async def iter_ndjson_records(chunks: AsyncIterator[bytes]) -> AsyncIterator[tuple[int, Optional[dict], Optional[str]]]:
+    """ NDJSON 스트림을 (행 번호, 레코드, 파싱 오류) 로 변환 """
+    line_no = 0
+    async for line in iter_lines(chunks):
+        line_no += 1
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError:
+            yield line_no, None, "Invalid JSON"
+            continue
+        if not isinstance(record, dict):
+            yield line_no, None, "JSON object expected"
+            continue
+        yield line_no, record, None
+
+
+async def iter_csv_records(chunks: AsyncIterator[bytes]) -> AsyncIterator[tuple[int, Optional[dict], Optional[str]]]:
+    """ 헤더가 있는 CSV 스트림을 (행 번호, 레코드, 파싱 오류) 로 변환
+
+    따옴표 안의 줄바꿈은 따옴표 개수가 짝수가 될 때까지 다음 줄을 이어 붙여 처리하고,
+    빈 값은 키를 생략하여 선택 항목의 기본값이 적용되도록 합니다.
+    """
+    header = None
+    pending = ""
+    start_line = line_no = 0
+    async for line in iter_lines(chunks):
+        line_no += 1
+        if pending:
+            pending += "\n" + line
+        else:
+            pending, start_line = line, line_no
+        if pending.count('"') % 2:
+            continue
+        values = next(csv.reader([pending]), [])
+        pending = ""
+        if header is None:
+            header = [name.strip() for name in values]
+            continue
+        if not any(value.strip() for value in values):
+            continue
+        if len(values) != len(header):
+            yield start_line, None, f"Expected {len(header)} columns, got {len(values)}"
+            continue
+        yield start_line, {name: value for name, value in zip(header, values) if value != ""}, None
+    if pending:
+        yield start_line, None, "Unterminated quoted field"
+
+
+def iter_records(chunks: AsyncIterator[bytes], format: str) -> AsyncIterator[tuple[int, Optional[dict], Optional[str]]]:
+    if format == "csv":
+        return iter_csv_records(chunks)
+    if format == "ndjson":
+        return iter_ndjson_records(chunks)
+    raise ValueError(f"Unsupported import format: {format}")
+
+
+def validate_batch(records: list[tuple[int, dict]]) -> tuple[list[tuple[int, KindergartenImportRow]], list[tuple[int, list[str]]]]:
+    """ ✅ 레코드 배치를 한 번에 검증 - (유효한 행, 행별 오류) 반환
+
+    배치 전체를 TypeAdapter 한 번으로 검증하고, 오류가 있으면
+    오류가 없는 행만 모아 다시 한 번 검증합니다 (행마다 검증기를 호출하지 않음).
+    """
+    lines = [line for line, _ in records]
+    data = [record for _, record in records]
+    try:
+        return list(zip(lines, _ROWS_ADAPTER.validate_python(data))), []
+    except ValidationError as e:
+        failed: dict[int, list[str]] = {}
+        for error in e.errors(include_url=False):
+            index, *location = error["loc"]
+            failed.setdefault(index, []).append(f"{'.'.join(map(str, location)) or 'row'}: {error['msg']}")
+    valid = [index for index in range(len(data)) if index not in failed]
+    rows = _ROWS_ADAPTER.validate_python([data[index] for index in valid]) if valid else []
+    errors = [(lines[index], messages) for index, messages in sorted(failed.items())]
+    return list(zip([lines[index] for index in valid], rows)), errors
+
+
+async def _copy_to_staging(db: AsyncSession, rows: list[tuple[int, KindergartenImportRow]]):
+    """ asyncpg COPY로 스테이징 테이블에 적재 (행마다 INSERT하지 않음) """
+    records = [
+        (
+            line, uuid.uuid4(), row.owner_id, row.name, row.business_number, row.type,
+            row.address, normalize_address(row.address), row.contact, row.email, row.certificate_status,
+        )
+        for line, row in rows
+    ]
+    connection = await db.connection()
+    raw_connection = await connection.get_raw_connection()
+    await raw_connection.driver_connection.copy_records_to_table(
+        STAGING_TABLE, records=records, columns=STAGING_COLUMNS
+    )
+
+
+async def merge_batch(db: AsyncSession, rows: list[tuple[int, KindergartenImportRow]], report: ImportReport):
+    """ 검증된 배치를 COPY → 병합 → 커밋 (배치마다 별도 트랜잭션) """
+    await db.execute(text(CREATE_STAGING_SQL))
+    await _copy_to_staging(db, rows)
+    missing = (await db.execute(text(MISSING_OWNER_SQL))).scalars().all()
+    for line in missing:
+        report.add_error(line, ["owner_id: Owner not found"])
+    merged = (await db.execute(text(MERGE_SQL))).scalars().all()
+    await db.commit()
+    report.inserted += sum(1 for inserted in merged if inserted)
+    report.updated += sum(1 for inserted in merged if not inserted)
+    report.skipped += len(rows) - len(missing) - len(merged)
+
+
+async def import_kindergartens(
+    db: AsyncSession,
+    records: AsyncIterator[tuple[int, Optional[dict], Optional[str]]],
+    batch_size: int = settings.IMPORT_BATCH_SIZE,
+    report: Optional[ImportReport] = None,
+) -> ImportReport:
+    """ ✅ 레코드 스트림을 batch_size개씩 검증/적재하고 결과 보고서를 반환
+
+    입력 전체를 메모리에 올리지 않고 배치 하나만 유지하며,
+    배치마다 커밋하므로 중간에 실패해도 앞선 배치는 반영됩니다.
+    """
+    report = report or ImportReport()
+    batch: list[tuple[int, dict]] = []
+
+    async def flush():
+        rows, errors = validate_batch(batch)
+        for line, messages in errors:
+            report.add_error(line, messages)
+        if rows:
+            await merge_batch(db, rows, report)
+        batch.clear()
+
+    async for line, record, error in records:
+        report.total += 1
+        if error:
+            report.add_error(line, [error])
+            continue
+        batch.append((line, record))
+        if len(batch) >= batch_size:
+            await flush()
+    if batch:
+        await flush()
+    return report
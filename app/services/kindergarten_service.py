@@ -0,0 +1,140 @@
+import base64
+import uuid
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import Select, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models.kindergarten import Kindergarten
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+
+@dataclass
+class KindergartenFilter:
+    """ 유치원 목록 조회 조건 (None이면 조건 없음) """
+    owner_id: Optional[uuid.UUID] = None
+    type: Optional[str] = None
+    certificate_status: Optional[str] = None
+    is_active: Optional[bool] = None
+    is_suspended: Optional[bool] = None
+    is_deleted: Optional[bool] = False
+    name_prefix: Optional[str] = None
+    address_prefix: Optional[str] = None
+
+
+def encode_cursor(created_at: datetime, kindergarten_id: uuid.UUID) -> str:
+    """ (created_at, id)를 URL-safe 커서 문자열로 인코딩 """
+    raw = f"{created_at.isoformat()}|{kindergarten_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, uuid.UUID]:
+    """ 커서 문자열을 (created_at, id)로 디코딩 (형식이 잘못되면 ValueError) """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        created_at, kindergarten_id = raw.split("|")
+        return datetime.fromisoformat(created_at), uuid.UUID(kindergarten_id)
+    except Exception:
+        raise ValueError("Invalid cursor")
+
+
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def apply_filters(query: Select, filters: KindergartenFilter) -> Select:
+    """ 목록/내보내기 공통 조회 조건 적용 """
+    if filters.owner_id is not None:
+        query = query.where(Kindergarten.owner_id == filters.owner_id)
+    if filters.type is not None:
+        query = query.where(Kindergarten.type == filters.type)
+    if filters.certificate_status is not None:
+        query = query.where(Kindergarten.certificate_status == filters.certificate_status)
+    if filters.is_active is not None:
+        query = query.where(Kindergarten.is_active == filters.is_active)
+    if filters.is_suspended is not None:
+        query = query.where(Kindergarten.is_suspended == filters.is_suspended)
+    if filters.is_deleted is not None:
+        query = query.where(Kindergarten.is_deleted == filters.is_deleted)
+    if filters.name_prefix:
+        query = query.where(Kindergarten.name.like(_escape_like(filters.name_prefix) + "%", escape="\\"))
+    if filters.address_prefix:
+        query = query.where(Kindergarten.address.like(_escape_like(filters.address_prefix) + "%", escape="\\"))
+    return query
+
+
+def build_list_query(filters: KindergartenFilter, cursor: Optional[str], limit: int) -> Select:
+    """ ✅ 유치원 목록 keyset 페이지네이션 쿼리 생성
+
+    OFFSET 대신 (created_at, id) < (커서) 조건으로 다음 페이지를 찾으므로
+    페이지 깊이와 무관하게 인덱스 범위 스캔으로 처리됩니다.
+    다음 페이지 존재 여부 확인을 위해 limit + 1개를 조회합니다.
+    """
+    query = apply_filters(select(Kindergarten), filters)
+    if cursor:
+        created_at, kindergarten_id = decode_cursor(cursor)
+        query = query.where(tuple_(Kindergarten.created_at, Kindergarten.id) < (created_at, kindergarten_id))
+    return query.order_by(Kindergarten.created_at.desc(), Kindergarten.id.desc()).limit(limit + 1)
+
+
+# 관리자만 볼 수 있는 유치원 정보 (사업자 번호/연락처)
+PRIVATE_FIELDS = ("business_number", "contact", "email")
+
+
+def kindergarten_to_dict(kindergarten: Kindergarten, include_private: bool = True) -> dict:
+    """ 응답용 유치원 정보 (include_private=False이면 PRIVATE_FIELDS 제외) """
+    data = {
+        "id": kindergarten.id,
+        "owner_id": kindergarten.owner_id,
+        "name": kindergarten.name,
+        "business_number": kindergarten.business_number,
+        "type": kindergarten.type,
+        "address": kindergarten.address,
+        "contact": kindergarten.contact,
+        "email": kindergarten.email,
+        "certificate_status": kindergarten.certificate_status,
+        "is_active": kindergarten.is_active,
+        "is_suspended": kindergarten.is_suspended,
+        "is_deleted": kindergarten.is_deleted,
+        "created_at": kindergarten.created_at,
+        "updated_at": kindergarten.updated_at,
+    }
+    if not include_private:
+        for name in PRIVATE_FIELDS:
+            del data[name]
+    return data
+
+
+async def list_kindergartens(
+    db: AsyncSession,
+    filters: KindergartenFilter,
+    cursor: Optional[str] = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+    include_private: bool = True,
+) -> tuple[list[dict], Optional[str]]:
+    """ 유치원 목록 조회 - (항목 목록, 다음 페이지 커서) 반환 """
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+    rows = (await db.execute(build_list_query(filters, cursor, limit))).scalars().all()
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_cursor = encode_cursor(last.created_at, last.id)
+    return [kindergarten_to_dict(row, include_private) for row in rows], next_cursor
+
+
+async def get_kindergarten(
+    db: AsyncSession,
+    kindergarten_id: uuid.UUID,
+    include_deleted: bool = True,
+    include_private: bool = True,
+) -> Optional[dict]:
+    """ 유치원 단건 조회 (include_deleted=False이면 삭제된 유치원은 None) """
+    kindergarten = await db.get(Kindergarten, kindergarten_id)
+    if not kindergarten or (kindergarten.is_deleted and not include_deleted):
+        return None
+    return kindergarten_to_dict(kindergarten, include_private)
@@ -0,0 +1,238 @@
+import asyncio
+import logging
+import uuid
+from datetime import datetime, timedelta
+from typing import Iterator, Optional
+
+from sqlalchemy import select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.database import AsyncSessionLocal
+from app.db.models.kindergarten import Kindergarten
+from app.utils import geohash
+from app.utils.config import settings
+from app.utils.metrics import REGISTRY
+
+logger = logging.getLogger(__name__)
+
+# 근처 검색 첫 반경 (결과가 k개보다 적으면 두 배씩 넓힘)
+INITIAL_RADIUS_M = 1000.0
+
+# 인덱스/응답에 필요한 컬럼만 조회
+_COLUMNS = (
+    Kindergarten.id,
+    Kindergarten.name,
+    Kindergarten.address,
+    Kindergarten.type,
+    Kindergarten.latitude,
+    Kindergarten.longitude,
+    Kindergarten.is_active,
+    Kindergarten.is_suspended,
+    Kindergarten.is_deleted,
+    Kindergarten.updated_at,
+)
+
+
+class SpatialEntry:
+    """ 공간 인덱스 항목 (근처 검색 응답을 DB 조회 없이 만들 수 있는 정보 포함) """
+    __slots__ = ("id", "name", "address", "type", "latitude", "longitude", "cell")
+
+    def __init__(self, id, name, address, type, latitude, longitude):
+        self.id = id
+        self.name = name
+        self.address = address
+        self.type = type
+        self.latitude = latitude
+        self.longitude = longitude
+        self.cell = geohash.cell_index(latitude, longitude)
+
+    def to_dict(self, distance_m: float) -> dict:
+        return {
+            "id": self.id,
+            "name": self.name,
+            "address": self.address,
+            "type": self.type,
+            "latitude": self.latitude,
+            "longitude": self.longitude,
+            "distance_m": round(distance_m, 1),
+        }
+
+
+def _is_searchable(row) -> bool:
+    """ 근처 검색 대상 (운영 중이고 좌표가 있는 유치원) """
+    return (
+        row.is_active and not row.is_suspended and not row.is_deleted
+        and row.latitude is not None and row.longitude is not None
+    )
+
+
+def _ring_radii(max_radius_m: float) -> Iterator[float]:
+    """ INITIAL_RADIUS_M부터 두 배씩 max_radius_m까지의 검색 반경 """
+    radius = min(INITIAL_RADIUS_M, max_radius_m)
+    while True:
+        yield radius
+        if radius >= max_radius_m:
+            return
+        radius = min(radius * 2, max_radius_m)
+
+
+class SpatialIndex:
+    """ ✅ 프로세스 내 geohash 셀 기반 공간 인덱스
+
+    유치원을 geohash 셀(정밀도 6, 약 1.2km x 0.6km)의 격자 좌표별로 묶어 두고
+    반경을 덮는 셀만 확인하므로, 검색 비용이 전체 개수가 아니라
+    반경 안의 유치원 수에 비례합니다.
+    updated_at 워터마크 이후 변경분만 DB에서 읽어 증분 갱신합니다.
+    값 갱신은 이벤트 루프 스레드에서만 일어나므로 락 없이 동작합니다.
+    """
+
+    def __init__(self):
+        self._entries: dict[uuid.UUID, SpatialEntry] = {}
+        self._cells: dict[tuple[int, int], dict[uuid.UUID, SpatialEntry]] = {}
+        self.watermark: Optional[datetime] = None
+        self.ready = False
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def upsert(self, entry: SpatialEntry):
+        self.remove(entry.id)
+        self._entries[entry.id] = entry
+        self._cells.setdefault(entry.cell, {})[entry.id] = entry
+
+    def remove(self, kindergarten_id: uuid.UUID):
+        entry = self._entries.pop(kindergarten_id, None)
+        if entry is None:
+            return
+        cell = self._cells.get(entry.cell)
+        if cell is not None:
+            cell.pop(kindergarten_id, None)
+            if not cell:
+                del self._cells[entry.cell]
+
+    def apply(self, row):
+        """ DB 행 하나를 인덱스에 반영 (검색 대상이 아니게 되면 제거) """
+        if _is_searchable(row):
+            self.upsert(SpatialEntry(row.id, row.name, row.address, row.type, row.latitude, row.longitude))
+        else:
+            self.remove(row.id)
+
+    def within(self, latitude: float, longitude: float, radius_m: float) -> list[tuple[float, SpatialEntry]]:
+        """ 반경 안의 유치원을 가까운 순으로 반환 - [(거리, 항목)] """
+        hits = []
+        for cell in geohash.covering_cell_indexes(latitude, longitude, radius_m):
+            entries = self._cells.get(cell)
+            if not entries:
+                continue
+            for entry in entries.values():
+                distance = geohash.haversine_m(latitude, longitude, entry.latitude, entry.longitude)
+                if distance <= radius_m:
+                    hits.append((distance, entry))
+        hits.sort(key=lambda hit: hit[0])
+        return hits
+
+    def nearest(self, latitude: float, longitude: float, k: int, max_radius_m: float) -> list[tuple[float, SpatialEntry]]:
+        """ max_radius_m 안에서 가장 가까운 k개 (반경을 두 배씩 넓혀가며 검색) """
+        hits = []
+        for radius in _ring_radii(max_radius_m):
+            hits = self.within(latitude, longitude, radius)
+            if len(hits) >= k:
+                break
+        return hits[:k]
+
+    async def refresh(self, db: AsyncSession, batch_size: int, lag_seconds: float) -> int:
+        """ 워터마크 이후 변경된 유치원을 배치로 읽어 반영 - 반영한 행 수 반환
+
+        커밋 순서와 updated_at 순서가 다를 수 있고 워커 간 시계 차이도 있으므로
+        워터마크보다 lag_seconds 앞에서부터 다시 읽습니다 (반영은 멱등).
+        """
+        since = self.watermark - timedelta(seconds=lag_seconds) if self.watermark else None
+        position = None
+        applied = 0
+        while True:
+            query = select(*_COLUMNS)
+            if since is not None:
+                query = query.where(Kindergarten.updated_at > since)
+            if position is not None:
+                query = query.where(tuple_(Kindergarten.updated_at, Kindergarten.id) > position)
+            query = query.order_by(Kindergarten.updated_at, Kindergarten.id).limit(batch_size)
+            rows = (await db.execute(query)).all()
+            for row in rows:
+                self.apply(row)
+            applied += len(rows)
+            if rows:
+                position = (rows[-1].updated_at, rows[-1].id)
+                self.watermark = max(self.watermark or rows[-1].updated_at, rows[-1].updated_at)
+            if len(rows) < batch_size:
+                break
+        self.ready = True
+        return applied
+
+
+# 프로세스 전역 공간 인덱스
+spatial_index = SpatialIndex()
+
+REGISTRY.callback(
+    "spatial_index_entries", "Kindergartens in the in-process spatial index", "gauge", (),
+    lambda: [((), len(spatial_index))],
+)
+
+
+async def _nearest_from_db(
+    db: AsyncSession, latitude: float, longitude: float, k: int, max_radius_m: float
+) -> list[tuple[float, SpatialEntry]]:
+    """ 인덱스가 준비되기 전 대체 경로 - geohash 셀 인덱스(ix_kindergartens_geohash)로 후보 조회 """
+    hits = []
+    for radius in _ring_radii(max_radius_m):
+        cells = geohash.covering_cells(latitude, longitude, radius)
+        rows = (await db.execute(
+            select(*_COLUMNS).where(Kindergarten.geohash.in_(cells), Kindergarten.is_deleted == False)
+        )).all()
+        hits = []
+        for row in rows:
+            if not _is_searchable(row):
+                continue
+            entry = SpatialEntry(row.id, row.name, row.address, row.type, row.latitude, row.longitude)
+            distance = geohash.haversine_m(latitude, longitude, entry.latitude, entry.longitude)
+            if distance <= radius:
+                hits.append((distance, entry))
+        hits.sort(key=lambda hit: hit[0])
+        if len(hits) >= k:
+            break
+    return hits[:k]
+
+
+async def find_nearby_kindergartens(
+    db: AsyncSession,
+    latitude: float,
+    longitude: float,
+    limit: int,
+    radius_m: Optional[float] = None,
+) -> list[dict]:
+    """ ✅ 근처 유치원 검색 (가까운 순 limit개, radius_m이 없으면 최대 반경 안의 k-최근접)
+
+    공간 인덱스가 준비되어 있으면 DB 조회 없이 메모리에서 처리합니다.
+    """
+    max_radius_m = min(radius_m or settings.NEARBY_MAX_RADIUS_M, settings.NEARBY_MAX_RADIUS_M)
+    if spatial_index.ready:
+        hits = spatial_index.nearest(latitude, longitude, limit, max_radius_m)
+    else:
+        hits = await _nearest_from_db(db, latitude, longitude, limit, max_radius_m)
+    return [entry.to_dict(distance) for distance, entry in hits]
+
+
+async def refresh_spatial_index_forever(
+    interval: int = settings.SPATIAL_INDEX_REFRESH_SECONDS,
+    batch_size: int = settings.SPATIAL_INDEX_BATCH_SIZE,
+    lag_seconds: int = settings.SPATIAL_INDEX_REFRESH_LAG_SECONDS,
+):
+    """ 백그라운드에서 공간 인덱스를 처음 전체 적재한 뒤 주기적으로 증분 갱신하는 태스크 """
+    while True:
+        try:
+            async with AsyncSessionLocal() as db:
+                applied = await spatial_index.refresh(db, batch_size, lag_seconds)
+            if applied:
+                logger.info("공간 인덱스 갱신: %d행 반영 (총 %d개)", applied, len(spatial_index))
+        except Exception as e:
+            logger.warning("공간 인덱스 갱신 실패: %s", e)
+        await asyncio.sleep(interval)
@@ -0,0 +1,272 @@
+import asyncio
+import json
+import logging
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import Awaitable, Callable, Optional
+
+from sqlalchemy import event, select, update
+
+from app.db.database import AsyncSessionLocal, get_session_router
+from app.db.routing import track_write
+from app.db.models.refresh_tokens import RefreshToken
+from app.db.models.user import User
+from app.utils.cache import ExpiringCache
+from app.utils.config import settings
+from app.utils.metrics import REGISTRY
+from app.utils.redis_client import get_redis
+from app.utils.revocation import token_revocation
+from app.utils.singleflight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+def user_to_profile(user: User) -> dict:
+    """ User 행을 캐싱 가능한 프로필 dict로 변환 """
+    return {
+        "id": str(user.id),
+        "firebase_uid": user.firebase_uid,
+        "email": user.email,
+        "role": user.role,
+        "is_active": user.is_active,
+        "is_suspended": user.is_suspended,
+        "is_deleted": user.is_deleted,
+        "created_at": user.created_at.isoformat() if user.created_at else None,
+        "updated_at": user.updated_at.isoformat() if user.updated_at else None,
+    }
+
+
+class UserProfileCache:
+    """ ✅ 사용자 프로필 read-through 캐시 (프로세스 내 LRU/TTL → Redis(선택) → DB)
+
+    같은 키에 대한 동시 miss는 하나의 로드를 공유하므로(single-flight stampede guard)
+    cold key라도 DB 조회는 한 번만 일어납니다 (singleflight_redis이면 워커 간에도 병합).
+    프로필은 firebase_uid("uid:...")와 id("id:...") 두 키로 저장됩니다.
+
+    invalidate()는 키마다 무효화 순번(generation)을 남깁니다. 로드 도중 그 프로필의 키가
+    무효화되었으면 로드 결과(무효화 이전 행일 수 있음)는 호출자에게만 돌려주고 캐시에는 넣지 않으며,
+    무효화 이후의 조회는 이전 로드에 합류하지 않고 새로 로드합니다.
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: int,
+        redis_enabled: bool = False,
+        redis_ttl: int = 300,
+        redis=None,
+        singleflight_redis: bool = False,
+    ):
+        self.ttl = ttl
+        self.local = ExpiringCache(maxsize=maxsize)
+        self.redis_enabled = redis_enabled
+        self.redis_ttl = redis_ttl
+        self._redis = redis
+        self._flight = SingleFlight("user_profile", redis_enabled=singleflight_redis, redis=redis)
+        self.redis_hits = 0
+        self.db_loads = 0
+        # 키 -> 마지막 무효화 순번 (진행 중인 로드가 있을 때만 필요하므로 로드가 모두 끝나면 비움)
+        self._invalidation_seq = 0
+        self._generations: dict[str, int] = {}
+        self._loading = 0
+
+    async def get(self, key: str, loader: Callable[[], Awaitable[Optional[dict]]]) -> Optional[dict]:
+        """ key의 프로필 조회 (없으면 loader로 로드, 사용자가 없으면 None) """
+        profile = self.local.get(key)
+        if profile is not None:
+            return profile
+
+        generation = self._generations.get(key, 0)
+        # 무효화 이후의 조회는 무효화 이전에 시작된 로드에 합류하지 않음
+        flight_key = f"{key}#{generation}" if generation else key
+        return await self._flight.do(flight_key, lambda: self._load(key, loader))
+
+    async def _load(self, key: str, loader) -> Optional[dict]:
+        started = self._invalidation_seq
+        self._loading += 1
+        try:
+            profile = await self._get_remote(key)
+            if profile is not None:
+                self.redis_hits += 1
+            else:
+                self.db_loads += 1
+                profile = await loader()
+                if profile is None or self._invalidated_since(profile, started):
+                    return profile
+                await self._set_remote(profile)
+            if self._invalidated_since(profile, started):
+                # Redis 저장 중에 무효화되었으면 방금 저장한 값도 제거
+                await self._delete_remote(self._profile_keys(profile))
+                return profile
+            self._set_local(profile)
+            return profile
+        finally:
+            self._loading -= 1
+            if not self._loading:
+                self._generations.clear()
+
+    def _invalidated_since(self, profile: dict, started: int) -> bool:
+        """ started 이후 프로필의 키가 무효화되었는지 """
+        return any(self._generations.get(key, 0) > started for key in self._profile_keys(profile))
+
+    @staticmethod
+    def _profile_keys(profile: dict) -> list[str]:
+        return [f"uid:{profile['firebase_uid']}", f"id:{profile['id']}"]
+
+    def _set_local(self, profile: dict):
+        expires_at = time.time() + self.ttl
+        self.local.set(f"uid:{profile['firebase_uid']}", profile, expires_at)
+        self.local.set(f"id:{profile['id']}", profile, expires_at)
+
+    def _redis_client(self):
+        return self._redis or get_redis()
+
+    async def _get_remote(self, key: str) -> Optional[dict]:
+        if not self.redis_enabled:
+            return None
+        try:
+            raw = await self._redis_client().get(f"user_profile:{key}")
+        except Exception as e:
+            logger.debug("사용자 프로필 Redis 조회 실패: %s", e)
+            return None
+        return json.loads(raw) if raw else None
+
+    async def _set_remote(self, profile: dict):
+        if not self.redis_enabled:
+            return
+        raw = json.dumps(profile)
+        try:
+            async with self._redis_client().pipeline(transaction=False) as pipe:
+                pipe.set(f"user_profile:uid:{profile['firebase_uid']}", raw, ex=self.redis_ttl)
+                pipe.set(f"user_profile:id:{profile['id']}", raw, ex=self.redis_ttl)
+                await pipe.execute()
+        except Exception as e:
+            logger.debug("사용자 프로필 Redis 저장 실패: %s", e)
+
+    async def _delete_remote(self, keys: list[str]):
+        if not self.redis_enabled or not keys:
+            return
+        try:
+            await self._redis_client().delete(*(f"user_profile:{key}" for key in keys))
+        except Exception as e:
+            logger.warning("사용자 프로필 Redis 무효화 실패: %s", e)
+
+    async def invalidate(self, firebase_uid: Optional[str] = None, user_id: Optional[uuid.UUID] = None):
+        """ 사용자 쓰기(권한 변경, 정지, 삭제) 후 캐시 항목 제거 """
+        keys = self._forget(firebase_uid, user_id)
+        await self._delete_remote(keys)
+
+    def invalidate_local(self, firebase_uid: Optional[str] = None, user_id: Optional[uuid.UUID] = None):
+        """ 동기 컨텍스트(ORM 이벤트)용 무효화 - 로컬 캐시는 즉시, Redis는 태스크로 제거 """
+        self._forget(firebase_uid, user_id)
+        if self.redis_enabled:
+            try:
+                asyncio.get_running_loop().create_task(self.invalidate(firebase_uid, user_id))
+            except RuntimeError:
+                pass
+
+    def _forget(self, firebase_uid, user_id) -> list[str]:
+        """ 로컬 항목 제거 + 진행 중인 로드가 결과를 캐싱하지 않도록 무효화 순번 기록 """
+        keys = self._keys(firebase_uid, user_id)
+        if keys:
+            self._invalidation_seq += 1
+        for key in keys:
+            self.local.pop(key)
+            if self._loading:
+                self._generations[key] = self._invalidation_seq
+        return keys
+
+    def _keys(self, firebase_uid, user_id) -> list[str]:
+        keys = []
+        if firebase_uid:
+            keys.append(f"uid:{firebase_uid}")
+        if user_id:
+            keys.append(f"id:{user_id}")
+        return keys
+
+    def stats(self) -> dict:
+        """ 캐시 통계 (로컬 hit/miss, Redis hit, DB 로드 횟수) """
+        local = self.local.stats()
+        lookups = local["hits"] + local["misses"]
+        return {
+            **local,
+            "redis_hits": self.redis_hits,
+            "db_loads": self.db_loads,
+            # 로컬 또는 Redis에서 처리되어 DB를 거치지 않은 비율
+            "hit_rate": (lookups - self.db_loads) / lookups if lookups else 0.0,
+        }
+
+
+# 프로세스 전역 사용자 프로필 캐시
+user_profile_cache = UserProfileCache(
+    maxsize=settings.USER_CACHE_SIZE,
+    ttl=settings.USER_CACHE_TTL_SECONDS,
+    redis_enabled=settings.USER_CACHE_REDIS_ENABLED,
+    redis_ttl=settings.USER_CACHE_REDIS_TTL_SECONDS,
+    singleflight_redis=settings.SINGLEFLIGHT_REDIS_ENABLED,
+)
+REGISTRY.track_cache("user_profile", user_profile_cache.stats)
+
+async def _load_profile(*criteria, read_uid: Optional[str] = None) -> Optional[dict]:
+    """ read_uid가 있으면 읽기 라우터(replica 가능), 없으면 primary에서 조회 """
+    async with get_session_router().read_session(read_uid) if read_uid else AsyncSessionLocal() as db:
+        user = (await db.execute(select(User).where(*criteria))).scalars().first()
+        return user_to_profile(user) if user else None
+
+async def get_user_profile_by_uid(firebase_uid: str) -> Optional[dict]:
+    """ firebase_uid로 삭제되지 않은 사용자 프로필 조회 (캐시 우선) """
+    return await user_profile_cache.get(
+        f"uid:{firebase_uid}",
+        # is_deleted 조건이 있어야 uq_users_firebase_uid_live 부분 인덱스를 사용
+        lambda: _load_profile(User.firebase_uid == firebase_uid, User.is_deleted == False, read_uid=firebase_uid),
+    )
+
+async def get_user_profile_by_id(user_id: uuid.UUID) -> Optional[dict]:
+    """ users.id로 사용자 프로필 조회 (캐시 우선, refresh 경로이므로 primary에서 조회) """
+    return await user_profile_cache.get(
+        f"id:{user_id}", lambda: _load_profile(User.id == user_id)
+    )
+
+async def _update_user(db, user_id: uuid.UUID, revoke_sessions: bool = False, **values) -> Optional[str]:
+    """ 사용자 행을 갱신하고 캐시를 무효화 (firebase_uid 반환, 사용자가 없으면 None)
+
+    revoke_sessions이면 같은 트랜잭션에서 refresh token을 폐기하고,
+    커밋 후 이미 발급된 access token도 모든 워커에서 폐기합니다.
+    """
+    result = await db.execute(
+        update(User).where(User.id == user_id).values(**values).returning(User.firebase_uid)
+    )
+    firebase_uid = result.scalar_one_or_none()
+    # 변경된 사용자 본인의 다음 프로필 조회가 지연된 replica 값을 캐시에 넣지 않도록
+    track_write(db, firebase_uid)
+    if revoke_sessions and firebase_uid:
+        await db.execute(
+            update(RefreshToken)
+            .where(RefreshToken.user_id == user_id, RefreshToken.revoked == False)
+            .values(revoked=True)
+        )
+    await db.commit()
+    await user_profile_cache.invalidate(firebase_uid=firebase_uid, user_id=user_id)
+    if revoke_sessions and firebase_uid:
+        await token_revocation.revoke_user(firebase_uid)
+    return firebase_uid
+
+async def change_user_role(db, user_id: uuid.UUID, role: str) -> Optional[str]:
+    """ 사용자 권한 변경 """
+    return await _update_user(db, user_id, role=role)
+
+async def suspend_user(db, user_id: uuid.UUID) -> Optional[str]:
+    """ 사용자 계정 정지 (기존 세션 즉시 종료) """
+    return await _update_user(db, user_id, revoke_sessions=True, is_suspended=True, suspended_at=datetime.now(timezone.utc))
+
+async def delete_user(db, user_id: uuid.UUID) -> Optional[str]:
+    """ 사용자 계정 삭제 (soft delete, 기존 세션 즉시 종료) """
+    return await _update_user(
+        db, user_id, revoke_sessions=True, is_deleted=True, is_active=False, deleted_at=datetime.now(timezone.utc)
+    )
+
+# ORM 세션을 통한 User 수정/삭제도 캐시를 무효화 (bulk update()는 위 함수들을 사용)
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _invalidate_on_user_write(mapper, connection, target):
+    user_profile_cache.invalidate_local(firebase_uid=target.firebase_uid, user_id=target.id)
@@ -0,0 +1,69 @@
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+
+class ExpiringCache:
+    """ ✅ 항목마다 만료 시각(epoch 초)을 갖는 LRU 캐시
+
+    토큰처럼 만료 시각(exp)이 정해진 값을 캐싱하는 데 사용합니다.
+    maxsize를 넘으면 가장 오래 사용되지 않은 항목부터 제거하고,
+    만료된 항목은 조회 시점에 제거합니다.
+    이벤트 루프 스레드에서만 접근한다는 전제이므로 락을 사용하지 않습니다.
+    """
+
+    def __init__(self, maxsize: int, clock: Callable[[], float] = time.time):
+        self.maxsize = maxsize
+        self._clock = clock
+        self._data: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        """ 캐시 조회 (만료되었거나 없으면 default 반환) """
+        entry = self._data.get(key)
+        if entry is None:
+            self.misses += 1
+            return default
+        expires_at, value = entry
+        if expires_at <= self._clock():
+            del self._data[key]
+            self.misses += 1
+            return default
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any, expires_at: float) -> None:
+        """ expires_at(epoch 초)까지 유효한 항목 저장 """
+        if expires_at <= self._clock():
+            return
+        self._data[key] = (expires_at, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        entry = self._data.pop(key, None)
+        return default if entry is None else entry[1]
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self) -> dict:
+        """ 캐시 통계 (hit/miss 카운터, 현재 크기) """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hit_rate,
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+        }
@@ -0,0 +1,54 @@
+import hashlib
+from typing import Callable
+
+from fastapi import Request, Response
+
+
+def make_etag(*parts) -> str:
+    """ 리소스 버전(종류, id, updated_at 등)으로 만든 weak ETag
+
+    같은 버전이면 응답 내용이 같으므로 본문을 직렬화/해시하지 않고 버전만으로 태그를 만듭니다.
+    압축 등으로 바이트가 달라져도 같은 표현이므로 weak 태그를 사용합니다.
+    """
+    digest = hashlib.blake2b("|".join(map(str, parts)).encode(), digest_size=12).hexdigest()
+    return f'W/"{digest}"'
+
+
+def _opaque_tag(tag: str) -> str:
+    """ weak 비교용 태그 값 (W/ 접두사 제거) """
+    return tag[2:] if tag.startswith("W/") else tag
+
+
+class ConditionalGet:
+    """ ✅ 조건부 GET(If-None-Match) 처리 의존성
+
+    라우트는 리소스 버전으로 ETag를 만들고 respond()에 응답 생성 함수를 넘깁니다.
+    클라이언트가 보낸 태그와 일치하면 응답 본문을 만들지 않고 304를 반환합니다.
+
+        @router.get("/items/{id}")
+        async def get_item(id, conditional: ConditionalGet = Depends()):
+            item = await load(id)
+            return conditional.respond(make_etag("item", id, item["updated_at"]), lambda: success_response(item))
+    """
+
+    def __init__(self, request: Request):
+        header = request.headers.get("if-none-match")
+        self.if_none_match = {_opaque_tag(tag.strip()) for tag in header.split(",")} if header else set()
+
+    def matches(self, etag: str) -> bool:
+        return "*" in self.if_none_match or _opaque_tag(etag) in self.if_none_match
+
+    def respond(
+        self,
+        etag: str,
+        build: Callable[[], Response],
+        cache_control: str = "private, no-cache",
+    ) -> Response:
+        """ 태그가 일치하면 304, 아니면 build()로 만든 응답에 ETag를 붙여 반환 """
+        # 캐시는 가지되 매번 재검증하도록 (사용자별 응답이므로 공유 캐시에는 저장하지 않음)
+        headers = {"ETag": etag, "Cache-Control": cache_control}
+        if self.matches(etag):
+            return Response(status_code=304, headers=headers)
+        response = build()
+        response.headers.update(headers)
+        return response
@@ -1,52 +1,179 @@
-import os
-from pydantic_settings import BaseSettings
-from dotenv import load_dotenv
-
-# .env 파일 강제 로드
-load_dotenv()
+from typing import Literal, Optional
+from pydantic import Field, field_validator, model_validator
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 class Settings(BaseSettings):
     """
         환경 변수를 관리하는 설정 클래스
+        (클래스 정의 시점이 아니라 Settings() 생성 시점에 환경 변수와 .env를 읽음)
     """
-    APP_NAME: str = os.getenv("APP_NAME", "Doggy Backend")
-    APP_VERSION: str = os.getenv("APP_VERSION", "1.0.0")
-    DEBUG: bool = os.getenv("DEBUG", "False").lower() in ("true", "1")
+    APP_NAME: str = "Doggy Backend"
+    APP_VERSION: str = "1.0.0"
+    DEBUG: bool = False
+
+    # 로깅 설정
+    LOG_LEVEL: str = "INFO"
+    LOG_JSON: bool = True  # JSON 한 줄 로그 출력 여부
+    LOG_SAMPLE_RATE: float = 1.0  # 성공 요청 로그 샘플링 비율 (0.0 ~ 1.0)
+    LOG_SLOW_REQUEST_MS: float = 1000.0  # 이 시간 이상 걸린 요청은 항상 로깅
+    METRICS_ENABLED: bool = True  # /metrics 및 요청 메트릭 수집
+    # /metrics 접근 제어 (둘 중 하나를 만족해야 함, 프록시 뒤에서는 클라이언트 IP가 프록시이므로 토큰 사용)
+    METRICS_TOKEN: Optional[str] = None  # 수집기가 보낼 Authorization: Bearer 토큰
+    METRICS_ALLOWED_IPS: str = '["127.0.0.1", "::1"]'  # 허용할 클라이언트 IP/CIDR 목록 (JSON)
+    SQL_ECHO: bool = False  # SQLAlchemy SQL 로그 출력 (디버그용)
 
     # Firebase 설정
-    FIREBASE_PROJECT_ID: str = os.getenv("FIREBASE_PROJECT_ID")
-    FIREBASE_PRIVATE_KEY_ID: str = os.getenv("FIREBASE_PRIVATE_KEY_ID")
-    FIREBASE_PRIVATE_KEY: str = os.getenv("FIREBASE_PRIVATE_KEY").replace('\\n', '\n')  # Key 값 처리
-    FIREBASE_CLIENT_EMAIL: str = os.getenv("FIREBASE_CLIENT_EMAIL")
-    FIREBASE_CLIENT_ID: str = os.getenv("FIREBASE_CLIENT_ID")
-    FIREBASE_CREDENTIALS: str = os.getenv("FIREBASE_CREDENTIALS")
-
-    # Supabase 설정
-    USER = os.getenv("user")
-    PASSWORD = os.getenv("password")
-    HOST = os.getenv("host")
-    PORT = os.getenv("port")
-    DBNAME = os.getenv("dbname")
-    
-    DATABASE_URL: str = f"postgresql+psycopg2://{USER}:{PASSWORD}@{HOST}:{PORT}/{DBNAME}?sslmode=require"
-    SUPABASE_KEY: str = os.getenv("SUPABASE_KEY")
+    FIREBASE_PROJECT_ID: Optional[str] = None
+    FIREBASE_PRIVATE_KEY_ID: Optional[str] = None
+    FIREBASE_PRIVATE_KEY: Optional[str] = None
+    FIREBASE_CLIENT_EMAIL: Optional[str] = None
+    FIREBASE_CLIENT_ID: Optional[str] = None
+    FIREBASE_CREDENTIALS: Optional[str] = None
+    FIREBASE_VERIFY_WORKERS: int = 4  # 토큰 검증 스레드 수
+    FIREBASE_TOKEN_CACHE_SIZE: int = 10000
+    FIREBASE_CERT_REFRESH_SECONDS: int = 3600  # 인증서 갱신 주기
+
+    # Supabase 설정 (접속 정보는 소문자 환경 변수 user/password/host/port/dbname)
+    USER: Optional[str] = Field(None, validation_alias="user")
+    PASSWORD: Optional[str] = Field(None, validation_alias="password")
+    HOST: Optional[str] = Field(None, validation_alias="host")
+    PORT: Optional[str] = Field(None, validation_alias="port")
+    DBNAME: Optional[str] = Field(None, validation_alias="dbname")
+
+    # 지정하지 않으면 위 접속 정보로 구성
+    DATABASE_URL: Optional[str] = None
+    # asyncpg 드라이버용 접속 문자열 (asyncpg는 sslmode 대신 ssl 파라미터 사용)
+    ASYNC_DATABASE_URL: Optional[str] = None
+    SUPABASE_KEY: Optional[str] = None
+
+    # DB 커넥션 풀 설정
+    # queue: 직접 연결/session pooler(5432)용 애플리케이션 풀
+    # null: Supabase transaction pooler(6543)/pgbouncer용 - 풀을 쓰지 않고 prepared statement 캐시 비활성화
+    DB_POOL_MODE: Literal["queue", "null"] = "queue"
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: int = 30
+    DB_POOL_RECYCLE_SECONDS: int = 1800  # 이보다 오래된 연결은 체크아웃 시 교체 (서버/방화벽 idle timeout보다 짧게)
+    DB_POOL_LIFO: bool = True  # 최근 반납된 연결부터 사용 (한가할 때 남는 연결이 recycle로 정리됨)
+    DB_POOL_PRE_PING: bool = False  # 체크아웃마다 ping (꺼져 있으면 백그라운드 상태 확인으로 대체)
+    DB_HEALTH_CHECK_SECONDS: float = 30.0  # 백그라운드 DB 상태 확인 주기
+
+    # 읽기 전용 replica 설정 (읽기 의존성은 지연이 작은 replica를 사용하고, 없으면 primary)
+    DB_REPLICA_URLS: str = "[]"  # asyncpg 접속 문자열 목록 (JSON)
+    DB_REPLICA_MAX_LAG_SECONDS: float = 5.0  # 이보다 지연된 replica는 사용하지 않음
+    DB_REPLICA_CHECK_SECONDS: float = 2.0  # replica 지연 확인 주기
+    DB_READ_YOUR_WRITES_SECONDS: float = 10.0  # 커밋 후 이 시간 동안 같은 사용자의 읽기는 primary
 
     # JWT 설정
-    JWT_SECRET_KEY: str = os.getenv("JWT_SECRET_KEY", "your_secret_key")
-    JWT_ALGORITHM: str = os.getenv("JWT_ALGORITHM", "HS256")
-    ACCESS_TOKEN_EXPIRE_MINUTES: int = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", 15))
-    REFRESH_TOKEN_EXPIRE_DAYS: int = int(os.getenv("REFRESH_TOKEN_EXPIRE_DAYS", 7))
+    JWT_SECRET_KEY: str = "your_secret_key"
+    JWT_ALGORITHM: str = "HS256"
+    ACCESS_TOKEN_EXPIRE_MINUTES: int = 15
+    REFRESH_TOKEN_EXPIRE_DAYS: int = 7
+    JWT_CACHE_SIZE: int = 10000  # 검증된 토큰 캐시 크기
+    # access token 비대칭 서명 키 (JSON {"kid": "PEM 개인 키 경로"}, 비어 있으면 JWT_SECRET_KEY로 HS256 서명)
+    JWT_SIGNING_KEYS: str = "{}"
+    JWT_ACTIVE_KID: Optional[str] = None  # 새 토큰 서명에 사용할 kid (키가 하나면 생략 가능)
+    # 서명 키가 있을 때 kid 없는 HS256 토큰 허용 여부 (키 도입 직후 access token 만료 시간 동안만 켜기)
+    JWT_ACCEPT_LEGACY_HS256: bool = False
+    JWKS_CACHE_SECONDS: int = 300  # /.well-known/jwks.json Cache-Control max-age
+    REFRESH_TOKEN_SWEEP_INTERVAL_SECONDS: int = 600  # 만료 토큰 정리 주기
+    REFRESH_TOKEN_SWEEP_BATCH_SIZE: int = 1000  # 한 번에 삭제할 행 수
 
     # Redis 설정
-    REDIS_HOST: str = os.getenv("REDIS_HOST", "localhost")
-    REDIS_PORT: int = int(os.getenv("REDIS_PORT", 6379))
-    REDIS_DB: int = int(os.getenv("REDIS_DB", 0))
+    REDIS_HOST: str = "localhost"
+    REDIS_PORT: int = 6379
+    REDIS_DB: int = 0
+    REDIS_URL: Optional[str] = None  # 지정하지 않으면 REDIS_HOST/PORT/DB로 구성
+
+    # Rate Limit 설정 (정책 형식: "요청 수/초", 예: "10/10" = 10초에 10개)
+    RATE_LIMIT_ENABLED: bool = False
+    RATE_LIMIT_DEFAULT: str = "10/10"  # IP 기준 기본 정책
+    RATE_LIMIT_USER: str = "60/60"  # 인증된 사용자 기준 정책
+    RATE_LIMIT_ROUTES: str = '{"/api/v1/auth/login": "5/60"}'  # 경로 prefix별 정책 (JSON)
+    RATE_LIMIT_LOCAL_BATCH: int = 5  # Redis에서 한 번에 가져올 토큰 수
+
+    # 사용자 프로필 캐시 설정 (프로세스 내 LRU + 선택적 Redis 2차 캐시)
+    USER_CACHE_SIZE: int = 10000
+    USER_CACHE_TTL_SECONDS: int = 60
+    USER_CACHE_REDIS_ENABLED: bool = False
+    USER_CACHE_REDIS_TTL_SECONDS: int = 300
+
+    # access token 즉시 폐기 설정 (워커 간 동기화는 Redis pub/sub, 끄면 프로세스 내 브로커)
+    REVOCATION_REDIS_ENABLED: bool = False
+    REVOCATION_CHANNEL: str = "auth:revocations"
+    REVOCATION_RETRY_SECONDS: float = 5.0  # 동기화 연결이 끊겼을 때 재구독 대기 시간
+
+    # 동시 중복 요청 병합(single-flight) 설정 (프로세스 내 병합 + 선택적 Redis 락으로 워커 간 병합)
+    SINGLEFLIGHT_REDIS_ENABLED: bool = False
+    SINGLEFLIGHT_LOCK_TTL_MS: int = 5000  # 워커 간 리더 락 유지 시간 (리더가 죽어도 이 시간 뒤 해제)
+    SINGLEFLIGHT_RESULT_TTL_MS: int = 1000  # 리더 결과를 다른 워커가 가져갈 수 있는 시간
+    SINGLEFLIGHT_POLL_MS: int = 20  # 다른 워커의 리더 결과 확인 간격
+
+    # 근처 유치원 검색 설정 (프로세스 내 공간 인덱스)
+    SPATIAL_INDEX_ENABLED: bool = True
+    SPATIAL_INDEX_REFRESH_SECONDS: int = 30  # 증분 갱신 주기
+    SPATIAL_INDEX_REFRESH_LAG_SECONDS: int = 60  # 워터마크 이전 재조회 구간
+    SPATIAL_INDEX_BATCH_SIZE: int = 5000  # 갱신 시 한 번에 읽을 행 수
+    NEARBY_MAX_RADIUS_M: float = 20000.0  # 근처 검색 최대 반경 (미터)
+
+    # 유치원 일괄 등록 설정
+    IMPORT_BATCH_SIZE: int = 5000  # 검증/COPY 단위 행 수
+    IMPORT_MAX_ERRORS: int = 1000  # 결과에 상세히 담을 최대 오류 행 수
+
+    # 관리자 내보내기 설정
+    EXPORT_BATCH_SIZE: int = 1000  # 서버 사이드 커서에서 한 번에 읽을 행 수
+
+    # 삭제 행 보관 설정 (migrations/005 적용 후 활성화)
+    ARCHIVE_ENABLED: bool = False
+    ARCHIVE_RETENTION_DAYS: int = 30  # 삭제 후 이 기간이 지난 행을 보관 테이블로 이동
+    ARCHIVE_BATCH_SIZE: int = 1000  # 한 트랜잭션에서 옮길 행 수
+    ARCHIVE_MAX_BATCHES: int = 100  # 한 번 실행에서 테이블마다 처리할 최대 배치 수
+    ARCHIVE_INTERVAL_SECONDS: int = 3600  # 보관 작업 주기
+
+    # 응답 압축 설정 (gzip/deflate, 수준별 비용은 benchmarks/compression_levels.py)
+    COMPRESSION_ENABLED: bool = True
+    COMPRESSION_MIN_SIZE: int = 1024  # 이보다 작은 단일 본문은 압축하지 않음 (바이트)
+    COMPRESSION_LEVEL: int = 6
+    COMPRESSION_CACHED_PATHS: str = '["/openapi.json"]'  # 본문과 압축 결과를 재사용할 고정 응답 경로 (JSON)
+
+    # 시작 시 외부 의존성 워밍업 / 준비 상태 확인 설정
+    DB_WARMUP_CONNECTIONS: int = 2  # 시작 시 미리 열어둘 커넥션 수
+    STARTUP_WARMUP_TIMEOUT_SECONDS: float = 10.0  # 의존성별 워밍업 제한 시간
+    READINESS_TIMEOUT_SECONDS: float = 2.0  # /ready 의존성별 확인 제한 시간
+
+    @field_validator("FIREBASE_PRIVATE_KEY")
+    @classmethod
+    def _unescape_private_key(cls, value: Optional[str]) -> Optional[str]:
+        """ 환경 변수의 \\n을 실제 줄바꿈으로 변환 """
+        return value.replace("\\n", "\n") if value else value
+
+    def missing_database_settings(self) -> list[str]:
+        """ 비어 있는 DB 접속 정보 (환경 변수 이름) """
+        parts = {"user": self.USER, "password": self.PASSWORD, "host": self.HOST, "port": self.PORT, "dbname": self.DBNAME}
+        return [name for name, value in parts.items() if not value]
+
+    @model_validator(mode="after")
+    def _build_urls(self) -> "Settings":
+        """ 접속 문자열을 직접 지정하지 않으면 개별 접속 정보로 구성
+
+        접속 정보가 하나라도 비어 있으면 구성하지 않고 None으로 두며,
+        엔진을 처음 만들 때 빠진 설정을 알려주는 오류가 발생합니다 (app/db/database.py).
+        """
+        if not self.missing_database_settings():
+            credentials = f"{self.USER}:{self.PASSWORD}@{self.HOST}:{self.PORT}/{self.DBNAME}"
+            if not self.DATABASE_URL:
+                self.DATABASE_URL = f"postgresql+psycopg2://{credentials}?sslmode=require"
+            if not self.ASYNC_DATABASE_URL:
+                self.ASYNC_DATABASE_URL = f"postgresql+asyncpg://{credentials}?ssl=require"
+        if not self.REDIS_URL:
+            self.REDIS_URL = f"redis://{self.REDIS_HOST}:{self.REDIS_PORT}/{self.REDIS_DB}"
+        return self
 
     # Pydantic v2 - `Config` 제거 & `model_config`만 사용
-    model_config = {
-        "env_file": ".env",
-        "extra": "allow",  # 불필요한 에러 방지
-        "ignored_types": (str,)  # 문자열 타입 필드를 무시
-    }
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        extra="allow",  # 불필요한 에러 방지
+        case_sensitive=True,  # user/USER 처럼 대소문자만 다른 시스템 환경 변수와 구분
+    )
 # settings 객체 생성
 settings = Settings()
@@ -0,0 +1,112 @@
+import math
+
+# 유치원 좌표 셀 정밀도 (6자리 ≈ 1.2km x 0.6km)
+GEOHASH_PRECISION = 6
+
+EARTH_RADIUS_M = 6_371_008.8
+
+_BASE32 = "0123456789bcdefghjkmnpqrstuvwxyz"
+_DECODE = {char: index for index, char in enumerate(_BASE32)}
+
+
+def _grid_bits(precision: int) -> tuple[int, int]:
+    """ 정밀도별 (위도 비트 수, 경도 비트 수) - 경도부터 번갈아 채우므로 경도가 같거나 1비트 많음 """
+    return (precision * 5) // 2, (precision * 5 + 1) // 2
+
+
+def cell_index(latitude: float, longitude: float, precision: int = GEOHASH_PRECISION) -> tuple[int, int]:
+    """ 좌표가 속한 geohash 셀의 격자 좌표 (row, col)
+
+    geohash 셀은 위도/경도를 각각 2^bits 등분한 격자와 같으므로
+    프로세스 내 인덱스는 문자열 대신 정수 격자 좌표로 셀을 다룹니다.
+    """
+    lat_bits, lon_bits = _grid_bits(precision)
+    row = int((latitude + 90.0) / 180.0 * (1 << lat_bits))
+    col = int((longitude + 180.0) / 360.0 * (1 << lon_bits))
+    return min(max(row, 0), (1 << lat_bits) - 1), min(max(col, 0), (1 << lon_bits) - 1)
+
+
+def cell_geohash(row: int, col: int, precision: int = GEOHASH_PRECISION) -> str:
+    """ 격자 좌표를 geohash 문자열로 변환 (경도/위도 비트를 번갈아 배치) """
+    lat_bits, lon_bits = _grid_bits(precision)
+    value = 0
+    for i in range(precision * 5):
+        if i % 2 == 0:
+            lon_bits -= 1
+            value = (value << 1) | ((col >> lon_bits) & 1)
+        else:
+            lat_bits -= 1
+            value = (value << 1) | ((row >> lat_bits) & 1)
+    chars = []
+    for _ in range(precision):
+        chars.append(_BASE32[value & 31])
+        value >>= 5
+    return "".join(reversed(chars))
+
+
+def encode(latitude: float, longitude: float, precision: int = GEOHASH_PRECISION) -> str:
+    """ ✅ 위도/경도를 geohash 문자열로 인코딩 """
+    return cell_geohash(*cell_index(latitude, longitude, precision), precision)
+
+
+def decode_bbox(geohash: str) -> tuple[float, float, float, float]:
+    """ geohash 셀의 경계 (min_lat, min_lon, max_lat, max_lon) """
+    lat_range = [-90.0, 90.0]
+    lon_range = [-180.0, 180.0]
+    even = True
+    for char in geohash:
+        value = _DECODE[char]
+        for shift in range(4, -1, -1):
+            bit = (value >> shift) & 1
+            target = lon_range if even else lat_range
+            mid = (target[0] + target[1]) / 2
+            target[1 - bit] = mid
+            even = not even
+    return lat_range[0], lon_range[0], lat_range[1], lon_range[1]
+
+
+def cell_size(precision: int = GEOHASH_PRECISION) -> tuple[float, float]:
+    """ 정밀도별 셀 크기 (위도 높이, 경도 너비) - 도 단위 """
+    lat_bits, lon_bits = _grid_bits(precision)
+    return 180.0 / (1 << lat_bits), 360.0 / (1 << lon_bits)
+
+
+def haversine_m(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """ 두 좌표 사이의 대원 거리 (미터) """
+    phi1 = math.radians(lat1)
+    phi2 = math.radians(lat2)
+    d_phi = phi2 - phi1
+    d_lambda = math.radians(lon2 - lon1)
+    a = math.sin(d_phi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(d_lambda / 2) ** 2
+    return 2 * EARTH_RADIUS_M * math.asin(math.sqrt(a))
+
+
+def covering_cell_indexes(
+    latitude: float, longitude: float, radius_m: float, precision: int = GEOHASH_PRECISION
+) -> list[tuple[int, int]]:
+    """ 중심에서 radius_m 이내를 모두 덮는 셀의 격자 좌표 목록 (경계 사각형 기준) """
+    lat_delta = math.degrees(radius_m / EARTH_RADIUS_M)
+    # 고위도에서 경도 1도의 거리가 줄어드는 것을 보정 (극 근처는 전체 경도)
+    cos_lat = math.cos(math.radians(min(89.9, abs(latitude) + lat_delta)))
+    lon_delta = min(180.0, math.degrees(radius_m / (EARTH_RADIUS_M * cos_lat)))
+
+    min_row, _ = cell_index(max(-90.0, latitude - lat_delta), longitude, precision)
+    max_row, _ = cell_index(min(90.0, latitude + lat_delta), longitude, precision)
+    _, lon_bits = _grid_bits(precision)
+    columns = 1 << lon_bits
+    if lon_delta >= 180.0:
+        col_range = range(columns)
+    else:
+        # 날짜 변경선을 넘는 경우 경도를 감아서 처리
+        first = int(math.floor((longitude - lon_delta + 180.0) / 360.0 * columns))
+        last = int(math.floor((longitude + lon_delta + 180.0) / 360.0 * columns))
+        col_range = [col % columns for col in range(first, last + 1)]
+    return [(row, col) for row in range(min_row, max_row + 1) for col in col_range]
+
+
+def covering_cells(latitude: float, longitude: float, radius_m: float, precision: int = GEOHASH_PRECISION) -> set[str]:
+    """ 중심에서 radius_m 이내를 모두 덮는 geohash 셀 집합 (DB 셀 컬럼 조회용) """
+    return {
+        cell_geohash(row, col, precision)
+        for row, col in covering_cell_indexes(latitude, longitude, radius_m, precision)
+    }
@@ -0,0 +1,102 @@
+import json
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519, rsa
+from jwt.algorithms import ECAlgorithm, OKPAlgorithm, RSAAlgorithm
+
+from app.utils.config import settings
+
+# 키 종류별 서명 알고리즘과 JWK 변환기
+_ALGORITHMS = (
+    (rsa.RSAPrivateKey, "RS256", RSAAlgorithm),
+    (ec.EllipticCurvePrivateKey, "ES256", ECAlgorithm),
+    (ed25519.Ed25519PrivateKey, "EdDSA", OKPAlgorithm),
+)
+
+
+@dataclass(frozen=True)
+class SigningKey:
+    """ kid가 붙은 access token 서명 키 (개인 키 + 공개 키) """
+    kid: str
+    algorithm: str
+    private_key: Any
+    public_key: Any
+
+    def to_jwk(self) -> dict:
+        """ 공개 키를 JWK(dict)로 변환 """
+        converter = next(converter for _, algorithm, converter in _ALGORITHMS if algorithm == self.algorithm)
+        jwk = converter.to_jwk(self.public_key, as_dict=True)
+        return {**jwk, "kid": self.kid, "alg": self.algorithm, "use": "sig"}
+
+
+def load_signing_key(kid: str, pem: bytes) -> SigningKey:
+    """ PEM 개인 키를 읽어 키 종류에 맞는 알고리즘(RSA → RS256, P-256 → ES256, Ed25519 → EdDSA)으로 구성 """
+    private_key = serialization.load_pem_private_key(pem, password=None)
+    for key_type, algorithm, _ in _ALGORITHMS:
+        if isinstance(private_key, key_type):
+            break
+    else:
+        raise ValueError(f"지원하지 않는 JWT 서명 키 종류입니다 (kid={kid})")
+    if isinstance(private_key, rsa.RSAPrivateKey) and private_key.key_size < 2048:
+        raise ValueError(f"RSA 키는 2048비트 이상이어야 합니다 (kid={kid})")
+    if isinstance(private_key, ec.EllipticCurvePrivateKey) and not isinstance(private_key.curve, ec.SECP256R1):
+        raise ValueError(f"EC 키는 P-256만 지원합니다 (kid={kid})")
+    return SigningKey(kid=kid, algorithm=algorithm, private_key=private_key, public_key=private_key.public_key())
+
+
+class JWTKeySet:
+    """ ✅ access token 서명 키 집합 (키 교체 지원)
+
+    새 토큰은 활성 키(active)로 서명하고, 검증은 토큰 헤더의 kid로 키를 찾습니다.
+    키 교체 순서:
+      1) 새 키를 JWT_SIGNING_KEYS에 추가하여 배포 (JWKS에 먼저 공개되어 다른 서비스 캐시에 반영)
+      2) JWKS_CACHE_SECONDS 이후 JWT_ACTIVE_KID를 새 kid로 변경하여 배포
+      3) 이전 키로 서명한 토큰이 모두 만료된 뒤(ACCESS_TOKEN_EXPIRE_MINUTES) 이전 키 제거
+    """
+
+    def __init__(self, keys: list[SigningKey], active_kid: Optional[str] = None):
+        if not keys:
+            raise ValueError("JWT 서명 키가 없습니다")
+        self.keys = {key.kid: key for key in keys}
+        if active_kid is None and len(keys) == 1:
+            active_kid = keys[0].kid
+        if active_kid not in self.keys:
+            raise ValueError(f"JWT_ACTIVE_KID가 서명 키 목록에 없습니다: {active_kid}")
+        self.active = self.keys[active_kid]
+        # JWKS 응답 본문은 키 집합이 바뀔 때만 달라지므로 한 번만 인코딩
+        self.jwks_json = json.dumps({"keys": [key.to_jwk() for key in self.keys.values()]}).encode()
+
+    def get(self, kid: str) -> Optional[SigningKey]:
+        return self.keys.get(kid)
+
+
+def load_key_set(signing_keys: str, active_kid: Optional[str] = None) -> Optional[JWTKeySet]:
+    """ JSON {"kid": "PEM 개인 키 경로"} 설정으로 키 집합 구성 (비어 있으면 None = HS256 사용) """
+    paths = json.loads(signing_keys or "{}")
+    if not paths:
+        return None
+    keys = []
+    for kid, path in paths.items():
+        with open(path, "rb") as f:
+            keys.append(load_signing_key(kid, f.read()))
+    return JWTKeySet(keys, active_kid)
+
+
+# 프로세스 전역 서명 키 집합 (첫 사용 시 적재, 키 교체 설정은 재시작 시 반영)
+_key_set: Optional[JWTKeySet] = None
+_key_set_loaded = False
+
+def get_key_set() -> Optional[JWTKeySet]:
+    """ 설정된 비대칭 서명 키 집합 반환 (설정이 없으면 None) """
+    global _key_set, _key_set_loaded
+    if not _key_set_loaded:
+        _key_set = load_key_set(settings.JWT_SIGNING_KEYS, settings.JWT_ACTIVE_KID)
+        _key_set_loaded = True
+    return _key_set
+
+def set_key_set(key_set: Optional[JWTKeySet]):
+    """ 서명 키 집합 교체 (테스트 / 직접 구성한 키 사용) """
+    global _key_set, _key_set_loaded
+    _key_set, _key_set_loaded = key_set, True
@@ -0,0 +1,39 @@
+import jwt
+
+
+class AccessTokenVerifier:
+    """ ✅ 다른 서비스에서 이 서버가 발급한 access token을 로컬 검증하는 헬퍼
+
+    /.well-known/jwks.json의 공개 키를 cache_seconds 동안 캐싱하므로 요청마다
+    /me 호출(네트워크 왕복 + DB 조회) 없이 서명/만료만 확인합니다.
+    캐시에 없는 kid(키 교체 직후)가 오면 JWKS를 한 번 다시 받습니다.
+    이 모듈은 app 설정에 의존하지 않으므로 PyJWT[crypto]만 있으면 그대로 사용할 수 있습니다.
+
+    로그아웃/정지로 폐기된 토큰은 이 서버에서만 즉시 거부되고,
+    다른 서비스에서는 exp(기본 15분)까지 유효합니다.
+
+        verifier = AccessTokenVerifier("https://api.example.com/.well-known/jwks.json")
+        payload = verifier.verify(token)  # {"uid": ..., "role": ..., "exp": ..., "iat": ..., "jti": ...}
+
+    JWKS 조회는 블로킹 I/O이므로 async 서비스는 시작 시 warm_up()을 호출해 두거나
+    asyncio.to_thread(verifier.verify, token)으로 호출합니다.
+    """
+
+    def __init__(self, jwks_url: str, cache_seconds: int = 300, timeout: int = 5, leeway: float = 0):
+        self.leeway = leeway
+        self._client = jwt.PyJWKClient(jwks_url, cache_jwk_set=True, lifespan=cache_seconds, timeout=timeout)
+
+    def warm_up(self):
+        """ JWKS를 미리 받아 캐시에 저장 """
+        self._client.get_jwk_set(refresh=True)
+
+    def verify(self, token: str) -> dict:
+        """ 서명/만료를 검증하고 payload 반환 (실패 시 jwt.PyJWTError) """
+        signing_key = self._client.get_signing_key_from_jwt(token)
+        return jwt.decode(
+            token,
+            signing_key.key,
+            algorithms=[signing_key.algorithm_name],
+            leeway=self.leeway,
+            options={"require": ["exp", "uid", "role"]},
+        )
@@ -0,0 +1,122 @@
+import atexit
+import json
+import logging
+import queue
+import time
+from contextvars import ContextVar
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+
+from sqlalchemy import event
+
+# 요청 단위 컨텍스트 (LoggingMiddleware에서 설정)
+request_id_var: ContextVar[Optional[str]] = ContextVar("request_id", default=None)
+db_timer_var: ContextVar[Optional["DBTimer"]] = ContextVar("db_timer", default=None)
+
+# JSON 로그에 포함할 extra 필드
+LOG_FIELDS = (
+    "request_id", "method", "route", "path", "status",
+    "latency_ms", "db_ms", "db_queries", "client",
+)
+
+_listener: Optional[QueueListener] = None
+
+
+class DBTimer:
+    """ 요청 하나에서 실행된 SQL 문장 수와 누적 실행 시간 """
+    __slots__ = ("seconds", "queries")
+
+    def __init__(self):
+        self.seconds = 0.0
+        self.queries = 0
+
+
+class RequestContextFilter(logging.Filter):
+    """ 로그 레코드에 현재 요청 ID를 기록 (레코드 생성 스레드에서 실행) """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if not hasattr(record, "request_id"):
+            record.request_id = request_id_var.get()
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    """ 로그 레코드를 JSON 한 줄로 변환 (백그라운드 writer 스레드에서 실행) """
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": round(record.created, 6),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        for field in LOG_FIELDS:
+            value = getattr(record, field, None)
+            if value is not None:
+                entry[field] = value
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class NonBlockingQueueHandler(QueueHandler):
+    """ 레코드를 큐에 넣기만 하는 핸들러
+
+    기본 QueueHandler.prepare()는 호출 스레드에서 메시지를 포맷하지만,
+    같은 프로세스의 writer 스레드로만 전달하므로 포맷은 writer 스레드에 맡깁니다.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+def setup_logging(level: str = "INFO", json_logs: bool = True) -> None:
+    """ ✅ 루트 로거를 큐 기반 비동기 로깅으로 설정 (중복 호출 시 무시)
+
+    요청 처리 경로에서는 레코드를 큐에 넣기만 하고,
+    포맷과 stderr 출력은 QueueListener 스레드가 처리합니다.
+    """
+    global _listener
+    if _listener is not None:
+        return
+
+    stream_handler = logging.StreamHandler()
+    if json_logs:
+        stream_handler.setFormatter(JsonFormatter())
+    else:
+        stream_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s [%(request_id)s] %(message)s"))
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    queue_handler = NonBlockingQueueHandler(log_queue)
+    queue_handler.addFilter(RequestContextFilter())
+
+    root = logging.getLogger()
+    root.handlers[:] = [queue_handler]
+    root.setLevel(level)
+
+    _listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+    atexit.register(_listener.stop)
+
+
+def instrument_engine(engine) -> None:
+    """ 엔진에 SQL 실행 시간 측정 이벤트 등록 (요청별 DBTimer에 누적) """
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        started = conn.info["query_start"].pop()
+        timer = db_timer_var.get()
+        if timer is not None:
+            timer.seconds += time.perf_counter() - started
+            timer.queries += 1
+
+    @event.listens_for(engine, "handle_error")
+    def _handle_error(exception_context):
+        # 실패한 문장은 after_cursor_execute가 호출되지 않으므로 시작 시각만 정리
+        conn = exception_context.connection
+        if conn is not None and conn.info.get("query_start"):
+            conn.info["query_start"].pop()
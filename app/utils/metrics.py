@@ -0,0 +1,237 @@
+import math
+from bisect import bisect_left
+from typing import Callable, Iterable, Optional
+
+# 기본 지연 시간 버킷 (초) - 100µs ~ 10s
+DEFAULT_BUCKETS = (
+    0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025,
+    0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labelnames: tuple, values: tuple, extra: str = "") -> str:
+    parts = [f'{name}="{_escape(value)}"' for name, value in zip(labelnames, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric:
+    """ 레이블별 값을 보관하는 메트릭 공통 클래스
+
+    값 갱신은 이벤트 루프 스레드에서만 일어난다는 전제로 락 없이 동작합니다.
+    (스레드 풀 작업의 소요 시간도 await 이후 루프 스레드에서 기록)
+    """
+    type_name = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: dict = {}
+        if not self.labelnames:
+            self._default = self._new_child()
+            self._children[()] = self._default
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def labels(self, *values):
+        """ 레이블 값에 해당하는 하위 메트릭 반환 (없으면 생성) """
+        child = self._children.get(values)
+        if child is None:
+            child = self._children[values] = self._new_child()
+        return child
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.type_name}"]
+        for values, child in sorted(self._children.items()):
+            lines.extend(self._render_child(values, child))
+        return lines
+
+    def _render_child(self, values, child) -> list[str]:
+        return [f"{self.name}{_format_labels(self.labelnames, values)} {_format_value(child.value)}"]
+
+
+class _Value:
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0):
+        self.value += amount
+
+    def dec(self, amount: float = 1.0):
+        self.value -= amount
+
+    def set(self, value: float):
+        self.value = value
+
+
+class Counter(_Metric):
+    """ 단조 증가 카운터 """
+    type_name = "counter"
+
+    def _new_child(self):
+        return _Value()
+
+    def inc(self, amount: float = 1.0):
+        self._default.inc(amount)
+
+
+class Gauge(_Metric):
+    """ 증감 가능한 게이지 """
+    type_name = "gauge"
+
+    def _new_child(self):
+        return _Value()
+
+    def inc(self, amount: float = 1.0):
+        self._default.inc(amount)
+
+    def dec(self, amount: float = 1.0):
+        self._default.dec(amount)
+
+    def set(self, value: float):
+        self._default.set(value)
+
+
+class _HistogramValue:
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets: tuple):
+        self.buckets = buckets
+        # 버킷별 개수 (누적 아님, 마지막 칸은 +Inf)
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+class Histogram(_Metric):
+    """ 고정 버킷 히스토그램 """
+    type_name = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = (), buckets: tuple = DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        super().__init__(name, documentation, labelnames)
+
+    def _new_child(self):
+        return _HistogramValue(self.buckets)
+
+    def observe(self, value: float):
+        self._default.observe(value)
+
+    def _render_child(self, values, child) -> list[str]:
+        lines = []
+        cumulative = 0
+        for upper, count in zip(self.buckets + (math.inf,), child.counts):
+            cumulative += count
+            le = f'le="{_format_value(upper)}"'
+            lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, values, le)} {cumulative}")
+        labels = _format_labels(self.labelnames, values)
+        lines.append(f"{self.name}_sum{labels} {_format_value(child.sum)}")
+        lines.append(f"{self.name}_count{labels} {child.count}")
+        return lines
+
+
+class CallbackMetric:
+    """ scrape 시점에 콜백으로 값을 읽는 메트릭 (커넥션 풀 상태, 캐시 통계 등)
+
+    callback은 (레이블 값 튜플, 값) 목록을 반환합니다.
+    """
+
+    def __init__(self, name: str, documentation: str, type_name: str, labelnames: Iterable[str], callback: Callable):
+        self.name = name
+        self.documentation = documentation
+        self.type_name = type_name
+        self.labelnames = tuple(labelnames)
+        self.callback = callback
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.type_name}"]
+        for values, value in self.callback():
+            lines.append(f"{self.name}{_format_labels(self.labelnames, values)} {_format_value(value)}")
+        return lines
+
+
+class Registry:
+    """ ✅ 메트릭 레지스트리 (Prometheus text format 0.0.4로 출력) """
+
+    def __init__(self):
+        self._metrics: dict[str, object] = {}
+        self._caches: dict[str, Callable[[], dict]] = {}
+        # track_cache()로 등록된 캐시 통계
+        self.callback("cache_hits_total", "Cache hits", "counter", ("cache",), self._cache_stat("hits"))
+        self.callback("cache_misses_total", "Cache misses", "counter", ("cache",), self._cache_stat("misses"))
+        self.callback("cache_hit_ratio", "Cache hit ratio", "gauge", ("cache",), self._cache_stat("hit_rate"))
+        self.callback("cache_size", "Cached entries", "gauge", ("cache",), self._cache_stat("size"))
+
+    def register(self, metric):
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Iterable[str] = ()) -> Counter:
+        return self.register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Iterable[str] = ()) -> Gauge:
+        return self.register(Gauge(name, documentation, labelnames))
+
+    def histogram(self, name: str, documentation: str, labelnames: Iterable[str] = (), buckets: tuple = DEFAULT_BUCKETS) -> Histogram:
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def callback(self, name: str, documentation: str, type_name: str, labelnames: Iterable[str], callback: Callable) -> CallbackMetric:
+        return self.register(CallbackMetric(name, documentation, type_name, labelnames, callback))
+
+    def track_cache(self, cache_name: str, stats: Callable[[], dict]):
+        """ hits/misses/size를 가진 stats()의 캐시를 cache_* 메트릭으로 노출 """
+        self._caches[cache_name] = stats
+
+    def get(self, name: str) -> Optional[object]:
+        return self._metrics.get(name)
+
+    def _cache_stat(self, key: str):
+        return lambda: [((name,), stats()[key]) for name, stats in sorted(self._caches.items())]
+
+    def render(self) -> str:
+        lines = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+# 프로세스 전역 레지스트리
+REGISTRY = Registry()
+
+HTTP_REQUEST_DURATION = REGISTRY.histogram(
+    "http_request_duration_seconds", "HTTP request latency", ("method", "route", "status"),
+)
+HTTP_REQUESTS_IN_FLIGHT = REGISTRY.gauge(
+    "http_requests_in_flight", "HTTP requests currently being processed",
+)
+DB_POOL_CHECKOUT_DURATION = REGISTRY.histogram(
+    "db_pool_checkout_seconds", "Time spent waiting for a pooled DB connection", ("engine",),
+)
+FIREBASE_VERIFY_DURATION = REGISTRY.histogram(
+    "firebase_verify_seconds", "Firebase ID token verification time (cache misses)", ("result",),
+)
+JWT_VERIFY_DURATION = REGISTRY.histogram(
+    "jwt_verify_seconds", "Access token verification time (cache misses)", ("result",),
+)
@@ -0,0 +1,26 @@
+from typing import TYPE_CHECKING
+from app.utils.config import settings
+
+if TYPE_CHECKING:
+    import redis.asyncio as redis_asyncio
+
+# 프로세스 전역 Redis 클라이언트 (첫 사용 시 생성, 실제 연결은 첫 명령 실행 시점)
+redis_client = None
+
+def get_redis() -> "redis_asyncio.Redis":
+    """ ✅ 공용 Redis 클라이언트 반환 (settings.REDIS_URL 사용)
+
+    redis 패키지는 Redis를 쓰는 기능이 켜져 있을 때만 필요하므로 첫 사용 시 import합니다.
+    """
+    global redis_client
+    if redis_client is None:
+        import redis.asyncio as redis_asyncio
+        redis_client = redis_asyncio.from_url(settings.REDIS_URL, decode_responses=True)
+    return redis_client
+
+async def close_redis():
+    """ Redis 커넥션 풀 정리 """
+    global redis_client
+    if redis_client is not None:
+        await redis_client.aclose()
+        redis_client = None
@@ -1,22 +1,46 @@
+from typing import Any, Callable
 from fastapi.responses import JSONResponse
-from app.utils.dto import ResponseDTO
+from pydantic_core import to_json
 
-def success_response(data, msg: str = "Success") -> JSONResponse:
+class EnvelopeResponse(JSONResponse):
+    """ {code, msg, data} 응답 envelope을 pydantic-core로 한 번에 bytes 직렬화하는 응답 클래스
+
+    content가 이미 인코딩된 bytes이면 그대로 사용합니다.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            return content
+        return to_json(content)
+
+def encode_envelope(code: int, msg: str, data: Any = None) -> bytes:
+    """ 응답 envelope을 JSON bytes로 인코딩 (data 안의 pydantic 모델도 함께 직렬화) """
+    return to_json({"code": code, "msg": msg, "data": data})
+
+def prebuilt_response(data, msg: str = "Success", code: int = 200) -> Callable[[], EnvelopeResponse]:
+    """✅ 고정 응답용 팩토리
+    응답 본문은 한 번만 인코딩하고, 호출할 때마다 인코딩된 bytes로 새 응답 객체를 만듭니다.
+    (set_cookie 등 헤더 변경이 다른 요청에 영향을 주지 않도록 응답 객체는 공유하지 않음)
+    """
+    body = encode_envelope(code, msg, data)
+    return lambda: EnvelopeResponse(status_code=code, content=body)
+
+def success_response(data, msg: str = "Success") -> EnvelopeResponse:
     """✅ 성공 응답
     data: 응답 데이터
     msg: 응답 메시지
     """
-    return JSONResponse(
+    return EnvelopeResponse(
         status_code=200,
-        content=ResponseDTO(code=200, msg=msg, data=data).model_dump()
+        content=encode_envelope(200, msg, data)
     )
 
-def error_response(code: int, msg: str = "Error") -> JSONResponse:
+def error_response(code: int, msg: str = "Error") -> EnvelopeResponse:
     """❌ 실패 응답
     code: 응답 코드
     msg: 응답 메시지
     """
-    return JSONResponse(
+    return EnvelopeResponse(
         status_code=code,
-        content=ResponseDTO(code=code, msg=msg, data=None).model_dump()
+        content=encode_envelope(code, msg, None)
     )
@@ -0,0 +1,220 @@
+import asyncio
+import heapq
+import json
+import logging
+import time
+from typing import AsyncIterator, Callable, Optional
+
+from app.utils.config import settings
+from app.utils.metrics import REGISTRY
+from app.utils.redis_client import get_redis
+
+logger = logging.getLogger(__name__)
+
+
+class RevocationList:
+    """ ✅ 폐기된 access token 목록 (프로세스 내)
+
+    - 토큰 단위 (로그아웃): jti → 토큰 exp
+    - 사용자 단위 (정지/삭제): uid → 폐기 시각, 그 이전에 발급(iat)된 토큰 모두 폐기
+    항목은 해당 토큰이 어차피 만료되는 시각까지만 보관하고 정리하므로 크기는
+    최근 ACCESS_TOKEN_EXPIRE_MINUTES 동안의 폐기 건수로 제한되며,
+    요청마다 dict 조회 두 번으로 확인합니다 (DB/Redis 접근 없음).
+    이벤트 루프 스레드에서만 접근한다는 전제이므로 락을 사용하지 않습니다.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.time):
+        self._clock = clock
+        self._tokens: dict[str, float] = {}
+        self._users: dict[str, tuple[float, float]] = {}  # uid -> (폐기 시각, 보관 만료 시각)
+        self._expiry: list[tuple[float, str, str]] = []  # (보관 만료 시각, kind, key) 힙
+
+    def __len__(self) -> int:
+        return len(self._tokens) + len(self._users)
+
+    def apply(self, message: dict):
+        """ 폐기 메시지 반영 (같은 메시지를 여러 번 받아도 결과가 같음) """
+        kind, key, expires_at = message["kind"], message["key"], message["expires_at"]
+        self.prune()
+        if expires_at <= self._clock():
+            return
+        if kind == "token":
+            self._tokens[key] = max(expires_at, self._tokens.get(key, 0.0))
+        else:
+            revoked_at, current_expires_at = self._users.get(key, (0.0, 0.0))
+            self._users[key] = (max(revoked_at, message["revoked_at"]), max(current_expires_at, expires_at))
+        heapq.heappush(self._expiry, (expires_at, kind, key))
+
+    def is_revoked(self, payload: dict) -> bool:
+        """ 검증된 JWT payload가 폐기되었는지 확인 (jti/iat가 없는 이전 토큰은 사용자 단위만 확인) """
+        jti = payload.get("jti")
+        if jti is not None and jti in self._tokens:
+            return True
+        user = self._users.get(payload.get("uid"))
+        return user is not None and payload.get("iat", 0) <= user[0]
+
+    def prune(self) -> int:
+        """ 보관 만료 시각이 지난 항목 정리 - 정리한 항목 수 반환 """
+        now = self._clock()
+        removed = 0
+        while self._expiry and self._expiry[0][0] <= now:
+            _, kind, key = heapq.heappop(self._expiry)
+            # 같은 키가 더 늦은 만료 시각으로 다시 폐기되었으면 유지
+            if kind == "token":
+                if self._tokens.get(key, now) <= now:
+                    removed += self._tokens.pop(key, None) is not None
+            elif self._users.get(key, (0.0, now))[1] <= now:
+                removed += self._users.pop(key, None) is not None
+        return removed
+
+
+class InMemoryRevocationBroker:
+    """ 프로세스 내 폐기 메시지 브로커
+
+    Redis 브로커와 같은 인터페이스(publish / snapshot / subscribe)를 가지며,
+    테스트용 Redis 대체재이자 워커가 하나인 배포의 기본 브로커로 사용합니다.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.time):
+        self._clock = clock
+        self._messages: list[dict] = []
+        self._queues: set[asyncio.Queue] = set()
+
+    async def publish(self, message: dict):
+        now = self._clock()
+        self._messages = [m for m in self._messages if m["expires_at"] > now]
+        self._messages.append(message)
+        for queue in self._queues:
+            queue.put_nowait(message)
+
+    async def snapshot(self) -> list[dict]:
+        now = self._clock()
+        return [m for m in self._messages if m["expires_at"] > now]
+
+    async def subscribe(self) -> AsyncIterator[dict]:
+        queue = asyncio.Queue()
+        self._queues.add(queue)
+        return self._iterate(queue)
+
+    async def _iterate(self, queue: asyncio.Queue) -> AsyncIterator[dict]:
+        try:
+            while True:
+                yield await queue.get()
+        finally:
+            self._queues.discard(queue)
+
+
+class RedisRevocationBroker:
+    """ Redis pub/sub 기반 폐기 메시지 브로커 (여러 워커가 같은 폐기 목록 공유)
+
+    pub/sub은 구독 전에 발행된 메시지를 전달하지 않으므로, 보관 만료 시각을
+    score로 하는 sorted set에도 함께 저장해 새로 시작한 워커가 스냅샷으로 적재합니다.
+    """
+
+    def __init__(self, redis=None, channel: str = settings.REVOCATION_CHANNEL, clock: Callable[[], float] = time.time):
+        self._redis = redis
+        self.channel = channel
+        self.key = f"{channel}:active"
+        self._clock = clock
+
+    def _redis_client(self):
+        return self._redis or get_redis()
+
+    async def publish(self, message: dict):
+        raw = json.dumps(message)
+        async with self._redis_client().pipeline(transaction=False) as pipe:
+            pipe.zadd(self.key, {raw: message["expires_at"]})
+            pipe.zremrangebyscore(self.key, "-inf", self._clock())
+            pipe.publish(self.channel, raw)
+            await pipe.execute()
+
+    async def snapshot(self) -> list[dict]:
+        raws = await self._redis_client().zrangebyscore(self.key, self._clock(), "+inf")
+        return [json.loads(raw) for raw in raws]
+
+    async def subscribe(self) -> AsyncIterator[dict]:
+        pubsub = self._redis_client().pubsub(ignore_subscribe_messages=True)
+        await pubsub.subscribe(self.channel)
+        return self._iterate(pubsub)
+
+    async def _iterate(self, pubsub) -> AsyncIterator[dict]:
+        try:
+            async for message in pubsub.listen():
+                if message["type"] == "message":
+                    yield json.loads(message["data"])
+        finally:
+            await pubsub.aclose()
+
+
+class TokenRevocation:
+    """ ✅ access token 즉시 폐기 (로컬 폐기 목록 + 브로커로 워커 간 동기화)
+
+    폐기를 요청한 워커에는 즉시 반영되고, 다른 워커에는 브로커 메시지로
+    전파되므로 로그아웃/정지/삭제가 exp를 기다리지 않고 수 초 안에 적용됩니다.
+    """
+
+    def __init__(
+        self,
+        broker,
+        access_token_ttl: float = settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.broker = broker
+        self.access_token_ttl = access_token_ttl
+        self._clock = clock
+        self.revoked = RevocationList(clock=clock)
+        self.synced = False
+
+    def is_revoked(self, payload: dict) -> bool:
+        return self.revoked.is_revoked(payload)
+
+    async def revoke_token(self, jti: str, expires_at: float):
+        """ 토큰 하나 폐기 (로그아웃) - 토큰 exp까지 보관 """
+        await self._publish({"kind": "token", "key": jti, "expires_at": float(expires_at)})
+
+    async def revoke_user(self, uid: str, revoked_at: Optional[float] = None):
+        """ 사용자의 기존 토큰 모두 폐기 (정지/삭제) - 마지막 토큰이 만료될 때까지 보관 """
+        revoked_at = revoked_at or self._clock()
+        await self._publish({
+            "kind": "user",
+            "key": uid,
+            "revoked_at": revoked_at,
+            "expires_at": revoked_at + self.access_token_ttl,
+        })
+
+    async def _publish(self, message: dict):
+        self.revoked.apply(message)
+        try:
+            await self.broker.publish(message)
+        except Exception as e:
+            # 이 워커의 폐기는 유지되며, 다른 워커에는 전파되지 않음
+            logger.warning("토큰 폐기 전파 실패: %s", e)
+
+    async def sync_forever(self, retry_seconds: float = settings.REVOCATION_RETRY_SECONDS):
+        """ 브로커를 구독하고 스냅샷을 적재한 뒤 폐기 메시지를 계속 반영하는 태스크 (끊기면 재구독) """
+        while True:
+            try:
+                # 구독을 먼저 시작해야 스냅샷 조회 중에 발행된 메시지를 놓치지 않음
+                messages = await self.broker.subscribe()
+                for message in await self.broker.snapshot():
+                    self.revoked.apply(message)
+                self.synced = True
+                async for message in messages:
+                    self.revoked.apply(message)
+            except Exception as e:
+                logger.warning("토큰 폐기 목록 동기화 실패, %s초 후 재시도: %s", retry_seconds, e)
+            self.synced = False
+            await asyncio.sleep(retry_seconds)
+
+
+def _default_broker():
+    return RedisRevocationBroker() if settings.REVOCATION_REDIS_ENABLED else InMemoryRevocationBroker()
+
+
+# 프로세스 전역 access token 폐기 목록
+token_revocation = TokenRevocation(_default_broker())
+
+REGISTRY.callback(
+    "revoked_access_tokens", "Revoked access tokens / users held in the in-process denylist", "gauge", (),
+    lambda: [((), len(token_revocation.revoked))],
+)
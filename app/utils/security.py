@@ -1,10 +1,25 @@
 import jwt
+import asyncio
+import hashlib
+import hmac
+import ipaddress
+import json
+import logging
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 import firebase_admin
 from firebase_admin import auth, credentials
-from typing import Dict
+from firebase_admin._token_gen import ID_TOKEN_CERT_URI
+from typing import Dict, Optional
 from app.utils.config import settings  # 환경변수에서 SECRET_KEY 가져옴
-from fastapi import HTTPException, Security, Depends
+from app.utils.cache import ExpiringCache
+from app.utils.jwt_keys import get_key_set
+from app.utils.metrics import FIREBASE_VERIFY_DURATION, JWT_VERIFY_DURATION, REGISTRY
+from app.utils.singleflight import SingleFlight
+from fastapi import HTTPException, Security, Depends, Request
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 import os
 
@@ -16,44 +31,195 @@ REFRESH_TOKEN_EXPIRE_DAYS = settings.REFRESH_TOKEN_EXPIRE_DAYS
 
 firebase_credentials_path = settings.FIREBASE_CREDENTIALS
 
+logger = logging.getLogger(__name__)
 
 
-if not os.path.exists(firebase_credentials_path):
-    raise FileNotFoundError(f"Firebase JSON 파일을 찾을 수 없습니다: {firebase_credentials_path}")
 
-# # Firebase Admin SDK 초기화 (한 번만 실행)
-if not firebase_admin._apps:
-    cred = credentials.Certificate(firebase_credentials_path)  # Firebase 서비스 계정 JSON 경로
-    firebase_admin.initialize_app(cred)
+_firebase_init_lock = threading.Lock()
+
+def get_firebase_app() -> firebase_admin.App:
+    """ ✅ Firebase Admin SDK 앱 반환 (처음 사용할 때 한 번만 초기화)
+
+    import 시점에 초기화하지 않으므로 자격 증명 파일 문제는 워밍업(lifespan)
+    또는 첫 토큰 검증 시점에 드러나며, 다른 모듈의 import/테스트에는 영향이 없습니다.
+    """
+    if firebase_admin._apps:
+        return firebase_admin.get_app()
+    with _firebase_init_lock:
+        if firebase_admin._apps:
+            return firebase_admin.get_app()
+        if not firebase_credentials_path or not os.path.exists(firebase_credentials_path):
+            raise FileNotFoundError(f"Firebase JSON 파일을 찾을 수 없습니다: {firebase_credentials_path}")
+        cred = credentials.Certificate(firebase_credentials_path)  # Firebase 서비스 계정 JSON 경로
+        return firebase_admin.initialize_app(cred)
+
+# access token 구분 값 (refresh token 등 다른 토큰을 Bearer로 보내면 거부)
+ACCESS_TOKEN_TYPE = "access"
+# 서명이 유효해도 이 claim이 없으면 거부 (exp가 없는 토큰은 캐시 만료 시각을 정할 수 없음)
+_ACCESS_TOKEN_REQUIRED_CLAIMS = {"require": ["exp", "uid", "role"]}
 
 def create_jwt_token(uid: str, role: str):
-    """ JWT 액세스 토큰 생성 """
-    expire = datetime.utcnow() + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
-    payload = {"uid": uid, "role": role, "exp": expire}
-    return jwt.encode(payload, SECRET_KEY, algorithm=ALGORITHM)
+    """ JWT 액세스 토큰 생성 (즉시 폐기를 위해 jti/iat 포함, 다른 토큰과 구분하도록 type 포함) """
+    now = datetime.utcnow()
+    expire = now + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
+    payload = {"uid": uid, "role": role, "exp": expire, "iat": now, "jti": uuid.uuid4().hex, "type": ACCESS_TOKEN_TYPE}
+    key_set = get_key_set()
+    if key_set is None:
+        return jwt.encode(payload, SECRET_KEY, algorithm=ALGORITHM)
+    # 비대칭 서명 - 다른 서비스가 JWKS의 공개 키(kid)로 로컬 검증
+    key = key_set.active
+    return jwt.encode(payload, key.private_key, algorithm=key.algorithm, headers={"kid": key.kid})
 
 def create_refresh_token(uid: str):
-    """ Refresh Token 생성 """
+    """ Refresh Token 생성 (같은 초에 다시 로그인해도 digest가 겹치지 않도록 jti 포함) """
     expire = datetime.utcnow() + timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS)
-    payload = {"uid": uid, "exp": expire}
+    payload = {"uid": uid, "exp": expire, "jti": uuid.uuid4().hex, "type": "refresh"}
     return jwt.encode(payload, SECRET_KEY, algorithm=ALGORITHM)
 
+def _decode_access_token(token: str) -> dict:
+    """ 헤더의 kid로 공개 키를 찾아 검증 (kid가 없는 토큰은 JWT_ACCEPT_LEGACY_HS256일 때만 HS256) """
+    key_set = get_key_set()
+    if key_set is not None:
+        kid = jwt.get_unverified_header(token).get("kid")
+        if kid is None:
+            # ❌ 전환 기간이 끝나면 JWT_SECRET_KEY로 서명한 토큰은 거부
+            if not settings.JWT_ACCEPT_LEGACY_HS256:
+                raise jwt.InvalidTokenError("Token without key id")
+        else:
+            key = key_set.get(kid)
+            if key is None:
+                raise jwt.InvalidTokenError(f"Unknown key id: {kid}")
+            # 알고리즘은 토큰 헤더가 아니라 키에 고정 (알고리즘 혼동 공격 방지)
+            payload = jwt.decode(token, key.public_key, algorithms=[key.algorithm], options=_ACCESS_TOKEN_REQUIRED_CLAIMS)
+            return _check_token_type(payload)
+    return _check_token_type(jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM], options=_ACCESS_TOKEN_REQUIRED_CLAIMS))
+
+def _check_token_type(payload: dict) -> dict:
+    """ access token이 아닌 토큰 거부 (type이 없는 토큰은 type 도입 전에 발급된 access token) """
+    if payload.get("type", ACCESS_TOKEN_TYPE) != ACCESS_TOKEN_TYPE:
+        raise jwt.InvalidTokenError("Not an access token")
+    return payload
+
+# 검증된 액세스 토큰 캐시 (토큰 -> payload, 토큰 exp까지 유효)
+jwt_token_cache = ExpiringCache(maxsize=settings.JWT_CACHE_SIZE)
+REGISTRY.track_cache("jwt", jwt_token_cache.stats)
+
 def verify_jwt_token(token: str):
-    """ JWT 토큰 검증 """
+    """ JWT 토큰 검증 (검증된 payload는 exp까지 캐싱하여 HMAC 검증/JSON 디코딩 생략) """
+    payload = jwt_token_cache.get(token)
+    if payload is not None:
+        return payload
+    started = time.perf_counter()
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        return payload  # ✅ 검증된 사용자 정보 반환 (예: {"uid": "1234", "role": "user"})
+        payload = _decode_access_token(token)
     except jwt.ExpiredSignatureError:
+        JWT_VERIFY_DURATION.labels("expired").observe(time.perf_counter() - started)
         raise HTTPException(status_code=401, detail="Token has expired")
     except jwt.InvalidTokenError:
+        JWT_VERIFY_DURATION.labels("invalid").observe(time.perf_counter() - started)
         raise HTTPException(status_code=401, detail="Invalid token")
+    JWT_VERIFY_DURATION.labels("ok").observe(time.perf_counter() - started)
+    jwt_token_cache.set(token, payload, payload["exp"])
+    return payload  # ✅ 검증된 사용자 정보 반환 (예: {"uid": "1234", "role": "user"})
+
+def get_current_user(request: Request) -> Dict:
+    """ AuthMiddleware가 검증한 사용자 정보(request.state.user)를 반환하는 의존성 함수 """
+    user = getattr(request.state, "user", None)
+    if user is None:
+        raise HTTPException(status_code=401, detail="Unauthorized: Missing token")
+    return user
+
+def require_roles(*roles: str):
+    """ 지정한 역할(role)의 사용자만 허용하는 의존성 함수를 생성 (그 외 403) """
+    def dependency(user: Dict = Depends(get_current_user)) -> Dict:
+        if user.get("role") not in roles:
+            raise HTTPException(status_code=403, detail="Forbidden: Insufficient role")
+        return user
+    return dependency
+
+# 관리자 전용 API 접근 권한
+ADMIN_ROLES = ("superadmin", "admin_staff")
+
+def _parse_networks(value: str) -> tuple:
+    return tuple(ipaddress.ip_network(network, strict=False) for network in json.loads(value or "[]"))
+
+# /metrics 수집기 허용 네트워크
+_metrics_networks = _parse_networks(settings.METRICS_ALLOWED_IPS)
+
+def is_metrics_client(client_host: Optional[str], authorization: Optional[str]) -> bool:
+    """ /metrics 접근 허용 여부 (METRICS_TOKEN Bearer 토큰 일치 또는 METRICS_ALLOWED_IPS 안의 클라이언트) """
+    if settings.METRICS_TOKEN and authorization and authorization.startswith("Bearer "):
+        if hmac.compare_digest(authorization[len("Bearer "):].encode(), settings.METRICS_TOKEN.encode()):
+            return True
+    try:
+        address = ipaddress.ip_address(client_host or "")
+    except ValueError:
+        return False
+    return any(address in network for network in _metrics_networks)
     
-def verify_firebase_token(firebase_token: str):
-    """ Firebase ID Token 검증 """
+# Firebase 토큰 검증 전용 스레드 풀 (인증서 조회 + RSA 검증이 이벤트 루프를 막지 않도록)
+_firebase_executor = ThreadPoolExecutor(
+    max_workers=settings.FIREBASE_VERIFY_WORKERS,
+    thread_name_prefix="firebase-verify",
+)
+
+# 검증된 Firebase 토큰 캐시 (토큰 digest -> 사용자 정보, 토큰 exp까지 유효)
+firebase_token_cache = ExpiringCache(maxsize=settings.FIREBASE_TOKEN_CACHE_SIZE)
+REGISTRY.track_cache("firebase_token", firebase_token_cache.stats)
+
+def token_digest(token: str) -> bytes:
+    """ 토큰 원문 대신 캐시 키로 사용할 SHA-256 digest """
+    return hashlib.sha256(token.encode("utf-8")).digest()
+
+# 같은 Firebase 토큰의 동시 검증 병합 (여러 탭/재시도로 동시에 들어온 로그인)
+firebase_verify_flight = SingleFlight("firebase_verify", redis_enabled=settings.SINGLEFLIGHT_REDIS_ENABLED)
+
+async def verify_firebase_token(firebase_token: str):
+    """ Firebase ID Token 검증 (스레드 풀에서 실행, 결과는 exp까지 캐싱, 동시 검증은 한 번만 실행) """
+    key = token_digest(firebase_token)
+    cached = firebase_token_cache.get(key)
+    if cached is not None:
+        return cached
+    return await firebase_verify_flight.do(key.hex(), lambda: _verify_firebase_token(firebase_token, key))
+
+async def _verify_firebase_token(firebase_token: str, key: bytes) -> dict:
+    loop = asyncio.get_running_loop()
+    if not firebase_admin._apps:
+        # 워밍업 전 첫 요청이면 여기서 초기화 (자격 증명 오류는 토큰 오류로 바꾸지 않음)
+        await loop.run_in_executor(_firebase_executor, get_firebase_app)
+    started = time.perf_counter()
     try:
-        decoded_token = auth.verify_id_token(firebase_token)  # Firebase 토큰 검증
-        uid = decoded_token.get("uid")  # uid 가져오기
-        email = decoded_token.get("email")  # 이메일 가져오기
-        return {"uid": uid, "email": email}
+        # Firebase 토큰 검증
+        decoded_token = await loop.run_in_executor(_firebase_executor, auth.verify_id_token, firebase_token)
     except Exception:
+        FIREBASE_VERIFY_DURATION.labels("invalid").observe(time.perf_counter() - started)
         raise ValueError("Invalid Firebase Token")
+    FIREBASE_VERIFY_DURATION.labels("ok").observe(time.perf_counter() - started)
+
+    uid = decoded_token.get("uid")  # uid 가져오기
+    email = decoded_token.get("email")  # 이메일 가져오기
+    firebase_user = {"uid": uid, "email": email}
+    firebase_token_cache.set(key, firebase_user, decoded_token["exp"])
+    return firebase_user
+
+def prefetch_firebase_certificates():
+    """ Google 서명 인증서를 미리 받아 firebase_admin의 인증서 HTTP 캐시를 갱신
+
+    firebase_admin은 CacheControl 세션으로 인증서를 캐싱하므로,
+    no-cache 요청으로 새 응답을 받아두면 로그인 요청은 캐시된 인증서만 사용합니다.
+    """
+    client = auth._get_client(get_firebase_app())
+    client._token_verifier.request(ID_TOKEN_CERT_URI, headers={"Cache-Control": "no-cache"})
+
+async def warm_up_firebase():
+    """ Firebase 앱 초기화 + 서명 인증서 미리 받기 (lifespan 워밍업) """
+    await asyncio.get_running_loop().run_in_executor(_firebase_executor, prefetch_firebase_certificates)
+
+async def refresh_firebase_certificates_forever(interval: int = settings.FIREBASE_CERT_REFRESH_SECONDS):
+    """ 백그라운드에서 주기적으로 Google 서명 인증서를 갱신하는 태스크 (첫 적재는 워밍업에서 수행) """
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await warm_up_firebase()
+        except Exception as e:
+            logger.warning("Firebase 인증서 갱신 실패: %s", e)
@@ -0,0 +1,136 @@
+import asyncio
+import json
+import logging
+import uuid
+from typing import Any, Awaitable, Callable, Hashable, Optional
+
+from app.utils.config import settings
+from app.utils.metrics import REGISTRY
+from app.utils.redis_client import get_redis
+
+logger = logging.getLogger(__name__)
+
+SINGLEFLIGHT_CALLS = REGISTRY.counter(
+    "singleflight_calls_total", "Single-flight calls by whether they ran or joined an in-flight call",
+    ("name", "result"),
+)
+
+
+class SingleFlight:
+    """ ✅ 같은 키의 동시 호출을 하나의 실행으로 병합 (single-flight)
+
+    먼저 도착한 호출(리더)만 fn을 실행하고, 실행 중에 같은 키로 들어온 호출은 그 결과(예외 포함)를
+    함께 받습니다. 결과를 캐싱하지 않으므로 완료 후 들어온 호출은 다시 실행합니다.
+
+    redis_enabled이면 워커 간에도 병합합니다.
+      - 리더 워커는 SET NX 락(값은 리더별 토큰)을 잡고 실행한 뒤 결과(JSON)를 토큰별 키에 저장
+      - 다른 워커는 락에서 읽은 토큰의 결과만 기다리고, 락이 사라졌는데 결과가 없으면(리더 실패) 직접 실행
+      - 락이 이미 풀린 뒤 들어온 호출은 새 리더가 되므로, 이전 결과(무효화 전 값)를 재사용하지 않음
+      - Redis 장애 시에는 프로세스 내 병합만 적용
+    결과는 JSON으로 직렬화할 수 있어야 합니다.
+
+        flight = SingleFlight("profile")
+        profile = await flight.do(key, lambda: load_profile(uid))
+    """
+
+    def __init__(
+        self,
+        name: str,
+        redis_enabled: bool = False,
+        lock_ttl_ms: int = settings.SINGLEFLIGHT_LOCK_TTL_MS,
+        result_ttl_ms: int = settings.SINGLEFLIGHT_RESULT_TTL_MS,
+        poll_ms: int = settings.SINGLEFLIGHT_POLL_MS,
+        redis=None,
+    ):
+        self.name = name
+        self.redis_enabled = redis_enabled
+        self.lock_ttl_ms = lock_ttl_ms
+        self.result_ttl_ms = result_ttl_ms
+        self.poll_ms = poll_ms
+        self._redis = redis
+        self._inflight: dict[Hashable, asyncio.Task] = {}
+
+    def __len__(self) -> int:
+        return len(self._inflight)
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """ key의 실행 중인 호출이 있으면 그 결과를, 없으면 fn()을 실행한 결과를 반환 """
+        task = self._inflight.get(key)
+        if task is None:
+            SINGLEFLIGHT_CALLS.labels(self.name, "leader").inc()
+            task = asyncio.create_task(self._run(key, fn) if self.redis_enabled else fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+        else:
+            SINGLEFLIGHT_CALLS.labels(self.name, "shared").inc()
+        # 먼저 요청한 쪽이 취소되어도 공유 실행은 계속 진행
+        return await asyncio.shield(task)
+
+    def _forget(self, key: Hashable, task: asyncio.Task):
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # 기다리던 호출이 모두 취소된 경우에도 예외가 로그로 남지 않도록 회수
+        if not task.cancelled():
+            task.exception()
+
+    def _redis_client(self):
+        return self._redis or get_redis()
+
+    async def _run(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """ Redis 락으로 워커 간 병합 """
+        redis = self._redis_client()
+        lock_key = f"singleflight:{self.name}:{key}:lock"
+        token = uuid.uuid4().hex
+        try:
+            acquired = await redis.set(lock_key, token, nx=True, px=self.lock_ttl_ms)
+            # 실행 중인 리더의 토큰 (없으면 그 사이 리더가 끝난 것이므로 직접 실행)
+            leader = None if acquired else await redis.get(lock_key)
+        except Exception as e:
+            logger.debug("single-flight Redis 조회 실패 (%s): %s", self.name, e)
+            return await fn()
+
+        if acquired:
+            try:
+                value = await fn()
+                await self._publish(self._result_key(key, token), value)
+                return value
+            finally:
+                await self._release(lock_key)
+
+        if leader is None:
+            return await fn()
+        value = await self._wait_for_leader(lock_key, self._result_key(key, leader))
+        return await fn() if value is None else json.loads(value)
+
+    def _result_key(self, key: Hashable, token: str) -> str:
+        return f"singleflight:{self.name}:{key}:result:{token}"
+
+    async def _publish(self, result_key: str, value: Any):
+        try:
+            await self._redis_client().set(result_key, json.dumps(value), px=self.result_ttl_ms)
+        except Exception as e:
+            logger.debug("single-flight 결과 저장 실패 (%s): %s", self.name, e)
+
+    async def _release(self, lock_key: str):
+        try:
+            await self._redis_client().delete(lock_key)
+        except Exception as e:
+            logger.debug("single-flight 락 해제 실패 (%s): %s", self.name, e)
+
+    async def _wait_for_leader(self, lock_key: str, result_key: str) -> Optional[str]:
+        """ 다른 워커의 리더 결과(JSON 문자열)를 기다림 (리더가 결과 없이 끝나면 None) """
+        redis = self._redis_client()
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.lock_ttl_ms / 1000
+        try:
+            while loop.time() < deadline:
+                await asyncio.sleep(self.poll_ms / 1000)
+                raw = await redis.get(result_key)
+                if raw is not None:
+                    return raw
+                if not await redis.exists(lock_key):
+                    # 결과 저장 직후 락이 해제된 경우를 위해 한 번 더 확인
+                    return await redis.get(result_key)
+        except Exception as e:
+            logger.debug("single-flight 결과 대기 실패 (%s): %s", self.name, e)
+        return None
@@ -0,0 +1,111 @@
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Optional
+
+from app.db.database import check_database, warm_up_database
+from app.utils.config import settings
+from app.utils.jwt_keys import get_key_set
+from app.utils.redis_client import get_redis
+from app.utils.security import get_firebase_app, warm_up_firebase
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class DependencyCheck:
+    """ 외부 의존성 하나의 워밍업/확인 방법
+
+    warm_up은 시작 시 한 번 (DB 커넥션 미리 열기, 인증서 받기 등),
+    check는 /ready 요청마다 실행되는 가벼운 확인입니다.
+    """
+    name: str
+    warm_up: Callable[[], Awaitable]
+    check: Callable[[], Awaitable]
+
+
+@dataclass
+class CheckResult:
+    ok: bool
+    elapsed_ms: float
+    error: Optional[str] = None
+
+    def to_dict(self) -> dict:
+        result = {"ok": self.ok, "elapsed_ms": round(self.elapsed_ms, 1)}
+        if self.error:
+            result["error"] = self.error
+        return result
+
+
+async def _run(action: Callable[[], Awaitable], timeout: float) -> CheckResult:
+    started = time.perf_counter()
+    try:
+        await asyncio.wait_for(action(), timeout)
+    except asyncio.TimeoutError:
+        return CheckResult(False, (time.perf_counter() - started) * 1000, "timeout")
+    except Exception as e:
+        return CheckResult(False, (time.perf_counter() - started) * 1000, f"{type(e).__name__}: {e}")
+    return CheckResult(True, (time.perf_counter() - started) * 1000)
+
+
+class Readiness:
+    """ ✅ 외부 의존성 워밍업 및 준비 상태 관리
+
+    워밍업은 lifespan에서 백그라운드로 병렬 실행하므로 의존성이 느리거나
+    내려가 있어도 서버는 바로 요청을 받습니다. 워밍업이 실패한 의존성은
+    각 모듈이 첫 사용 시 지연 초기화하고, /ready는 워밍업이 끝나고
+    모든 의존성이 응답할 때만 200을 반환합니다.
+    """
+
+    def __init__(self, checks: list[DependencyCheck]):
+        self.checks = checks
+        self.warm_up_results: dict[str, CheckResult] = {}
+        self.warmed_up = False
+
+    async def warm_up(self, timeout: float = settings.STARTUP_WARMUP_TIMEOUT_SECONDS) -> dict[str, CheckResult]:
+        started = time.perf_counter()
+        results = await asyncio.gather(*(_run(check.warm_up, timeout) for check in self.checks))
+        self.warm_up_results = {check.name: result for check, result in zip(self.checks, results)}
+        self.warmed_up = True
+        for name, result in self.warm_up_results.items():
+            if result.ok:
+                logger.info("%s 워밍업 완료 (%.1fms)", name, result.elapsed_ms)
+            else:
+                logger.warning("%s 워밍업 실패, 첫 사용 시 다시 연결합니다: %s", name, result.error)
+        logger.info("외부 의존성 워밍업 종료 (%.1fms)", (time.perf_counter() - started) * 1000)
+        return self.warm_up_results
+
+    async def check(self, timeout: float = settings.READINESS_TIMEOUT_SECONDS) -> tuple[bool, dict]:
+        """ 의존성을 병렬로 확인 - (준비 여부, 의존성별 결과) """
+        results = await asyncio.gather(*(_run(check.check, timeout) for check in self.checks))
+        details = {check.name: result.to_dict() for check, result in zip(self.checks, results)}
+        return self.warmed_up and all(result.ok for result in results), details
+
+
+def default_checks() -> list[DependencyCheck]:
+    """ 설정에 따라 사용하는 외부 의존성 목록 (Redis는 사용하는 기능이 켜진 경우만) """
+    async def check_firebase():
+        await asyncio.to_thread(get_firebase_app)
+
+    async def ping_redis():
+        await get_redis().ping()
+
+    checks = [
+        DependencyCheck("database", warm_up_database, check_database),
+        DependencyCheck("firebase", warm_up_firebase, check_firebase),
+    ]
+    if settings.JWT_SIGNING_KEYS.strip() not in ("", "{}"):
+        # 키 파일 오류가 첫 로그인이 아니라 시작 시점에 드러나도록 미리 적재
+        async def load_signing_keys():
+            get_key_set()
+
+        checks.append(DependencyCheck("jwt_keys", load_signing_keys, load_signing_keys))
+    if (
+        settings.RATE_LIMIT_ENABLED
+        or settings.USER_CACHE_REDIS_ENABLED
+        or settings.REVOCATION_REDIS_ENABLED
+        or settings.SINGLEFLIGHT_REDIS_ENABLED
+    ):
+        checks.append(DependencyCheck("redis", ping_redis, ping_redis))
+    return checks
@@ -0,0 +1,107 @@
+"""
+응답 압축 수준별 CPU 시간 / 전송 바이트 벤치마크
+
+대표 응답 본문(OpenAPI 스키마, 유치원 목록 100건 envelope, 사용자 내보내기 NDJSON)을
+gzip 압축 수준별로 압축하여 압축 시간, 크기, 느린 회선에서의 전송 시간을 비교합니다.
+스트리밍 응답은 청크(내보내기 배치)마다 sync flush하는 경우의 크기도 함께 출력합니다.
+
+    python -m benchmarks.compression_levels --levels 1,3,6,9 --repeat 50
+"""
+import argparse
+import statistics
+import time
+import uuid
+import zlib
+from datetime import datetime, timedelta
+
+from fastapi.responses import JSONResponse
+
+from app.middleware.compression import compress, compressor
+from app.services.export_service import encode_ndjson
+from app.utils.response_utils import encode_envelope
+
+# 전송 시간 추정용 회선 속도 (Mbps)
+LINKS = (1, 10)
+
+
+def build_payloads(export_rows: int, chunk_rows: int) -> dict[str, list[bytes]]:
+    """ 이름 -> 본문 청크 목록 (단일 응답은 청크 1개) """
+    from app.main import app
+
+    created = datetime(2025, 1, 1)
+    kindergartens = [
+        {
+            "id": str(uuid.UUID(int=i)),
+            "owner_id": str(uuid.UUID(int=10_000 + i % 50)),
+            "name": f"해피 강아지 유치원 {i}호점",
+            "business_number": f"{100_000_000 + i}",
+            "type": ("사립", "공립")[i % 2],
+            "address": f"서울특별시 강남구 테헤란로 {i % 300}길 {i}",
+            "contact": f"02-555-{i:04d}",
+            "email": f"kg{i}@example.com",
+            "certificate_status": "approved",
+            "is_active": True,
+            "is_suspended": False,
+            "is_deleted": False,
+            "created_at": (created + timedelta(minutes=i)).isoformat(),
+            "updated_at": (created + timedelta(minutes=i, seconds=30)).isoformat(),
+        }
+        for i in range(100)
+    ]
+    keys = ["id", "firebase_uid", "email", "role", "is_active", "is_suspended", "is_deleted", "created_at"]
+    users = [
+        (str(uuid.UUID(int=i)), f"firebase-uid-{i:08d}", f"user{i}@example.com", "user",
+         True, False, False, (created + timedelta(seconds=i)).isoformat())
+        for i in range(export_rows)
+    ]
+    return {
+        # FastAPI가 /openapi.json으로 보내는 본문과 같은 인코딩
+        "openapi.json": [JSONResponse(app.openapi()).body],
+        "list page (100)": [encode_envelope(200, "유치원 목록 조회 성공", {"items": kindergartens, "next_cursor": "x" * 40})],
+        f"export ndjson ({export_rows})": [
+            encode_ndjson(keys, users[i:i + chunk_rows]) for i in range(0, export_rows, chunk_rows)
+        ],
+    }
+
+
+def measure(chunks: list[bytes], level: int, repeat: int) -> tuple[float, int, int]:
+    """ (압축 시간 중앙값 ms, 한 번에 압축한 크기, 청크마다 sync flush한 크기) """
+    body = b"".join(chunks)
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        compressed = compress(body, "gzip", level)
+        samples.append(time.perf_counter() - started)
+    streaming = compressor("gzip", level)
+    flushed = sum(len(streaming.compress(chunk) + streaming.flush(zlib.Z_SYNC_FLUSH)) for chunk in chunks)
+    flushed += len(streaming.flush())
+    return statistics.median(samples) * 1000, len(compressed), flushed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--levels", type=lambda value: [int(v) for v in value.split(",")], default=[1, 3, 6, 9])
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--export-rows", type=int, default=10_000)
+    parser.add_argument("--chunk-rows", type=int, default=1000)
+    args = parser.parse_args()
+
+    for name, chunks in build_payloads(args.export_rows, args.chunk_rows).items():
+        size = sum(len(chunk) for chunk in chunks)
+        links = "  ".join(f"{mbps:>3}Mbps" for mbps in LINKS)
+        print(f"\n{name}: {size:,} bytes ({len(chunks)} chunk(s))")
+        print(f"  level   cpu ms      bytes  ratio   MB/s  streamed  transfer ms @ {links}")
+        print(f"  {'none':>5} {0:8.2f} {size:10,} {1:6.2f} {'-':>6} {'-':>9}  " + "  ".join(
+            f"{size * 8 / (mbps * 1000):9.1f}" for mbps in LINKS
+        ))
+        for level in args.levels:
+            cpu_ms, compressed, streamed = measure(chunks, level, args.repeat)
+            print(
+                f"  {level:>5} {cpu_ms:8.2f} {compressed:10,} {size / compressed:6.2f} "
+                f"{size / cpu_ms / 1000:6.0f} {streamed:9,}  "
+                + "  ".join(f"{compressed * 8 / (mbps * 1000) + cpu_ms:9.1f}" for mbps in LINKS)
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""
+미들웨어 요청당 오버헤드 마이크로 벤치마크
+
+BaseHTTPMiddleware 기반(기존) 미들웨어 스택과 순수 ASGI 미들웨어 스택을
+같은 엔드포인트에 대해 ASGI 호출로 직접 구동하여 요청당 소요 시간을 비교합니다.
+
+    python -m benchmarks.middleware_overhead --requests 20000
+"""
+import argparse
+import asyncio
+import logging
+import time
+
+from fastapi import FastAPI, HTTPException, Request
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from app.middleware.auth import AuthMiddleware
+from app.middleware.logging import LoggingMiddleware
+from app.utils.security import create_jwt_token, verify_jwt_token
+
+
+class LegacyLoggingMiddleware(BaseHTTPMiddleware):
+    """ 기존 BaseHTTPMiddleware 기반 로깅 미들웨어 """
+    async def dispatch(self, request: Request, call_next):
+        start_time = time.time()
+        response = await call_next(request)
+        process_time = time.time() - start_time
+        logging.getLogger("benchmark.legacy").info(
+            f"📌 [Request] {request.method} {request.url.path} "
+            f"Status: {response.status_code} Time: {process_time:.2f}s"
+        )
+        return response
+
+
+class LegacyAuthMiddleware(BaseHTTPMiddleware):
+    """ 기존 BaseHTTPMiddleware 기반 인증 미들웨어 """
+    async def dispatch(self, request: Request, call_next):
+        whitelist = [
+            "/api/v1/auth/login",
+            "/api/v1/auth/logout",
+            "/docs",
+            "/openapi.json",
+            "/favicon.ico",
+        ]
+        if any(request.url.path.startswith(path) for path in whitelist):
+            return await call_next(request)
+
+        auth_header = request.headers.get("Authorization")
+        if not auth_header or not auth_header.startswith("Bearer "):
+            raise HTTPException(status_code=401, detail="Unauthorized: Missing token")
+
+        token = auth_header.split("Bearer ")[1]
+        user_payload = verify_jwt_token(token)
+        request.state.user = {"uid": user_payload["uid"], "role": user_payload["role"]}
+        return await call_next(request)
+
+
+def build_app(*middlewares) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/ping")
+    async def ping():
+        return {"ok": True}
+
+    for middleware_cls in middlewares:
+        app.add_middleware(middleware_cls)
+    return app
+
+
+async def drive(app, n: int, token: str) -> float:
+    """ n개의 요청을 ASGI로 직접 호출하고 요청당 평균 소요 시간(µs)을 반환 """
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/ping",
+        "raw_path": b"/ping",
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"authorization", f"Bearer {token}".encode())],
+        "client": ("127.0.0.1", 12345),
+        "server": ("testserver", 80),
+    }
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            assert message["status"] == 200, message
+
+    # 워밍업
+    for _ in range(200):
+        await app(dict(scope), receive, send)
+
+    start = time.perf_counter()
+    for _ in range(n):
+        await app(dict(scope), receive, send)
+    return (time.perf_counter() - start) / n * 1_000_000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=20000)
+    args = parser.parse_args()
+
+    # 로그 출력 비용은 두 스택 모두 동일하므로 측정에서 제외
+    logging.disable(logging.CRITICAL)
+    token = create_jwt_token("benchmark-uid", "user")
+
+    baseline = build_app(LegacyLoggingMiddleware, LegacyAuthMiddleware)
+    bare = build_app()
+    asgi = build_app(LoggingMiddleware, AuthMiddleware)
+
+    bare_us = asyncio.run(drive(bare, args.requests, token))
+    legacy_us = asyncio.run(drive(baseline, args.requests, token))
+    asgi_us = asyncio.run(drive(asgi, args.requests, token))
+
+    print(f"no middleware        : {bare_us:8.1f} µs/request")
+    print(f"BaseHTTPMiddleware   : {legacy_us:8.1f} µs/request (+{legacy_us - bare_us:.1f} µs)")
+    print(f"pure ASGI middleware : {asgi_us:8.1f} µs/request (+{asgi_us - bare_us:.1f} µs)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+근처 유치원 검색 지연 시간 벤치마크 (프로세스 내 공간 인덱스)
+
+국내 좌표 범위에 유치원 N개(기본 100,000)를 인구 밀집 지역 위주로 배치하고
+반경 검색과 k-최근접 검색의 p50/p99 지연 시간을 측정합니다.
+비교용으로 전체 목록을 거리순 정렬하는 방식도 함께 측정합니다.
+
+    python -m benchmarks.nearby_search --rows 100000 --queries 2000
+"""
+import argparse
+import random
+import time
+import uuid
+
+from app.services.spatial_index import SpatialEntry, SpatialIndex
+from app.utils.geohash import haversine_m
+
+# (위도, 경도, 비중) - 수도권/광역시에 밀집, 나머지는 전국에 고르게 분포
+CLUSTERS = [
+    ((37.55, 126.98), 0.45),
+    ((35.16, 129.06), 0.12),
+    ((35.87, 128.60), 0.08),
+    ((36.35, 127.38), 0.05),
+    ((35.16, 126.85), 0.05),
+]
+
+
+def random_point(rng: random.Random) -> tuple[float, float]:
+    pick = rng.random()
+    for (lat, lon), weight in CLUSTERS:
+        if pick < weight:
+            return lat + rng.gauss(0, 0.12), lon + rng.gauss(0, 0.15)
+        pick -= weight
+    return rng.uniform(34.5, 38.3), rng.uniform(126.3, 129.4)
+
+
+def percentile(samples: list[float], ratio: float) -> float:
+    return sorted(samples)[min(len(samples) - 1, int(len(samples) * ratio))]
+
+
+def measure(fn, centers) -> tuple[float, float]:
+    """ 질의별 (p50, p99) 지연 시간 (ms) """
+    samples = []
+    for center in centers:
+        started = time.perf_counter()
+        fn(center)
+        samples.append((time.perf_counter() - started) * 1000)
+    return percentile(samples, 0.5), percentile(samples, 0.99)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--queries", type=int, default=2000)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    index = SpatialIndex()
+    points = []
+    started = time.perf_counter()
+    for i in range(args.rows):
+        lat, lon = random_point(rng)
+        index.upsert(SpatialEntry(uuid.UUID(int=i), f"도기 유치원 {i}", "주소", "사립", lat, lon))
+        points.append((lat, lon))
+    print(f"{args.rows:,}개 적재: {time.perf_counter() - started:.2f}s")
+
+    centers = [random_point(rng) for _ in range(args.queries)]
+    cases = [
+        ("radius 1km          ", lambda c: index.within(*c, 1000)),
+        ("radius 5km          ", lambda c: index.within(*c, 5000)),
+        ("radius 5km limit 20 ", lambda c: index.nearest(*c, k=20, max_radius_m=5000)),
+        ("kNN k=20 (<=20km)   ", lambda c: index.nearest(*c, k=20, max_radius_m=20000)),
+        ("kNN k=100 (<=20km)  ", lambda c: index.nearest(*c, k=100, max_radius_m=20000)),
+    ]
+    for name, fn in cases:
+        p50, p99 = measure(fn, centers)
+        print(f"{name}: p50 {p50:7.3f} ms  p99 {p99:7.3f} ms")
+
+    def full_scan(center):
+        sorted(points, key=lambda p: haversine_m(center[0], center[1], p[0], p[1]))[:20]
+
+    p50, p99 = measure(full_scan, centers[:50])
+    print(f"full scan k=20      : p50 {p50:7.3f} ms  p99 {p99:7.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+응답 envelope 직렬화 처리량 벤치마크
+
+기존 방식(ResponseDTO → model_dump() → JSONResponse의 json.dumps)과
+EnvelopeResponse(pydantic-core 단일 직렬화), 미리 인코딩된 고정 응답을 비교합니다.
+
+    python -m benchmarks.response_envelope --iterations 50000
+"""
+import argparse
+import time
+from datetime import datetime, timezone
+
+from fastapi.responses import JSONResponse
+
+from app.utils.dto import ResponseDTO
+from app.utils.response_utils import prebuilt_response, success_response
+
+SMALL = {"status": "running"}
+LARGE = {
+    "items": [
+        {
+            "id": f"00000000-0000-0000-0000-{i:012d}",
+            "name": f"도기 유치원 {i}",
+            "address": "서울특별시 강남구 테헤란로 123",
+            "is_active": True,
+            "created_at": datetime(2025, 1, 1, tzinfo=timezone.utc).isoformat(),
+        }
+        for i in range(50)
+    ],
+    "next_cursor": None,
+}
+
+
+def legacy_response(data, msg: str = "Success") -> JSONResponse:
+    return JSONResponse(status_code=200, content=ResponseDTO(code=200, msg=msg, data=data).model_dump())
+
+
+def measure(fn, iterations: int) -> float:
+    """ 초당 생성 가능한 응답 수 """
+    for _ in range(min(iterations, 1000)):
+        fn()
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return iterations / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=50000)
+    args = parser.parse_args()
+
+    status_response = prebuilt_response(data=SMALL, msg="Server is running")
+    cases = [
+        ("small  legacy JSONResponse", lambda: legacy_response(SMALL)),
+        ("small  EnvelopeResponse   ", lambda: success_response(SMALL)),
+        ("small  prebuilt           ", status_response),
+        ("50 row legacy JSONResponse", lambda: legacy_response(LARGE)),
+        ("50 row EnvelopeResponse   ", lambda: success_response(LARGE)),
+    ]
+    for name, fn in cases:
+        print(f"{name}: {measure(fn, args.iterations):>10,.0f} responses/s")
+
+
+if __name__ == "__main__":
+    main()
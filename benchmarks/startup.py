@@ -0,0 +1,112 @@
+"""
+애플리케이션 시작 비용 벤치마크
+
+매번 새 인터프리터로 측정합니다.
+  - import 시간: `import app.main` 소요 시간 (중앙값) 및 -X importtime 기준 상위 모듈
+  - 첫 요청까지의 시간: uvicorn 프로세스 시작부터 첫 응답(/openapi.json)까지
+  - 준비 완료까지의 시간: /ready가 200을 반환할 때까지 (엔드포인트가 있는 경우)
+
+    python -m benchmarks.startup --runs 5
+"""
+import argparse
+import os
+import re
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+
+IMPORT_SNIPPET = "import time; t = time.perf_counter(); import app.main; print(time.perf_counter() - t)"
+
+
+def measure_import(runs: int) -> float:
+    """ 새 인터프리터에서 app.main import 시간(ms)의 중앙값 """
+    samples = []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-c", IMPORT_SNIPPET], capture_output=True, text=True, check=True
+        ).stdout
+        samples.append(float(output.strip().splitlines()[-1]) * 1000)
+    return statistics.median(samples)
+
+
+def top_imports(limit: int) -> list[tuple[float, str]]:
+    """ -X importtime의 모듈별 self 시간을 최상위 패키지 단위로 합산 (ms) """
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import app.main"], capture_output=True, text=True
+    ).stderr
+    totals = {}
+    for match in re.finditer(r"import time:\s+(\d+) \|\s+\d+ \|\s*(\S+)", stderr):
+        self_us, module = match.groups()
+        root = module.split(".")[0]
+        if root == "app":
+            # 애플리케이션 모듈은 모듈 단위로 표시 (import 시점의 초기화 비용 확인)
+            root = module
+        totals[root] = totals.get(root, 0.0) + int(self_us) / 1000
+    return sorted(((ms, name) for name, ms in totals.items()), reverse=True)[:limit]
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _wait_for(url: str, deadline: float) -> tuple[float, int]:
+    """ url이 503이 아닌 응답을 줄 때까지 대기 - (응답 시각, 상태 코드) """
+    while time.perf_counter() < deadline:
+        try:
+            with urllib.request.urlopen(url, timeout=1) as response:
+                return time.perf_counter(), response.status
+        except urllib.error.HTTPError as e:
+            if e.code != 503:
+                return time.perf_counter(), e.code
+        except (urllib.error.URLError, ConnectionError, OSError):
+            pass
+        time.sleep(0.005)
+    return float("nan"), 0
+
+
+def measure_first_request(timeout: float) -> tuple[float, float]:
+    """ uvicorn 시작부터 첫 응답 / 준비 완료까지의 시간(ms) - /ready가 없으면 준비 시간은 nan """
+    port = _free_port()
+    started = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port), "--log-level", "warning"],
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, env=os.environ.copy(),
+    )
+    try:
+        deadline = started + timeout
+        first, _ = _wait_for(f"http://127.0.0.1:{port}/openapi.json", deadline)
+        ready, status = _wait_for(f"http://127.0.0.1:{port}/ready", deadline)
+        return (first - started) * 1000, (ready - started) * 1000 if status == 200 else float("nan")
+    finally:
+        process.terminate()
+        process.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=8)
+    parser.add_argument("--timeout", type=float, default=60.0)
+    args = parser.parse_args()
+
+    print(f"import app.main        : {measure_import(args.runs):8.1f} ms (median of {args.runs})")
+    for ms, name in top_imports(args.top):
+        print(f"  {name:<20} {ms:8.1f} ms")
+
+    firsts, readies = [], []
+    for _ in range(args.runs):
+        first, ready = measure_first_request(args.timeout)
+        firsts.append(first)
+        readies.append(ready)
+    print(f"time to first request  : {statistics.median(firsts):8.1f} ms")
+    print(f"time to ready          : {statistics.median(readies):8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
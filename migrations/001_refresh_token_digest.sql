@@ -0,0 +1,50 @@
+-- ✅ refresh_tokens: 토큰 원문 컬럼을 SHA-256 digest 컬럼으로 교체 (1단계: expand)
+-- 실행: psql "$DATABASE_URL" -f migrations/001_refresh_token_digest.sql
+-- (CREATE INDEX CONCURRENTLY는 트랜잭션 밖에서 실행되어야 하므로 -1 옵션 없이 실행)
+--
+-- 배포 순서 (로그인/refresh 중단 없이 구/신 버전이 함께 동작하도록 expand/contract로 나눔)
+--   1) 이 마이그레이션 적용 - nullable digest 컬럼 + digest 자동 채움 트리거 + 인덱스
+--      (구 버전은 refresh_token만 쓰고, 트리거가 digest를 채우므로 신 버전이 조회할 수 있음)
+--   2) 신 버전 배포 - digest만 기록/조회 (refresh_token은 NULL 허용으로 바꿨으므로 생략 가능)
+--   3) python -m app.cli.backfill_refresh_token_digests
+--      - 만료/폐기 토큰 삭제와 기존 행 digest 채우기를 배치 단위(SKIP LOCKED)로 실행
+--   4) 구 버전이 모두 내려간 뒤 migrations/006_refresh_token_digest_contract.sql 적용
+--      (digest NOT NULL, 트리거와 refresh_token 컬럼 제거)
+
+-- 잠금을 오래 기다리며 다른 쿼리를 막지 않도록 (실패하면 다시 실행)
+SET lock_timeout = '5s';
+
+-- 1) nullable digest 컬럼 추가 (메타데이터만 변경, 테이블을 다시 쓰지 않음)
+--    신 버전은 refresh_token을 쓰지 않으므로 원문 컬럼의 NOT NULL 해제 (역시 메타데이터만 변경)
+ALTER TABLE refresh_tokens ADD COLUMN IF NOT EXISTS token_digest bytea;
+ALTER TABLE refresh_tokens ALTER COLUMN refresh_token DROP NOT NULL;
+
+-- 2) 구 버전이 넣는 행의 digest 자동 채움 (애플리케이션의 hashlib.sha256(token.encode("utf-8"))과 동일)
+CREATE OR REPLACE FUNCTION refresh_tokens_fill_digest() RETURNS trigger AS $$
+BEGIN
+    IF NEW.token_digest IS NULL AND NEW.refresh_token IS NOT NULL THEN
+        NEW.token_digest := sha256(convert_to(NEW.refresh_token, 'UTF8'));
+    END IF;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_refresh_tokens_fill_digest ON refresh_tokens;
+CREATE TRIGGER trg_refresh_tokens_fill_digest
+    BEFORE INSERT OR UPDATE OF refresh_token ON refresh_tokens
+    FOR EACH ROW EXECUTE FUNCTION refresh_tokens_fill_digest();
+
+RESET lock_timeout;
+
+-- 3) 인덱스 생성 (쓰기 잠금 없이, digest가 NULL인 기존 행은 unique 검사 대상이 아님)
+CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS uq_refresh_tokens_token_digest
+    ON refresh_tokens (token_digest) INCLUDE (user_id, expires_at, revoked);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_refresh_tokens_user_active
+    ON refresh_tokens (user_id, expires_at) WHERE revoked = false;
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_refresh_tokens_expires_at
+    ON refresh_tokens (expires_at);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_refresh_tokens_revoked
+    ON refresh_tokens (expires_at) WHERE revoked = true;
+-- 배치 backfill 대상 조회용 (backfill 후 006에서 제거)
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_refresh_tokens_digest_missing
+    ON refresh_tokens (id) WHERE token_digest IS NULL;
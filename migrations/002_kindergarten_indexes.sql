@@ -0,0 +1,18 @@
+-- ✅ kindergartens: 목록/검색용 인덱스 추가 및 created_at NOT NULL
+-- 실행: psql "$DATABASE_URL" -f migrations/002_kindergarten_indexes.sql
+
+UPDATE kindergartens SET created_at = now() AT TIME ZONE 'utc' WHERE created_at IS NULL;
+ALTER TABLE kindergartens ALTER COLUMN created_at SET NOT NULL;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_kindergartens_owner_created
+    ON kindergartens (owner_id, created_at, id);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_kindergartens_live_created
+    ON kindergartens (created_at, id) WHERE is_deleted = false;
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_kindergartens_type_created
+    ON kindergartens (type, created_at, id) WHERE is_deleted = false;
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_kindergartens_certificate_created
+    ON kindergartens (certificate_status, created_at, id) WHERE is_deleted = false;
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_kindergartens_name_prefix
+    ON kindergartens (name text_pattern_ops) WHERE is_deleted = false;
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_kindergartens_address_prefix
+    ON kindergartens (address text_pattern_ops) WHERE is_deleted = false;
@@ -0,0 +1,24 @@
+-- ✅ kindergartens: 좌표/geohash 셀/updated_at 추가 및 오프라인 지오코딩 테이블 생성
+-- 실행: psql "$DATABASE_URL" -f migrations/003_kindergarten_coordinates.sql
+-- 지오코딩 결과 적재(geocoding_service.upsert_geocoded_addresses) 후
+-- geocoding_service.backfill_coordinates()로 기존 유치원 좌표를 채웁니다.
+
+CREATE TABLE IF NOT EXISTS geocoded_addresses (
+    address VARCHAR PRIMARY KEY,
+    latitude DOUBLE PRECISION NOT NULL,
+    longitude DOUBLE PRECISION NOT NULL,
+    geohash VARCHAR(6) NOT NULL,
+    updated_at TIMESTAMP NOT NULL DEFAULT (now() AT TIME ZONE 'utc')
+);
+
+ALTER TABLE kindergartens ADD COLUMN IF NOT EXISTS latitude DOUBLE PRECISION;
+ALTER TABLE kindergartens ADD COLUMN IF NOT EXISTS longitude DOUBLE PRECISION;
+ALTER TABLE kindergartens ADD COLUMN IF NOT EXISTS geohash VARCHAR(6);
+ALTER TABLE kindergartens ADD COLUMN IF NOT EXISTS updated_at TIMESTAMP;
+UPDATE kindergartens SET updated_at = created_at WHERE updated_at IS NULL;
+ALTER TABLE kindergartens ALTER COLUMN updated_at SET NOT NULL;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_kindergartens_geohash
+    ON kindergartens (geohash) WHERE is_deleted = false;
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_kindergartens_updated
+    ON kindergartens (updated_at, id);
@@ -0,0 +1,5 @@
+-- ✅ users: updated_at 추가 (조건부 조회 ETag 버전)
+-- 실행: psql "$DATABASE_URL" -f migrations/004_user_updated_at.sql
+-- now()는 ALTER 시점에 한 번 평가되는 기본값이므로 테이블을 다시 쓰지 않습니다 (PostgreSQL 11+).
+
+ALTER TABLE users ADD COLUMN IF NOT EXISTS updated_at TIMESTAMPTZ NOT NULL DEFAULT now();
@@ -0,0 +1,36 @@
+-- ✅ users/kindergartens: unique 제약을 삭제되지 않은 행에만 적용하고 보관(archive) 테이블 생성
+-- 실행: psql "$DATABASE_URL" -f migrations/005_soft_delete_partial_indexes.sql
+-- (CREATE INDEX CONCURRENTLY는 트랜잭션 밖에서 실행되어야 하므로 -1 옵션 없이 실행)
+-- 새 부분 인덱스를 먼저 만든 뒤 기존 전체 unique 제약을 제거하므로 중간에도 중복이 허용되지 않습니다.
+-- 적용 후 ARCHIVE_ENABLED=true로 보관 작업을 켭니다.
+
+-- 1) 삭제되지 않은 행만 포함하는 unique 인덱스 (로그인/일괄 등록 ON CONFLICT 대상)
+CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS uq_users_firebase_uid_live
+    ON users (firebase_uid) WHERE is_deleted = false;
+CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS uq_users_email_live
+    ON users (email) WHERE is_deleted = false;
+CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS uq_kindergartens_business_number_live
+    ON kindergartens (business_number) WHERE is_deleted = false;
+
+-- 2) 보관 대상 조회 (삭제된 행만 포함하므로 보존 기간 안의 삭제 행 수에 비례)
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_users_deleted_at
+    ON users (deleted_at) WHERE is_deleted = true;
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_kindergartens_deleted_at
+    ON kindergartens (deleted_at) WHERE is_deleted = true;
+
+-- 3) 삭제된 행까지 포함하던 기존 unique 제약 제거 (PostgreSQL 기본 제약 이름)
+ALTER TABLE users DROP CONSTRAINT IF EXISTS users_firebase_uid_key;
+ALTER TABLE users DROP CONSTRAINT IF EXISTS users_email_key;
+ALTER TABLE kindergartens DROP CONSTRAINT IF EXISTS kindergartens_business_number_key;
+
+-- 4) 보관 테이블 (원본과 같은 컬럼 + archived_at, 조회용 인덱스/unique/FK 없음)
+CREATE TABLE IF NOT EXISTS users_archive (
+    LIKE users INCLUDING DEFAULTS,
+    archived_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+    PRIMARY KEY (id)
+);
+CREATE TABLE IF NOT EXISTS kindergartens_archive (
+    LIKE kindergartens INCLUDING DEFAULTS,
+    archived_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+    PRIMARY KEY (id)
+);
@@ -0,0 +1,27 @@
+-- ✅ refresh_tokens: 토큰 원문 컬럼 제거 (2단계: contract)
+-- 실행: psql "$DATABASE_URL" -f migrations/006_refresh_token_digest_contract.sql
+-- 전제: 001 적용, refresh_token을 쓰는 구 버전이 모두 내려감,
+--       python -m app.cli.backfill_refresh_token_digests 완료 (digest가 NULL인 행 없음)
+-- (VALIDATE CONSTRAINT / DROP INDEX CONCURRENTLY가 각각 따로 실행되도록 -1 옵션 없이 실행)
+
+-- 잠금을 오래 기다리며 다른 쿼리를 막지 않도록 (실패하면 다시 실행)
+SET lock_timeout = '5s';
+
+-- 1) NOT NULL: 테이블 전체 검사를 ACCESS EXCLUSIVE 잠금 밖에서 수행
+--    NOT VALID CHECK 추가(즉시) → VALIDATE(읽기/쓰기를 막지 않는 잠금으로 검사)
+--    → SET NOT NULL(검증된 CHECK가 있으면 다시 검사하지 않음, PostgreSQL 12+) → CHECK 제거
+ALTER TABLE refresh_tokens
+    ADD CONSTRAINT refresh_tokens_token_digest_not_null CHECK (token_digest IS NOT NULL) NOT VALID;
+ALTER TABLE refresh_tokens VALIDATE CONSTRAINT refresh_tokens_token_digest_not_null;
+ALTER TABLE refresh_tokens ALTER COLUMN token_digest SET NOT NULL;
+ALTER TABLE refresh_tokens DROP CONSTRAINT refresh_tokens_token_digest_not_null;
+
+-- 2) digest 자동 채움 트리거와 토큰 원문 컬럼(및 그 unique 인덱스) 제거 (메타데이터만 변경)
+DROP TRIGGER IF EXISTS trg_refresh_tokens_fill_digest ON refresh_tokens;
+DROP FUNCTION IF EXISTS refresh_tokens_fill_digest();
+ALTER TABLE refresh_tokens DROP COLUMN IF EXISTS refresh_token;
+
+RESET lock_timeout;
+
+-- 3) backfill용 인덱스 제거
+DROP INDEX CONCURRENTLY IF EXISTS ix_refresh_tokens_digest_missing;
@@ -0,0 +1,15 @@
+import pytest
+
+
+class FakeClock:
+    """ 테스트에서 직접 움직이는 시계 (time.time / time.monotonic 대체) """
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
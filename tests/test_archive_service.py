@@ -0,0 +1,58 @@
+import asyncio
+from types import SimpleNamespace
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.schema import CreateIndex
+from app.db.models import Kindergarten, User
+from app.services.archive_service import archive_deleted_rows
+
+
+class RecordingSession:
+    """ 실행된 SQL을 기록하고 미리 정한 rowcount를 돌려주는 세션 대체재 """
+    def __init__(self, rowcounts):
+        self.rowcounts = list(rowcounts)
+        self.statements = []
+        self.commits = 0
+
+    async def execute(self, statement):
+        self.statements.append(str(statement.compile(dialect=postgresql.dialect())))
+        return SimpleNamespace(rowcount=self.rowcounts.pop(0))
+
+    async def commit(self):
+        self.commits += 1
+
+
+def test_archive_moves_rows_in_committed_batches():
+    """✅ 유치원 → 사용자 순서로 배치마다 커밋하며 옮기고, 배치별 결과를 보고하는지 테스트"""
+    # 유치원: 2, 2, 1 / 사용자: 0
+    db = RecordingSession([2, 2, 1, 0])
+    report = asyncio.run(archive_deleted_rows(db, retention_days=30, batch_size=2))
+
+    assert report.moved == {"kindergartens": 5, "users": 0}
+    assert [(table, rows) for table, rows, _ in report.batches] == [
+        ("kindergartens", 2), ("kindergartens", 2), ("kindergartens", 1), ("users", 0),
+    ]
+    assert db.commits == 4
+    assert all("FOR UPDATE SKIP LOCKED" in sql for sql in db.statements)
+    assert db.statements[0].startswith("WITH batch AS")
+    assert "INSERT INTO kindergartens_archive" in db.statements[0]
+    # 유치원이 남아 있는 사용자는 옮기지 않음
+    assert "INSERT INTO users_archive" in db.statements[-1]
+    assert "NOT (EXISTS (SELECT * \nFROM kindergartens" in db.statements[-1]
+
+
+def test_archive_max_batches_limits_each_table():
+    """✅ max_batches만큼만 처리하고 다음 실행에서 이어서 처리하도록 멈추는지 테스트"""
+    db = RecordingSession([2, 2])
+    report = asyncio.run(archive_deleted_rows(db, retention_days=30, batch_size=2, max_batches=1))
+
+    assert report.moved == {"kindergartens": 2, "users": 2}
+    assert db.commits == 2
+
+
+def test_unique_indexes_cover_only_live_rows():
+    """✅ firebase_uid / email / business_number unique 인덱스가 삭제되지 않은 행에만 적용되는지 테스트"""
+    indexes = {index.name: index for index in (*User.__table__.indexes, *Kindergarten.__table__.indexes)}
+    for name in ("uq_users_firebase_uid_live", "uq_users_email_live", "uq_kindergartens_business_number_live"):
+        sql = str(CreateIndex(indexes[name]).compile(dialect=postgresql.dialect()))
+        assert sql.startswith("CREATE UNIQUE INDEX") and sql.endswith("WHERE is_deleted = false")
+    assert not any(column.unique for column in (User.firebase_uid, User.email, Kindergarten.business_number))
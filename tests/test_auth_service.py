@@ -0,0 +1,172 @@
+import asyncio
+import uuid
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from sqlalchemy.dialects import postgresql
+from fastapi.testclient import TestClient
+from app.main import app
+from app.services import auth_service
+from app.services.auth_service import backfill_refresh_token_digests, login_user, purge_dead_refresh_tokens
+from app.services.user_service import suspend_user
+from app.utils import security
+
+
+class RecordingSession:
+    """ 실행된 SQL을 기록하고 미리 정한 rowcount를 돌려주는 세션 대체재 """
+    def __init__(self, rowcounts):
+        self.rowcounts = list(rowcounts)
+        self.statements = []
+        self.params = []
+        self.commits = 0
+        self.info = {}
+
+    async def execute(self, statement):
+        compiled = statement.compile(dialect=postgresql.dialect())
+        self.statements.append(str(compiled))
+        self.params.append(compiled.params)
+        rowcount = self.rowcounts.pop(0)
+        return SimpleNamespace(rowcount=rowcount, one=lambda: rowcount, scalar=lambda: rowcount)
+
+    async def commit(self):
+        self.commits += 1
+
+
+def test_purge_dead_refresh_tokens_batches():
+    """✅ 배치 크기만큼 삭제되면 다음 배치를 이어서 실행하고 배치마다 커밋하는지 테스트"""
+    # 만료 토큰: 2, 2, 1 / 폐기 토큰: 0
+    db = RecordingSession([2, 2, 1, 0])
+    deleted = asyncio.run(purge_dead_refresh_tokens(db, batch_size=2))
+
+    assert deleted == 5
+    assert db.commits == 4
+    assert all("FOR UPDATE SKIP LOCKED" in sql for sql in db.statements)
+    assert all("LIMIT" in sql for sql in db.statements)
+
+def test_backfill_digests_purges_first_and_runs_in_batches():
+    """✅ digest 전환 시 만료/폐기 토큰을 먼저 지우고, 남은 행의 digest를 배치마다 커밋하며 채우는지 테스트"""
+    # 만료 토큰: 0 / 폐기 토큰: 1 / digest 채움: 2, 2, 0 / 남은 행: 0
+    db = RecordingSession([0, 1, 2, 2, 0, 0])
+    report = asyncio.run(backfill_refresh_token_digests(db, batch_size=2))
+
+    assert report == {"purged": 1, "backfilled": 4, "remaining": 0}
+    assert db.commits == 5
+    backfill = db.statements[2:5]
+    assert all("sha256(convert_to(refresh_token, 'UTF8'))" in sql for sql in backfill)
+    assert all("FOR UPDATE SKIP LOCKED" in sql and "LIMIT" in sql for sql in backfill)
+
+def test_login_user_single_transaction():
+    """✅ 로그인 쓰기 경로가 upsert 1회 + 폐기/저장 1회 + 커밋 1회로 처리되는지 테스트"""
+    user_id = uuid.uuid4()
+    db = RecordingSession([(user_id, "owner", True, False), None])
+    result = asyncio.run(login_user(
+        db,
+        firebase_uid="uid-1",
+        email="a@example.com",
+        refresh_token="refresh-token",
+        expires_at=datetime.now(timezone.utc) + timedelta(days=7),
+    ))
+
+    assert result == (user_id, "owner")
+    assert db.commits == 1
+    assert db.info["written_uids"] == {"uid-1"}
+    assert len(db.statements) == 2
+    assert "ON CONFLICT (firebase_uid) WHERE is_deleted = false DO UPDATE" in db.statements[0]
+    assert "RETURNING users.id, users.role" in db.statements[0]
+    assert db.statements[1].startswith("WITH revoked_tokens AS")
+    assert "INSERT INTO refresh_tokens" in db.statements[1]
+
+def test_same_second_logins_store_distinct_digests(monkeypatch):
+    """✅ 같은 사용자가 같은 초에 두 번 로그인해도 저장되는 refresh token digest가 겹치지 않는지 테스트"""
+    frozen = datetime(2025, 1, 1, 12, 0, 0)
+    monkeypatch.setattr(security, "datetime", SimpleNamespace(utcnow=lambda: frozen))
+    user_id = uuid.uuid4()
+    digests = []
+    for _ in range(2):
+        db = RecordingSession([(user_id, "user", True, False), None])
+        asyncio.run(login_user(
+            db,
+            firebase_uid="uid-1",
+            email="a@example.com",
+            refresh_token=security.create_refresh_token("uid-1"),
+            expires_at=datetime.now(timezone.utc) + timedelta(days=7),
+        ))
+        digests.append(db.params[1]["token_digest"])
+
+    # digest는 unique 인덱스이므로 같으면 두 번째 로그인이 실패함
+    assert digests[0] != digests[1]
+
+class UserStoreSession:
+    """ 사용자 한 명의 상태를 메모리에 두고 로그인/정지 문장만 처리하는 세션 대체재 """
+    def __init__(self, user: dict):
+        self.user = user
+        self.stored_tokens = []
+        self.rollbacks = 0
+        self.info = {}
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute(self, statement):
+        params = statement.compile().params
+        if statement.table.name == "users" and statement.is_update:
+            self.user.update({key: value for key, value in params.items() if key in self.user})
+        elif statement.table.name == "users":
+            row = (self.user["id"], self.user["role"], self.user["is_active"], self.user["is_suspended"])
+            return SimpleNamespace(one=lambda: row)
+        elif statement.is_insert:
+            self.stored_tokens.append(params["token_digest"])
+        return SimpleNamespace(scalar_one_or_none=lambda: self.user["firebase_uid"])
+
+    async def commit(self):
+        pass
+
+    async def rollback(self):
+        self.rollbacks += 1
+
+
+def test_suspended_user_cannot_log_in_again(monkeypatch):
+    """❌ 정지된 사용자가 다시 로그인하면 refresh token을 저장하지 않고 403을 반환하는지 테스트"""
+    user = {"id": uuid.uuid4(), "firebase_uid": "uid-suspended", "role": "user", "is_active": True, "is_suspended": False}
+    session = UserStoreSession(user)
+
+    async def verify(token):
+        return {"uid": "uid-suspended", "email": "s@example.com"}
+
+    monkeypatch.setattr(auth_service, "verify_firebase_token", verify)
+    monkeypatch.setattr(auth_service, "AsyncSessionLocal", lambda: session)
+    client = TestClient(app)
+
+    assert client.post("/api/v1/auth/login", json={"firebase_token": "t1"}).status_code == 200
+    assert len(session.stored_tokens) == 1
+
+    asyncio.run(suspend_user(session, user["id"]))
+    assert user["is_suspended"] is True
+
+    response = client.post("/api/v1/auth/login", json={"firebase_token": "t2"})
+    assert response.status_code == 403
+    assert "refresh_token" not in response.cookies
+    assert len(session.stored_tokens) == 1
+    assert session.rollbacks == 1
+
+
+def test_refresh_refuses_suspended_profile(monkeypatch):
+    """❌ 정지된 사용자의 남은 refresh token으로는 access token을 받을 수 없는지 테스트"""
+    class FakeSession:
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *exc):
+            return False
+
+        async def execute(self, statement):
+            return SimpleNamespace(scalars=lambda: SimpleNamespace(first=lambda: uuid.UUID(int=1)))
+
+    async def get_profile(user_id):
+        return {"firebase_uid": "uid-1", "role": "user", "is_active": True, "is_suspended": True}
+
+    monkeypatch.setattr(auth_service, "AsyncSessionLocal", FakeSession)
+    monkeypatch.setattr(auth_service, "get_user_profile_by_id", get_profile)
+    assert asyncio.run(auth_service.refresh_access_token("suspended-refresh-token")) is None
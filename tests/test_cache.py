@@ -0,0 +1,32 @@
+from app.utils.cache import ExpiringCache
+
+
+def test_expiring_cache_hit_and_expiry(clock):
+    """✅ exp 이전에는 hit, exp 이후에는 miss 처리되는지 테스트"""
+    cache = ExpiringCache(maxsize=10, clock=clock)
+    cache.set("token", {"uid": "u1"}, expires_at=1010.0)
+
+    assert cache.get("token") == {"uid": "u1"}
+    clock.now = 1010.0
+    assert cache.get("token") is None
+    assert cache.hits == 1
+    assert cache.misses == 1
+    assert len(cache) == 0
+
+def test_expiring_cache_lru_eviction(clock):
+    """✅ maxsize 초과 시 가장 오래 사용되지 않은 항목이 제거되는지 테스트"""
+    cache = ExpiringCache(maxsize=2, clock=clock)
+    cache.set("a", 1, expires_at=2000.0)
+    cache.set("b", 2, expires_at=2000.0)
+    cache.get("a")
+    cache.set("c", 3, expires_at=2000.0)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+def test_expiring_cache_ignores_expired_values(clock):
+    """✅ 이미 만료된 값은 저장하지 않는지 테스트"""
+    cache = ExpiringCache(maxsize=2, clock=clock)
+    cache.set("a", 1, expires_at=999.0)
+    assert len(cache) == 0
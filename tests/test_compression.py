@@ -0,0 +1,118 @@
+import asyncio
+import zlib
+
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi.testclient import TestClient
+from app.middleware.compression import CompressionMiddleware, negotiate_encoding
+
+BIG = {"items": [{"id": i, "name": f"해피 강아지 유치원 {i}호점"} for i in range(200)]}
+
+
+def _app(**kwargs) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/small")
+    async def small():
+        return {"ok": True}
+
+    @app.get("/big")
+    async def big():
+        return BIG
+
+    @app.get("/raw")
+    async def raw():
+        return JSONResponse(BIG, headers={"Cache-Control": "no-transform"})
+
+    app.add_middleware(CompressionMiddleware, min_size=500, level=6, **kwargs)
+    return app
+
+
+def test_negotiate_encoding():
+    """✅ q 값과 와일드카드를 반영하여 인코딩을 선택하는지 테스트"""
+    assert negotiate_encoding("gzip, deflate, br") == "gzip"
+    assert negotiate_encoding("deflate, gzip;q=0.5") == "deflate"
+    assert negotiate_encoding("gzip;q=0, deflate") == "deflate"
+    assert negotiate_encoding("br") is None
+    assert negotiate_encoding("*;q=0.1, gzip;q=0") == "deflate"
+    assert negotiate_encoding("identity") is None
+    assert negotiate_encoding("") is None
+
+
+def test_compresses_only_large_transformable_responses():
+    """✅ 임계값 이상 응답만 압축하고, 작은 응답과 no-transform 응답은 그대로 전달하는지 테스트"""
+    client = TestClient(_app())
+
+    small = client.get("/small", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in small.headers
+
+    big = client.get("/big", headers={"Accept-Encoding": "gzip"})
+    assert big.headers["content-encoding"] == "gzip"
+    assert big.headers["vary"] == "Accept-Encoding"
+    assert int(big.headers["content-length"]) < len(big.content)
+    assert big.json() == BIG
+
+    deflated = client.get("/big", headers={"Accept-Encoding": "deflate"})
+    assert deflated.headers["content-encoding"] == "deflate"
+    assert deflated.json() == BIG
+
+    raw = client.get("/raw", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in raw.headers
+    assert raw.json() == BIG
+
+
+def test_streaming_chunks_are_flushed_incrementally():
+    """✅ 스트리밍 응답의 각 청크가 sync flush되어 받은 즉시 해제 가능한지 테스트"""
+    lines = [f'{{"id": {i}, "email": "user{i}@example.com"}}\n'.encode() * 50 for i in range(3)]
+
+    async def export(scope, receive, send):
+        async def rows():
+            for line in lines:
+                yield line
+        await StreamingResponse(rows(), media_type="application/x-ndjson")(scope, receive, send)
+
+    middleware = CompressionMiddleware(export, min_size=500, level=6, cached_paths=())
+    scope = {"type": "http", "method": "GET", "path": "/export", "headers": [(b"accept-encoding", b"gzip")]}
+    sent = []
+
+    async def receive():
+        await asyncio.sleep(1)
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        sent.append(message)
+
+    asyncio.run(middleware(scope, receive, send))
+
+    headers = dict(sent[0]["headers"])
+    assert headers[b"content-encoding"] == b"gzip"
+    assert b"content-length" not in headers
+    decoder = zlib.decompressobj(zlib.MAX_WBITS | 16)
+    chunks = [message["body"] for message in sent[1:]]
+    for line, chunk in zip(lines, chunks):
+        assert decoder.decompress(chunk) == line
+    assert decoder.decompress(b"".join(chunks[len(lines):])) == b""
+    assert decoder.eof
+
+
+def test_cached_path_builds_response_once():
+    """✅ 등록된 경로는 한 번 만든 본문과 압축 결과를 재사용하는지 테스트"""
+    app = FastAPI(openapi_url=None)
+    calls = []
+
+    @app.get("/schema")
+    async def schema():
+        calls.append(1)
+        return BIG
+
+    app.add_middleware(CompressionMiddleware, min_size=500, level=6, cached_paths=("/schema",))
+    client = TestClient(app)
+
+    gzipped = [client.get("/schema", headers={"Accept-Encoding": "gzip"}) for _ in range(3)]
+    plain = client.get("/schema", headers={"Accept-Encoding": "identity"})
+
+    assert len(calls) == 1
+    assert all(r.headers["content-encoding"] == "gzip" and r.json() == BIG for r in gzipped)
+    assert "content-encoding" not in plain.headers
+    assert plain.headers["vary"] == "Accept-Encoding"
+    assert plain.json() == BIG
@@ -0,0 +1,73 @@
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+from app.routers import auth as auth_router
+from app.utils.conditional import ConditionalGet, make_etag
+from app.utils.response_utils import success_response
+from app.utils.security import create_jwt_token
+
+PROFILE = {
+    "id": "8f6f1c1e-0000-0000-0000-000000000001",
+    "firebase_uid": "uid-1",
+    "email": "a@example.com",
+    "role": "user",
+    "created_at": "2025-01-01T00:00:00+00:00",
+    "updated_at": "2025-01-02T00:00:00+00:00",
+}
+
+
+def test_conditional_get_skips_building_matching_response():
+    """✅ If-None-Match가 일치하면 응답을 만들지 않고 304를 반환하는지 테스트"""
+    app = FastAPI()
+    builds = []
+    version = {"updated_at": "v1"}
+
+    @app.get("/item")
+    async def item(conditional: ConditionalGet = Depends()):
+        def build():
+            builds.append(1)
+            return success_response(data={"name": "item"})
+        return conditional.respond(make_etag("item", 1, version["updated_at"]), build)
+
+    client = TestClient(app)
+    first = client.get("/item")
+    etag = first.headers["etag"]
+    assert first.status_code == 200 and etag.startswith('W/"')
+    assert first.headers["cache-control"] == "private, no-cache"
+
+    second = client.get("/item", headers={"If-None-Match": etag})
+    assert second.status_code == 304
+    assert second.content == b""
+    assert second.headers["etag"] == etag
+    assert len(builds) == 1
+
+    # 여러 태그 / strong 형식 / * 도 weak 비교로 일치
+    assert client.get("/item", headers={"If-None-Match": f'"other", {etag[2:]}'}).status_code == 304
+    assert client.get("/item", headers={"If-None-Match": "*"}).status_code == 304
+
+    # 버전이 바뀌면 새 태그로 200
+    version["updated_at"] = "v2"
+    third = client.get("/item", headers={"If-None-Match": etag})
+    assert third.status_code == 200 and third.headers["etag"] != etag
+
+def test_me_returns_304_for_unchanged_profile(monkeypatch):
+    """✅ /me가 프로필 버전(updated_at)이 같으면 304를 반환하는지 테스트"""
+    from app.main import app
+
+    profile = dict(PROFILE)
+
+    async def get_profile(uid):
+        return profile
+
+    monkeypatch.setattr(auth_router, "get_user_profile_by_uid", get_profile)
+    client = TestClient(app)
+    headers = {"Authorization": f"Bearer {create_jwt_token('uid-1', 'user')}"}
+
+    first = client.get("/api/v1/auth/me", headers=headers)
+    assert first.status_code == 200
+    assert first.json()["data"]["email"] == "a@example.com"
+
+    headers["If-None-Match"] = first.headers["etag"]
+    assert client.get("/api/v1/auth/me", headers=headers).status_code == 304
+
+    profile["updated_at"] = "2025-01-03T00:00:00+00:00"
+    assert client.get("/api/v1/auth/me", headers=headers).status_code == 200
@@ -0,0 +1,59 @@
+import asyncio
+
+import pytest
+from sqlalchemy import create_engine, text
+from app.db import database
+from app.db.database import TimedNullPool, TimedQueuePool, _asyncpg_connect_args, _pool_options
+
+
+def test_transaction_pooler_mode_disables_pool_and_prepared_statement_cache(monkeypatch):
+    """✅ DB_POOL_MODE=null이면 NullPool과 prepared statement 캐시 비활성화(고유 이름)를 사용하는지 테스트"""
+    monkeypatch.setattr(database.settings, "DB_POOL_MODE", "null")
+    assert _pool_options(asynchronous=False) == {"poolclass": TimedNullPool}
+
+    connect_args = _asyncpg_connect_args()
+    assert connect_args["statement_cache_size"] == 0
+    assert connect_args["prepared_statement_cache_size"] == 0
+    names = {connect_args["prepared_statement_name_func"]() for _ in range(3)}
+    assert len(names) == 3
+
+    monkeypatch.setattr(database.settings, "DB_POOL_MODE", "queue")
+    options = _pool_options(asynchronous=False)
+    assert options["poolclass"] is TimedQueuePool
+    assert options["pool_use_lifo"] is True and options["pool_pre_ping"] is False
+    assert options["pool_recycle"] == database.settings.DB_POOL_RECYCLE_SECONDS
+    assert _asyncpg_connect_args() == {}
+
+
+def test_null_pool_reports_open_connections():
+    """✅ NullPool도 열려 있는 연결 수를 집계하고 반납 시 연결을 닫는지 테스트"""
+    engine = create_engine("sqlite://", poolclass=TimedNullPool)
+    with engine.connect() as first, engine.connect() as second:
+        first.execute(text("SELECT 1"))
+        second.execute(text("SELECT 1"))
+        assert engine.pool.checkedout() == 2
+    assert engine.pool.checkedout() == 0
+    assert engine.pool.status() == "NullPool"
+
+
+def test_health_monitor_records_failures_and_recovery(monkeypatch):
+    """✅ 백그라운드 상태 확인 결과가 db_health에 반영되는지 테스트"""
+    results = iter([ConnectionError("down"), None])
+    seen = []
+
+    async def check():
+        result = next(results)
+        if result:
+            raise result
+
+    async def sleep(_):
+        seen.append(database._health["async"])
+        if len(seen) == 2:
+            raise asyncio.CancelledError
+
+    monkeypatch.setattr(database, "check_database", check)
+    monkeypatch.setattr(database.asyncio, "sleep", sleep)
+    monkeypatch.setattr(database, "_health", {})
+    with pytest.raises(asyncio.CancelledError):
+        asyncio.run(database.monitor_database_forever(interval=0))
+    assert seen == [0.0, 1.0]
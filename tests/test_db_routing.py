@@ -0,0 +1,84 @@
+import asyncio
+
+from sqlalchemy.orm import Session
+from app.db import database
+from app.db.routing import DB_READ_ROUTES, Replica, SessionRouter, track_write
+
+
+def _factory(name):
+    return lambda: name
+
+
+def _router(lags: dict, clock) -> SessionRouter:
+    """ replica 이름 -> 지연(초, 예외면 확인 실패)으로 동작하는 SQLite 대용 라우터 """
+    async def probe(engine):
+        lag = lags[engine]
+        if isinstance(lag, Exception):
+            raise lag
+        return lag
+
+    replicas = [Replica(name=name, engine=name, sessionmaker=_factory(name)) for name in lags]
+    return SessionRouter(
+        primary=_factory("primary"),
+        replicas=replicas,
+        max_lag_seconds=5.0,
+        read_your_writes_seconds=10.0,
+        check_seconds=2.0,
+        probe=probe,
+        clock=clock,
+    )
+
+
+def test_reads_use_fresh_replicas_and_fall_back_to_primary(clock):
+    """✅ 지연이 작은 replica만 라운드 로빈으로 사용하고, 없으면 primary로 보내는지 테스트"""
+    lags = {"replica1": 0.5, "replica2": 30.0, "replica3": ConnectionError("down")}
+    router = _router(lags, clock)
+
+    # 지연 확인 전에는 replica를 사용하지 않음
+    assert router.read_session() == "primary"
+
+    asyncio.run(router.check_replicas())
+    assert {router.read_session() for _ in range(4)} == {"replica1"}
+
+    lags["replica2"] = 1.0
+    asyncio.run(router.check_replicas())
+    assert {router.read_session() for _ in range(4)} == {"replica1", "replica2"}
+
+    # 확인 결과가 오래되면(모니터 중단) 지연을 알 수 없으므로 primary
+    clock.now += 60
+    assert router.read_session() == "primary"
+    assert dict(router.replica_stats())[("replica1", "available")] == 0.0
+
+
+def test_read_your_writes_window(clock):
+    """✅ 커밋한 사용자의 읽기는 일정 시간 동안 primary로 보내는지 테스트"""
+    router = _router({"replica1": 0.0}, clock)
+    asyncio.run(router.check_replicas())
+    before = DB_READ_ROUTES.labels("primary", "read_your_writes").value
+
+    router.mark_write("uid-1")
+    assert router.read_session("uid-1") == "primary"
+    assert router.read_session("uid-2") == "replica1"
+    assert DB_READ_ROUTES.labels("primary", "read_your_writes").value == before + 1
+
+    clock.now += 11
+    asyncio.run(router.check_replicas())
+    router.mark_write("uid-2")
+    assert router.read_session("uid-1") == "replica1"
+    assert list(router._recent_writes) == ["uid-2"]
+
+
+def test_commit_marks_tracked_users(monkeypatch):
+    """✅ track_write로 표시한 세션이 커밋되면 라우터에 쓰기가 기록되는지 테스트"""
+    marked = []
+    monkeypatch.setattr(database.get_session_router(), "mark_write", marked.append)
+
+    session = Session()
+    track_write(session, "uid-1")
+    track_write(session, None)
+    session.rollback()
+    assert marked == []
+    session.commit()
+    assert marked == ["uid-1"]
+    session.commit()
+    assert marked == ["uid-1"]
@@ -1,6 +1,6 @@
 import json
 from app.utils.dto import ResponseDTO
-from app.utils.response_utils import success_response, error_response
+from app.utils.response_utils import success_response, error_response, prebuilt_response
 from fastapi.responses import JSONResponse
 
 def test_response_dto():
@@ -40,3 +40,31 @@ def test_error_response():
     # 🔹 JSON 문자열 변환 후 비교
     assert response.status_code == 400
     assert json_data == json.dumps(expected_response, separators=(",", ":"))  # ✅ JSON 포맷 차이 해결
+
+def test_success_response_matches_json_response():
+    """✅ 한글/중첩 데이터도 기존 JSONResponse와 같은 bytes로 직렬화되는지 테스트"""
+    data = {"name": "도기 유치원", "tags": ["a", "b"], "count": 3, "ratio": 0.5, "empty": None}
+    expected = JSONResponse(content=ResponseDTO(code=200, msg="성공", data=data).model_dump())
+
+    response = success_response(data=data, msg="성공")
+    assert response.body == expected.body
+
+def test_success_response_serializes_models():
+    """✅ data에 pydantic 모델이 있어도 한 번에 직렬화되는지 테스트"""
+    response = success_response(data=ResponseDTO(code=1, msg="inner"), msg="OK")
+    assert json.loads(response.body) == {
+        "code": 200,
+        "msg": "OK",
+        "data": {"code": 1, "msg": "inner", "data": None},
+    }
+
+def test_prebuilt_response_returns_fresh_objects():
+    """✅ 고정 응답 팩토리가 같은 본문으로 매번 새 응답 객체를 만드는지 테스트"""
+    factory = prebuilt_response(data={"status": "running"}, msg="Server is running")
+    first, second = factory(), factory()
+
+    assert first is not second
+    assert first.body == second.body == json.dumps(
+        {"code": 200, "msg": "Server is running", "data": {"status": "running"}}, separators=(",", ":")
+    ).encode()
+    assert first.headers["content-length"] == str(len(first.body))
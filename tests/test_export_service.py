@@ -0,0 +1,104 @@
+import asyncio
+import json
+import uuid
+from datetime import datetime
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.middleware.auth import AuthMiddleware
+from app.routers.admin import router as admin_router
+from app.services import export_service
+from app.services.export_service import UserFilter, build_user_export_query, stream_export
+from app.utils.security import create_jwt_token
+
+USER_ID = uuid.UUID(int=1)
+CREATED_AT = datetime(2025, 3, 1, 9, 0)
+
+
+class FakeStreamSession:
+    """ session.stream() 호출과 yield_per 옵션을 기록하고 행을 배치 단위로 반환 """
+
+    def __init__(self, events, partitions):
+        self.events = events
+        self.partitions = partitions
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        self.events.append("closed")
+
+    async def stream(self, query):
+        self.events.append(("stream", query.get_execution_options().get("yield_per")))
+        partitions = self.partitions
+
+        class Result:
+            async def partitions(self):
+                for rows in partitions:
+                    yield rows
+
+        return Result()
+
+
+def user_row(index: int):
+    return (uuid.UUID(int=index), f"uid-{index}", f"u{index}@example.com", "user",
+            True, False, False, None, None, CREATED_AT)
+
+
+def patch_session(monkeypatch, partitions):
+    events = []
+    monkeypatch.setattr(export_service, "AsyncSessionLocal", lambda: FakeStreamSession(events, partitions))
+    return events
+
+
+def test_csv_header_is_sent_before_query(monkeypatch):
+    """✅ CSV 헤더를 쿼리 실행 전에 보내고 서버 사이드 커서 배치마다 한 청크씩 보내는지 테스트"""
+    events = patch_session(monkeypatch, [[user_row(1), user_row(2)], [user_row(3)]])
+
+    async def consume():
+        chunks = []
+        async for chunk in stream_export(build_user_export_query(UserFilter()), "csv", batch_size=2):
+            events.append("chunk")
+            chunks.append(chunk)
+        return chunks
+
+    chunks = asyncio.run(consume())
+    assert events == ["chunk", ("stream", 2), "chunk", "chunk", "closed"]
+    assert chunks[0].startswith(b"id,firebase_uid,email,role,")
+    assert chunks[1].decode().splitlines()[0] == (
+        f"{uuid.UUID(int=1)},uid-1,u1@example.com,user,true,false,false,,,2025-03-01T09:00:00"
+    )
+
+def test_user_export_query_filters():
+    """✅ 사용자 내보내기 조건과 정렬이 적용되는지 테스트"""
+    sql = str(build_user_export_query(UserFilter(role="owner", is_deleted=False, created_from=CREATED_AT)))
+    assert "users.role = :role_1" in sql
+    assert "users.is_deleted = false" in sql
+    assert "users.created_at >= :created_at_1" in sql
+    assert sql.endswith("ORDER BY users.created_at, users.id")
+
+
+app = FastAPI()
+app.add_middleware(AuthMiddleware)
+app.include_router(admin_router, prefix="/api/v1/admin")
+client = TestClient(app)
+
+def test_export_requires_admin_role():
+    """❌ 관리자 역할이 아니면 403 응답을 반환하는지 테스트"""
+    token = create_jwt_token("uid-1", "owner")
+    response = client.get("/api/v1/admin/export/users", headers={"Authorization": f"Bearer {token}"})
+    assert response.status_code == 403
+
+def test_export_streams_ndjson(monkeypatch):
+    """✅ 관리자는 NDJSON 스트리밍 응답을 받는지 테스트"""
+    patch_session(monkeypatch, [[user_row(1)], [user_row(2)]])
+    token = create_jwt_token("uid-admin", "superadmin")
+    response = client.get("/api/v1/admin/export/users", headers={"Authorization": f"Bearer {token}"})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert "attachment" in response.headers["content-disposition"]
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [line["firebase_uid"] for line in lines] == ["uid-1", "uid-2"]
+    assert lines[0]["created_at"] == "2025-03-01T09:00:00"
@@ -0,0 +1,154 @@
+import asyncio
+import os
+import uuid
+
+import pytest
+
+from app.services import import_service
+from app.services.import_service import (
+    ImportReport,
+    import_kindergartens,
+    iter_csv_records,
+    iter_ndjson_records,
+    validate_batch,
+)
+
+OWNER_ID = uuid.uuid4()
+
+
+async def stream(*chunks: bytes):
+    for chunk in chunks:
+        yield chunk
+
+
+async def collect(records):
+    return [record async for record in records]
+
+
+def make_record(business_number: str, owner_id=OWNER_ID, **overrides) -> dict:
+    record = {
+        "owner_id": str(owner_id),
+        "name": f"도기 유치원 {business_number}",
+        "business_number": business_number,
+        "type": "사립",
+        "address": "서울특별시 중구 세종대로 110",
+        "contact": "02-000-0000",
+        "email": f"kg{business_number}@example.com",
+    }
+    record.update(overrides)
+    return record
+
+
+def test_csv_records_across_chunks():
+    """✅ 청크 경계에 걸친 UTF-8 문자/따옴표 안 줄바꿈/BOM/CRLF를 처리하는지 테스트"""
+    body = (
+        "\ufeffowner_id,name,business_number,type,address,contact,email\r\n"
+        f'{OWNER_ID},"도기 유치원, 본점",BN-1,사립,"서울특별시\n중구",02-1,a@example.com\r\n'
+        f"{OWNER_ID},도기,BN-2,사립\r\n"
+    ).encode()
+    # 1바이트씩 나누어 멀티바이트 문자도 청크 경계에 걸리도록 함
+    records = asyncio.run(collect(iter_csv_records(stream(*[body[i:i + 1] for i in range(len(body))]))))
+
+    assert records[0][0] == 2
+    assert records[0][1]["name"] == "도기 유치원, 본점"
+    assert records[0][1]["address"] == "서울특별시\n중구"
+    assert records[1] == (4, None, "Expected 7 columns, got 4")
+
+def test_ndjson_records():
+    """❌ 잘못된 JSON 줄은 행 번호와 함께 오류로 반환하는지 테스트"""
+    body = b'{"name": "a"}\n\nnot json\n[1, 2]\n'
+    records = asyncio.run(collect(iter_ndjson_records(stream(body))))
+    assert records == [(1, {"name": "a"}, None), (3, None, "Invalid JSON"), (4, None, "JSON object expected")]
+
+def test_validate_batch_reports_row_errors():
+    """✅ 배치 검증에서 유효한 행과 행별 오류를 분리하는지 테스트"""
+    records = [
+        (2, make_record("BN-1")),
+        (3, make_record("BN-2", email="not-an-email")),
+        (4, make_record("BN-3", owner_id="nope", name="")),
+        (5, make_record("BN-4")),
+    ]
+    rows, errors = validate_batch(records)
+
+    assert [(line, row.business_number) for line, row in rows] == [(2, "BN-1"), (5, "BN-4")]
+    assert [line for line, _ in errors] == [3, 4]
+    assert errors[0][1][0].startswith("email:")
+    assert {message.split(":")[0] for message in errors[1][1]} == {"owner_id", "name"}
+
+def test_import_flushes_in_batches(monkeypatch):
+    """✅ batch_size마다 병합하고 파싱/검증 오류를 보고서에 모으는지 테스트"""
+    merged = []
+
+    async def fake_merge(db, rows, report):
+        merged.append([line for line, _ in rows])
+        report.inserted += len(rows)
+
+    monkeypatch.setattr(import_service, "merge_batch", fake_merge)
+
+    async def records():
+        for line in range(1, 6):
+            yield line, make_record(f"BN-{line}"), None
+        yield 6, None, "Invalid JSON"
+        yield 7, make_record("BN-7", email="x"), None
+
+    report = asyncio.run(import_kindergartens(None, records(), batch_size=2, report=ImportReport(max_errors=1)))
+
+    assert merged == [[1, 2], [3, 4], [5]]
+    assert (report.total, report.inserted, report.failed) == (7, 5, 2)
+    assert report.errors == [{"line": 6, "errors": ["Invalid JSON"]}]
+    assert report.errors_truncated
+
+
+@pytest.mark.skipif(not os.getenv("TEST_DATABASE_URL"), reason="TEST_DATABASE_URL (로컬 Postgres, asyncpg) 필요")
+def test_import_against_postgres():
+    """✅ 로컬 Postgres에서 COPY → 병합(신규/갱신/중복/소유자 없음)이 동작하는지 테스트"""
+    from sqlalchemy import select, text
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+    from app.db.database import Base
+    from app.db.models import GeocodedAddress, Kindergarten, User
+    from app.services.geocoding_service import upsert_geocoded_addresses
+
+    async def run():
+        engine = create_async_engine(os.environ["TEST_DATABASE_URL"])
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all, tables=[
+                User.__table__, Kindergarten.__table__, GeocodedAddress.__table__,
+            ])
+        session_factory = async_sessionmaker(engine, expire_on_commit=False)
+        prefix = f"T{uuid.uuid4().hex[:8]}-"
+        async with session_factory() as db:
+            owner_id = (await db.execute(text(
+                "INSERT INTO users (id, firebase_uid, email, role, is_active, is_suspended, is_deleted) "
+                "VALUES (gen_random_uuid(), :uid, :email, 'owner', true, false, false) RETURNING id"
+            ), {"uid": prefix, "email": f"{prefix}@example.com"})).scalar_one()
+            await db.commit()
+            await upsert_geocoded_addresses(db, [("서울특별시  중구 세종대로 110", 37.5663, 126.9779)])
+
+            lines = ["owner_id,name,business_number,type,address,contact,email"]
+            lines += [f"{owner_id},유치원 {i},{prefix}{i},사립,서울특별시 중구 세종대로 110,02-1,k{i}@example.com"
+                      for i in range(2000)]
+            lines.append(f"{owner_id},중복,{prefix}0,사립,부산,02-1,dup@example.com")
+            lines.append(f"{uuid.uuid4()},소유자 없음,{prefix}x,사립,부산,02-1,x@example.com")
+            lines.append(f"{owner_id},,{prefix}y,사립,부산,02-1,bad")
+            body = ("\n".join(lines) + "\n").encode()
+
+            # 한 배치 안의 중복 business_number는 마지막 행만 반영
+            report = await import_kindergartens(db, iter_csv_records(stream(body)), batch_size=5000)
+            assert (report.total, report.inserted, report.skipped, report.failed) == (2003, 2000, 1, 2)
+            assert [error["line"] for error in report.errors] == [2003, 2004]
+
+            kindergarten = (await db.execute(
+                select(Kindergarten).where(Kindergarten.business_number == f"{prefix}1")
+            )).scalar_one()
+            assert kindergarten.geohash == "wydm9q"
+            duplicate = (await db.execute(
+                select(Kindergarten.name).where(Kindergarten.business_number == f"{prefix}0")
+            )).scalar_one()
+            assert duplicate == "중복"
+
+            # 여러 배치로 다시 적재하면 모두 갱신
+            report = await import_kindergartens(db, iter_csv_records(stream(body)), batch_size=500)
+            assert (report.inserted, report.updated) == (0, 2001)
+        await engine.dispose()
+
+    asyncio.run(run())
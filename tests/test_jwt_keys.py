@@ -0,0 +1,103 @@
+import json
+import jwt
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ed25519, rsa
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+from app.utils import jwt_keys, security
+from app.utils.jwt_keys import JWTKeySet, load_key_set, load_signing_key
+from app.utils.jwt_verifier import AccessTokenVerifier
+
+
+def _pem(private_key) -> bytes:
+    return private_key.private_bytes(
+        serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()
+    )
+
+RSA_PEM = _pem(rsa.generate_private_key(public_exponent=65537, key_size=2048))
+ED25519_PEM = _pem(ed25519.Ed25519PrivateKey.generate())
+
+
+@pytest.fixture
+def use_key_set():
+    def apply(key_set):
+        jwt_keys.set_key_set(key_set)
+        security.jwt_token_cache.clear()
+    yield apply
+    jwt_keys.set_key_set(None)
+    security.jwt_token_cache.clear()
+
+
+def test_load_key_set_from_settings_json(tmp_path):
+    """✅ {"kid": "PEM 경로"} 설정에서 키 종류별 알고리즘으로 키 집합을 구성하는지 테스트"""
+    (tmp_path / "old.pem").write_bytes(RSA_PEM)
+    (tmp_path / "new.pem").write_bytes(ED25519_PEM)
+    signing_keys = json.dumps({"old": str(tmp_path / "old.pem"), "new": str(tmp_path / "new.pem")})
+
+    key_set = load_key_set(signing_keys, active_kid="new")
+    assert key_set.active.kid == "new"
+    assert {kid: key.algorithm for kid, key in key_set.keys.items()} == {"old": "RS256", "new": "EdDSA"}
+    assert load_key_set("{}") is None
+    with pytest.raises(ValueError):
+        load_key_set(signing_keys)  # 키가 여러 개면 활성 kid 지정 필요
+
+def test_rotation_keeps_old_tokens_valid(use_key_set):
+    """✅ 활성 키를 바꿔도 이전 kid로 서명한 토큰은 키가 남아 있는 동안 검증되는지 테스트"""
+    old, new = load_signing_key("old", RSA_PEM), load_signing_key("new", ED25519_PEM)
+    use_key_set(JWTKeySet([old], "old"))
+    old_token = security.create_jwt_token("uid-1", "user")
+    assert jwt.get_unverified_header(old_token) == {"alg": "RS256", "kid": "old", "typ": "JWT"}
+
+    use_key_set(JWTKeySet([old, new], "new"))
+    new_token = security.create_jwt_token("uid-1", "user")
+    assert jwt.get_unverified_header(new_token)["kid"] == "new"
+    assert security.verify_jwt_token(old_token)["uid"] == "uid-1"
+    assert security.verify_jwt_token(new_token)["uid"] == "uid-1"
+
+    # 이전 키를 제거하면 이전 토큰은 거부
+    use_key_set(JWTKeySet([new], "new"))
+    with pytest.raises(HTTPException):
+        security.verify_jwt_token(old_token)
+
+def test_jwks_endpoint_is_public_and_cacheable(use_key_set):
+    """✅ JWKS가 인증 없이 Cache-Control과 함께 공개 키만 반환하는지 테스트"""
+    from app.main import app
+
+    use_key_set(JWTKeySet([load_signing_key("k1", ED25519_PEM)]))
+    response = TestClient(app).get("/.well-known/jwks.json")
+    assert response.status_code == 200
+    assert response.headers["cache-control"].startswith("public, max-age=")
+    [jwk] = response.json()["keys"]
+    assert jwk["kid"] == "k1" and jwk["alg"] == "EdDSA" and jwk["use"] == "sig"
+    assert "d" not in jwk  # 개인 키 값은 포함하지 않음
+
+def test_verifier_validates_tokens_locally(tmp_path, use_key_set):
+    """✅ 다른 서비스용 검증기가 JWKS 공개 키로 토큰을 검증하고 위조 토큰은 거부하는지 테스트"""
+    key_set = JWTKeySet([load_signing_key("k1", RSA_PEM)])
+    use_key_set(key_set)
+    jwks_path = tmp_path / "jwks.json"
+    jwks_path.write_bytes(key_set.jwks_json)
+    verifier = AccessTokenVerifier(jwks_path.as_uri())
+
+    payload = verifier.verify(security.create_jwt_token("uid-1", "owner"))
+    assert (payload["uid"], payload["role"]) == ("uid-1", "owner")
+
+    forged = jwt.encode({"uid": "uid-1", "role": "superadmin", "exp": 9_999_999_999}, "secret", headers={"kid": "k1"})
+    with pytest.raises(jwt.PyJWTError):
+        verifier.verify(forged)
+
+def test_legacy_hs256_tokens_rejected_once_keys_are_configured(use_key_set, monkeypatch):
+    """❌ 서명 키가 설정되면 kid 없는 HS256 토큰은 JWT_ACCEPT_LEGACY_HS256일 때만 허용되는지 테스트"""
+    legacy_token = security.create_jwt_token("uid-1", "user")  # 키 집합이 없으면 HS256, kid 없음
+    assert "kid" not in jwt.get_unverified_header(legacy_token)
+    use_key_set(JWTKeySet([load_signing_key("k1", ED25519_PEM)]))
+
+    monkeypatch.setattr(security.settings, "JWT_ACCEPT_LEGACY_HS256", True)
+    assert security.verify_jwt_token(legacy_token)["uid"] == "uid-1"
+
+    security.jwt_token_cache.clear()
+    monkeypatch.setattr(security.settings, "JWT_ACCEPT_LEGACY_HS256", False)
+    with pytest.raises(HTTPException) as exc_info:
+        security.verify_jwt_token(legacy_token)
+    assert exc_info.value.status_code == 401
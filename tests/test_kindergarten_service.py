@@ -0,0 +1,101 @@
+import uuid
+from datetime import datetime
+from types import SimpleNamespace
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.dialects import postgresql
+from app.db.database import get_read_db
+from app.main import app
+from app.services.kindergarten_service import (
+    KindergartenFilter,
+    build_list_query,
+    decode_cursor,
+    encode_cursor,
+)
+from app.utils.security import create_jwt_token
+
+
+def compile_sql(query) -> str:
+    return str(query.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+
+
+def test_cursor_round_trip():
+    """✅ 커서 인코딩/디코딩 왕복 테스트"""
+    created_at = datetime(2025, 3, 1, 12, 30, 45, 123456)
+    kindergarten_id = uuid.uuid4()
+    assert decode_cursor(encode_cursor(created_at, kindergarten_id)) == (created_at, kindergarten_id)
+
+def test_invalid_cursor():
+    """❌ 잘못된 커서는 ValueError가 발생하는지 테스트"""
+    with pytest.raises(ValueError):
+        decode_cursor("not-a-cursor")
+
+def test_list_query_uses_keyset_pagination():
+    """✅ OFFSET 없이 (created_at, id) 비교와 정렬로 다음 페이지를 조회하는지 테스트"""
+    cursor = encode_cursor(datetime(2025, 1, 1), uuid.UUID(int=1))
+    sql = compile_sql(build_list_query(KindergartenFilter(type="사립"), cursor, limit=20))
+
+    assert "OFFSET" not in sql
+    assert "(kindergartens.created_at, kindergartens.id) < (" in sql
+    assert "ORDER BY kindergartens.created_at DESC, kindergartens.id DESC" in sql
+    assert "LIMIT 21" in sql
+    assert "kindergartens.type = '사립'" in sql
+    # 부분 인덱스(WHERE is_deleted = false)와 일치하도록 상수로 렌더링
+    assert "kindergartens.is_deleted = false" in sql
+
+def test_prefix_search_escapes_wildcards():
+    """✅ prefix 검색어의 LIKE 와일드카드가 이스케이프되는지 테스트"""
+    compiled = build_list_query(KindergartenFilter(name_prefix="50%_"), None, limit=10).compile(
+        dialect=postgresql.dialect()
+    )
+    assert "kindergartens.name LIKE %(name_1)s ESCAPE" in str(compiled)
+    assert compiled.params["name_1"] == "50\\%\\_%"
+
+def make_kindergarten(**overrides):
+    values = dict(
+        id=uuid.UUID(int=7), owner_id=uuid.UUID(int=1), name="도기 유치원", business_number="123-45-67890",
+        type="사립", address="서울", contact="02-000-0000", email="k@example.com", certificate_status="approved",
+        is_active=True, is_suspended=False, is_deleted=False,
+        created_at=datetime(2025, 1, 1), updated_at=datetime(2025, 1, 2),
+    )
+    values.update(overrides)
+    return SimpleNamespace(**values)
+
+async def _resolved(value):
+    return value
+
+@pytest.fixture
+def client_with(monkeypatch):
+    """ db.get이 주어진 유치원을 돌려주는 앱 클라이언트 """
+    def build(kindergarten):
+        session = SimpleNamespace(get=lambda model, key: _resolved(kindergarten))
+        app.dependency_overrides[get_read_db] = lambda: session
+        return TestClient(app)
+
+    yield build
+    app.dependency_overrides.pop(get_read_db, None)
+
+def auth_headers(role: str) -> dict:
+    return {"Authorization": f"Bearer {create_jwt_token('uid-1', role)}"}
+
+def test_deleted_and_owner_filters_require_admin(client_with):
+    """❌ 관리자가 아니면 삭제된 유치원/원장 조건으로 목록을 조회할 수 없는지 테스트"""
+    client = client_with(None)
+    for params in ({"is_deleted": "true"}, {"owner_id": str(uuid.UUID(int=1))}):
+        response = client.get("/api/v1/kindergartens", params=params, headers=auth_headers("user"))
+        assert response.status_code == 403
+
+def test_detail_hides_private_fields_and_deleted_rows(client_with):
+    """✅ 일반 사용자는 사업자 번호/연락처 없이 조회하고, 삭제된 유치원은 404인지 테스트"""
+    client = client_with(make_kindergarten())
+    public = client.get(f"/api/v1/kindergartens/{uuid.UUID(int=7)}", headers=auth_headers("user"))
+    admin = client.get(f"/api/v1/kindergartens/{uuid.UUID(int=7)}", headers=auth_headers("superadmin"))
+
+    assert public.status_code == admin.status_code == 200
+    assert not {"business_number", "contact", "email"} & public.json()["data"].keys()
+    assert admin.json()["data"]["business_number"] == "123-45-67890"
+    assert public.headers["etag"] != admin.headers["etag"]
+
+    client = client_with(make_kindergarten(is_deleted=True))
+    assert client.get(f"/api/v1/kindergartens/{uuid.UUID(int=7)}", headers=auth_headers("user")).status_code == 404
+    assert client.get(f"/api/v1/kindergartens/{uuid.UUID(int=7)}", headers=auth_headers("superadmin")).status_code == 200
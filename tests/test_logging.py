@@ -0,0 +1,72 @@
+import json
+import logging
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from app.main import app
+from app.middleware.logging import LoggingMiddleware
+from app.utils.logging_config import JsonFormatter, RequestContextFilter, request_id_var
+
+
+def build_client(sample_rate: float) -> TestClient:
+    app = FastAPI()
+
+    @app.get("/items/{item_id}")
+    async def get_item(item_id: int):
+        return {"item_id": item_id}
+
+    app.add_middleware(LoggingMiddleware, sample_rate=sample_rate, slow_request_ms=10_000)
+    return TestClient(app)
+
+def request_records(caplog):
+    return [r for r in caplog.records if r.name == "app.middleware.logging"]
+
+def test_request_log_has_structured_fields(caplog):
+    """✅ 요청 로그에 요청 ID/라우트/상태/지연 시간이 기록되는지 테스트"""
+    client = build_client(sample_rate=1.0)
+    with caplog.at_level(logging.INFO):
+        response = client.get("/items/3", headers={"X-Request-ID": "req-1"})
+
+    assert response.headers["x-request-id"] == "req-1"
+    [record] = request_records(caplog)
+    assert record.request_id == "req-1"
+    assert record.route == "/items/{item_id}"
+    assert record.path == "/items/3"
+    assert record.status == 200
+    assert record.latency_ms >= 0
+    assert record.db_queries == 0
+
+def test_successful_requests_are_sampled(caplog):
+    """✅ sample_rate=0이면 성공 요청은 생략하고 오류 요청은 기록하는지 테스트"""
+    client = build_client(sample_rate=0.0)
+    with caplog.at_level(logging.INFO):
+        client.get("/items/1")
+        client.get("/items/not-a-number")
+
+    statuses = [record.status for record in request_records(caplog)]
+    assert statuses == [422]
+
+def test_auth_rejections_are_logged(caplog):
+    """✅ 앱 미들웨어 순서에서 인증 실패(401) 응답도 로그와 X-Request-ID가 남는지 테스트"""
+    with caplog.at_level(logging.INFO):
+        response = TestClient(app).get("/api/v1/auth/me", headers={"X-Request-ID": "req-401"})
+
+    assert response.status_code == 401
+    assert response.headers["x-request-id"] == "req-401"
+    [record] = request_records(caplog)
+    assert record.request_id == "req-401"
+    assert record.status == 401
+
+def test_json_formatter():
+    """✅ JSON 포맷터가 요청 ID와 extra 필드를 한 줄 JSON으로 출력하는지 테스트"""
+    record = logging.LogRecord("app", logging.INFO, __file__, 1, "hello %s", ("도기",), None)
+    record.status = 200
+    token = request_id_var.set("req-2")
+    try:
+        RequestContextFilter().filter(record)
+    finally:
+        request_id_var.reset(token)
+
+    entry = json.loads(JsonFormatter().format(record))
+    assert entry["msg"] == "hello 도기"
+    assert entry["request_id"] == "req-2"
+    assert entry["status"] == 200
@@ -0,0 +1,92 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from app.middleware.metrics import MetricsMiddleware
+from app.utils.cache import ExpiringCache
+from app.utils.metrics import HTTP_REQUEST_DURATION, Registry
+
+
+def test_histogram_render():
+    """✅ 히스토그램이 누적 버킷/합계/개수로 출력되는지 테스트"""
+    registry = Registry()
+    histogram = registry.histogram("latency_seconds", "Latency", ("route",), buckets=(0.1, 1.0))
+    histogram.labels("/a").observe(0.05)
+    histogram.labels("/a").observe(0.1)
+    histogram.labels("/a").observe(5)
+
+    text = registry.render()
+    assert "# TYPE latency_seconds histogram" in text
+    assert 'latency_seconds_bucket{route="/a",le="0.1"} 2' in text
+    assert 'latency_seconds_bucket{route="/a",le="1"} 2' in text
+    assert 'latency_seconds_bucket{route="/a",le="+Inf"} 3' in text
+    assert 'latency_seconds_count{route="/a"} 3' in text
+
+def test_counter_gauge_and_label_escaping():
+    """✅ 카운터/게이지 출력과 레이블 값 이스케이프 테스트"""
+    registry = Registry()
+    registry.counter("events_total", "Events", ("kind",)).labels('a"b').inc(2)
+    gauge = registry.gauge("in_flight", "In flight")
+    gauge.inc()
+    gauge.inc()
+    gauge.dec()
+
+    text = registry.render()
+    assert 'events_total{kind="a\\"b"} 2' in text
+    assert "in_flight 1" in text
+
+def test_tracked_cache_stats():
+    """✅ track_cache로 등록한 캐시의 hit/miss가 노출되는지 테스트"""
+    registry = Registry()
+    cache = ExpiringCache(maxsize=10)
+    registry.track_cache("example", cache.stats)
+    cache.get("missing")
+
+    text = registry.render()
+    assert 'cache_misses_total{cache="example"} 1' in text
+    assert 'cache_hits_total{cache="example"} 0' in text
+
+def test_metrics_middleware_uses_route_template():
+    """✅ 요청 지연 시간이 경로 템플릿 레이블로 기록되는지 테스트"""
+    app = FastAPI()
+
+    @app.get("/things/{thing_id}")
+    async def get_thing(thing_id: int):
+        return {"thing_id": thing_id}
+
+    app.add_middleware(MetricsMiddleware)
+    client = TestClient(app)
+    client.get("/things/1")
+    client.get("/things/2")
+
+    child = HTTP_REQUEST_DURATION.labels("GET", "/things/{thing_id}", "200")
+    assert child.count >= 2
+
+def test_metrics_middleware_buckets_unknown_methods():
+    """✅ 임의의 HTTP 메서드는 "other" 레이블로 묶여 새 시계열이 생기지 않는지 테스트"""
+    app = FastAPI()
+    app.add_middleware(MetricsMiddleware)
+    client = TestClient(app)
+    for method in ("FOO", "BAR"):
+        client.request(method, "/nowhere")
+
+    methods = {labels[0] for labels in HTTP_REQUEST_DURATION._children}
+    assert "FOO" not in methods and "BAR" not in methods
+    assert HTTP_REQUEST_DURATION.labels("other", "unmatched", "404").count >= 2
+
+def test_metrics_endpoint_requires_token_or_allowed_network(monkeypatch):
+    """❌ /metrics는 인증 없이 열려 있지 않고, 수집기 토큰 또는 허용된 IP에서만 접근되는지 테스트"""
+    from app.main import app
+    from app.middleware.auth import AUTH_WHITELIST
+    from app.utils import security
+
+    assert "/metrics" not in AUTH_WHITELIST
+    monkeypatch.setattr(security.settings, "METRICS_TOKEN", "scrape-secret")
+    client = TestClient(app)  # 클라이언트 주소 "testclient"는 허용 목록에 없음
+
+    assert client.get("/metrics").status_code == 401
+    assert client.get("/metrics", headers={"Authorization": "Bearer wrong"}).status_code == 401
+    response = client.get("/metrics", headers={"Authorization": "Bearer scrape-secret"})
+    assert response.status_code == 200
+    assert "http_request_duration_seconds" in response.text
+
+    assert security.is_metrics_client("127.0.0.1", None)
+    assert not security.is_metrics_client("10.0.0.5", None)
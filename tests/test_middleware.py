@@ -0,0 +1,58 @@
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+from app.middleware.auth import AuthMiddleware
+from app.middleware.logging import LoggingMiddleware
+import jwt
+from app.utils.security import ALGORITHM, SECRET_KEY, create_jwt_token, create_refresh_token
+
+app = FastAPI()
+app.add_middleware(LoggingMiddleware)
+app.add_middleware(AuthMiddleware)
+
+@app.get("/protected")
+async def protected(request: Request):
+    return {"user": request.state.user}
+
+@app.post("/api/v1/auth/login")
+async def login():
+    return {"ok": True}
+
+client = TestClient(app)
+
+def test_whitelisted_path_skips_auth():
+    """✅ 화이트리스트 경로는 토큰 없이 접근 가능한지 테스트"""
+    response = client.post("/api/v1/auth/login")
+    assert response.status_code == 200
+
+def test_missing_token_returns_401():
+    """❌ 토큰이 없으면 401 응답을 반환하는지 테스트"""
+    response = client.get("/protected")
+    assert response.status_code == 401
+    assert response.json() == {"detail": "Unauthorized: Missing token"}
+
+def test_invalid_token_returns_401():
+    """❌ 잘못된 토큰이면 401 응답을 반환하는지 테스트"""
+    response = client.get("/protected", headers={"Authorization": "Bearer broken"})
+    assert response.status_code == 401
+    assert response.json() == {"detail": "Invalid token"}
+
+def test_valid_token_sets_request_state():
+    """✅ 검증된 payload가 request.state.user에 저장되는지 테스트"""
+    token = create_jwt_token("uid-1", "owner")
+    response = client.get("/protected", headers={"Authorization": f"Bearer {token}"})
+    assert response.status_code == 200
+    assert response.json() == {"user": {"uid": "uid-1", "role": "owner"}}
+
+def test_refresh_token_as_bearer_returns_401():
+    """❌ refresh token을 Bearer로 보내면 500이 아니라 401을 반환하는지 테스트"""
+    token = create_refresh_token("uid-1")
+    response = client.get("/protected", headers={"Authorization": f"Bearer {token}"})
+    assert response.status_code == 401
+    assert response.json() == {"detail": "Invalid token"}
+
+def test_token_without_exp_returns_401():
+    """❌ 서명이 유효해도 exp가 없는 토큰은 401을 반환하는지 테스트"""
+    token = jwt.encode({"uid": "uid-1", "role": "user"}, SECRET_KEY, algorithm=ALGORITHM)
+    response = client.get("/protected", headers={"Authorization": f"Bearer {token}"})
+    assert response.status_code == 401
+    assert response.json() == {"detail": "Invalid token"}
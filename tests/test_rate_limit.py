@@ -0,0 +1,84 @@
+import asyncio
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from app.middleware.rate_limit import (
+    InMemoryTokenBucketBackend,
+    RateLimiter,
+    RateLimitMiddleware,
+    RateLimitPolicy,
+)
+
+
+class FailingBackend:
+    """ 항상 연결 오류를 내는 Redis 백엔드 """
+    def __init__(self):
+        self.calls = 0
+
+    async def acquire(self, key, policy, requested):
+        self.calls += 1
+        raise ConnectionError("redis down")
+
+
+def test_policy_parse():
+    """✅ "요청 수/초" 형식의 정책 파싱 테스트"""
+    policy = RateLimitPolicy.parse("10/5")
+    assert policy.limit == 10
+    assert policy.period == 5.0
+    assert policy.refill_rate == 2.0
+
+def test_limiter_batches_backend_calls(clock):
+    """✅ 로컬 lease로 대부분의 검사를 처리하고 Redis 호출은 batch 단위로 하는지 테스트"""
+    limiter = RateLimiter(InMemoryTokenBucketBackend(clock=clock), batch=5, clock=clock)
+    policy = RateLimitPolicy.parse("10/10")
+
+    async def run():
+        return [await limiter.allow("k", policy) for _ in range(12)]
+
+    results = asyncio.run(run())
+    assert results == [True] * 10 + [False] * 2
+    # 5개씩 2번 + 거부 1번 (거부 결과는 로컬에 캐싱)
+    assert limiter.backend_calls == 3
+
+def test_limiter_refills_over_time(clock):
+    """✅ 시간이 지나면 토큰이 다시 채워지는지 테스트"""
+    limiter = RateLimiter(InMemoryTokenBucketBackend(clock=clock), batch=1, clock=clock)
+    policy = RateLimitPolicy.parse("2/2")
+
+    async def run():
+        first = [await limiter.allow("k", policy) for _ in range(3)]
+        clock.now += 1.0
+        return first, await limiter.allow("k", policy)
+
+    first, after_refill = asyncio.run(run())
+    assert first == [True, True, False]
+    assert after_refill is True
+
+def test_limiter_degrades_when_backend_fails(clock):
+    """✅ Redis 장애 시 프로세스 내 버킷으로 대체하고 재시도를 미루는지 테스트"""
+    backend = FailingBackend()
+    limiter = RateLimiter(backend, batch=1, clock=clock, retry_after_failure=5.0)
+    policy = RateLimitPolicy.parse("2/10")
+
+    async def run():
+        return [await limiter.allow("k", policy) for _ in range(3)]
+
+    assert asyncio.run(run()) == [True, True, False]
+    assert backend.calls == 1
+
+def test_middleware_returns_429():
+    """❌ 제한 초과 시 429 응답과 Retry-After 헤더를 반환하는지 테스트"""
+    app = FastAPI()
+
+    @app.get("/ping")
+    async def ping():
+        return {"ok": True}
+
+    limiter = RateLimiter(InMemoryTokenBucketBackend(), batch=1)
+    app.add_middleware(RateLimitMiddleware, limiter=limiter)
+    client = TestClient(app)
+
+    statuses = [client.get("/ping").status_code for _ in range(11)]
+    assert statuses == [200] * 10 + [429]
+    response = client.get("/ping")
+    assert response.json() == {"detail": "Too many requests"}
+    assert "retry-after" in response.headers
@@ -0,0 +1,78 @@
+import asyncio
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+from app.middleware import auth as auth_middleware
+from app.middleware.auth import AuthMiddleware
+from app.utils import security
+from app.utils.revocation import InMemoryRevocationBroker, RevocationList, TokenRevocation
+
+
+def test_revoked_token_is_pruned_after_exp(clock):
+    """✅ 폐기된 jti는 토큰 exp까지만 보관되는지 테스트"""
+    revoked = RevocationList(clock=clock)
+    revoked.apply({"kind": "token", "key": "jti-1", "expires_at": 1060.0})
+
+    assert revoked.is_revoked({"uid": "uid-1", "jti": "jti-1", "iat": 990})
+    assert not revoked.is_revoked({"uid": "uid-1", "jti": "jti-2", "iat": 990})
+
+    clock.now = 1061.0
+    assert revoked.prune() == 1
+    assert len(revoked) == 0
+
+def test_user_revocation_only_affects_tokens_issued_before(clock):
+    """✅ 사용자 단위 폐기는 폐기 시각 이전에 발급된 토큰에만 적용되는지 테스트"""
+    revoked = RevocationList(clock=clock)
+    revoked.apply({"kind": "user", "key": "uid-1", "revoked_at": 1000.5, "expires_at": 1900.5})
+
+    assert revoked.is_revoked({"uid": "uid-1", "jti": "a", "iat": 1000})
+    assert revoked.is_revoked({"uid": "uid-1"})  # jti/iat가 없는 이전 토큰
+    assert not revoked.is_revoked({"uid": "uid-1", "jti": "b", "iat": 1001})
+    assert not revoked.is_revoked({"uid": "uid-2", "jti": "c", "iat": 1000})
+
+def test_revocation_syncs_across_workers():
+    """✅ 한 워커의 폐기가 구독 중인 워커와 나중에 시작한 워커(스냅샷)에 모두 반영되는지 테스트"""
+    broker = InMemoryRevocationBroker()
+    first, second, late = (TokenRevocation(broker) for _ in range(3))
+
+    async def run():
+        sync = asyncio.create_task(second.sync_forever())
+        while not second.synced:
+            await asyncio.sleep(0)
+        await first.revoke_token("jti-1", 9_999_999_999)
+        await first.revoke_user("uid-2")
+        await asyncio.sleep(0)
+        late_sync = asyncio.create_task(late.sync_forever())
+        while not late.synced:
+            await asyncio.sleep(0)
+        sync.cancel()
+        late_sync.cancel()
+
+    asyncio.run(run())
+    for worker in (first, second, late):
+        assert worker.is_revoked({"uid": "uid-1", "jti": "jti-1", "iat": 0})
+        assert worker.is_revoked({"uid": "uid-2", "jti": "jti-9", "iat": 0})
+
+def test_middleware_rejects_revoked_token(monkeypatch):
+    """❌ 폐기된 access token은 exp 전이라도 401을 반환하는지 테스트"""
+    revocation = TokenRevocation(InMemoryRevocationBroker())
+    monkeypatch.setattr(auth_middleware, "token_revocation", revocation)
+
+    app = FastAPI()
+    app.add_middleware(AuthMiddleware)
+
+    @app.get("/protected")
+    async def protected(request: Request):
+        return {"user": request.state.user}
+
+    client = TestClient(app)
+    token = security.create_jwt_token("uid-1", "user")
+    other = security.create_jwt_token("uid-1", "user")
+    assert client.get("/protected", headers={"Authorization": f"Bearer {token}"}).status_code == 200
+
+    payload = security.verify_jwt_token(token)
+    asyncio.run(revocation.revoke_token(payload["jti"], payload["exp"]))
+
+    response = client.get("/protected", headers={"Authorization": f"Bearer {token}"})
+    assert response.status_code == 401
+    assert response.json() == {"detail": "Token has been revoked"}
+    assert client.get("/protected", headers={"Authorization": f"Bearer {other}"}).status_code == 200
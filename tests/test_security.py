@@ -0,0 +1,60 @@
+import asyncio
+import time
+import pytest
+from app.utils import security
+
+
+def test_verify_firebase_token_is_cached(monkeypatch):
+    """✅ 같은 Firebase 토큰은 exp까지 한 번만 검증되는지 테스트"""
+    calls = []
+
+    def fake_verify_id_token(token):
+        calls.append(token)
+        return {"uid": "uid-1", "email": "a@example.com", "exp": time.time() + 60}
+
+    monkeypatch.setattr(security.auth, "verify_id_token", fake_verify_id_token)
+    # 자격 증명 파일 없이 실행되도록 초기화된 Firebase 앱으로 대체
+    monkeypatch.setattr(security.firebase_admin, "_apps", {"[DEFAULT]": object()})
+    security.firebase_token_cache.clear()
+
+    async def burst():
+        first = await security.verify_firebase_token("firebase-token")
+        second = await security.verify_firebase_token("firebase-token")
+        return first, second
+
+    first, second = asyncio.run(burst())
+    assert first == second == {"uid": "uid-1", "email": "a@example.com"}
+    assert calls == ["firebase-token"]
+
+def test_verify_firebase_token_invalid(monkeypatch):
+    """❌ 검증 실패 시 ValueError가 발생하는지 테스트"""
+    def fake_verify_id_token(token):
+        raise RuntimeError("bad signature")
+
+    monkeypatch.setattr(security.auth, "verify_id_token", fake_verify_id_token)
+    # 자격 증명 파일 없이 실행되도록 초기화된 Firebase 앱으로 대체
+    monkeypatch.setattr(security.firebase_admin, "_apps", {"[DEFAULT]": object()})
+    security.firebase_token_cache.clear()
+
+    with pytest.raises(ValueError):
+        asyncio.run(security.verify_firebase_token("broken-token"))
+
+def test_verify_jwt_token_uses_cache():
+    """✅ 같은 액세스 토큰의 두 번째 검증은 캐시에서 처리되는지 테스트"""
+    security.jwt_token_cache.clear()
+    token = security.create_jwt_token("uid-1", "user")
+    hits_before = security.jwt_token_cache.hits
+
+    first = security.verify_jwt_token(token)
+    second = security.verify_jwt_token(token)
+
+    assert first["uid"] == second["uid"] == "uid-1"
+    assert security.jwt_token_cache.hits == hits_before + 1
+
+def test_verify_jwt_token_invalid():
+    """❌ 잘못된 토큰은 401 HTTPException이 발생하고 캐싱되지 않는지 테스트"""
+    security.jwt_token_cache.clear()
+    with pytest.raises(security.HTTPException) as exc_info:
+        security.verify_jwt_token("not-a-jwt")
+    assert exc_info.value.status_code == 401
+    assert len(security.jwt_token_cache) == 0
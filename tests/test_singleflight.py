@@ -0,0 +1,148 @@
+import asyncio
+import time
+import uuid
+from types import SimpleNamespace
+
+from app.services import auth_service
+from app.utils import security
+from app.utils.singleflight import SingleFlight
+
+
+class FakeRedis:
+    """ single-flight가 사용하는 명령만 구현한 Redis 대체재 (TTL 무시) """
+    def __init__(self):
+        self.data = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value, nx=False, px=None):
+        if nx and key in self.data:
+            return None
+        self.data[key] = value
+        return True
+
+    async def delete(self, key):
+        self.data.pop(key, None)
+
+    async def exists(self, key):
+        return int(key in self.data)
+
+
+def test_concurrent_calls_share_one_execution():
+    """✅ 같은 키의 동시 호출 50개가 한 번만 실행되고, 결과와 예외를 함께 받는지 테스트"""
+    flight = SingleFlight("test")
+    calls = []
+
+    async def work(value):
+        calls.append(value)
+        await asyncio.sleep(0.01)
+        if value == "bad":
+            raise ValueError("bad")
+        return {"value": value}
+
+    async def run():
+        results = await asyncio.gather(*(flight.do("k", lambda: work("ok")) for _ in range(50)))
+        errors = await asyncio.gather(*(flight.do("e", lambda: work("bad")) for _ in range(5)), return_exceptions=True)
+        # 완료 후의 호출은 다시 실행 (결과를 캐싱하지 않음)
+        await flight.do("k", lambda: work("again"))
+        return results, errors
+
+    results, errors = asyncio.run(run())
+    assert calls == ["ok", "bad", "again"]
+    assert all(result == {"value": "ok"} for result in results)
+    assert all(isinstance(error, ValueError) for error in errors)
+    assert len(flight) == 0
+
+
+def test_redis_lock_coalesces_across_workers():
+    """✅ Redis 락을 공유하는 두 워커의 동시 호출이 한 번만 실행되는지 테스트"""
+    redis = FakeRedis()
+    workers = [SingleFlight("test", redis_enabled=True, poll_ms=1, redis=redis) for _ in range(2)]
+    calls = []
+
+    async def work():
+        calls.append(1)
+        await asyncio.sleep(0.02)
+        return {"token": "t"}
+
+    async def run():
+        return await asyncio.gather(*(workers[i % 2].do("k", work) for i in range(20)))
+
+    results = asyncio.run(run())
+    assert len(calls) == 1
+    assert all(result == {"token": "t"} for result in results)
+    assert "singleflight:test:k:lock" not in redis.data
+
+
+def test_redis_result_is_not_reused_after_leader_finishes():
+    """❌ 리더가 끝난 뒤 다른 워커의 호출이 남아 있는 결과(무효화 전 값)를 받지 않고 다시 실행하는지 테스트"""
+    redis = FakeRedis()
+    workers = [SingleFlight("test", redis_enabled=True, poll_ms=1, redis=redis) for _ in range(2)]
+    versions = iter(["old", "new"])
+
+    async def work():
+        return {"profile": next(versions)}
+
+    async def run():
+        first = await workers[0].do("k", work)
+        # 결과 키는 result_ttl_ms 동안 남아 있지만, 락이 풀린 뒤의 호출은 새 리더가 됨
+        second = await workers[1].do("k", work)
+        return first, second
+
+    assert asyncio.run(run()) == ({"profile": "old"}, {"profile": "new"})
+
+def test_refresh_burst_costs_one_db_round_trip(monkeypatch):
+    """✅ 같은 refresh token으로 동시에 들어온 요청 50개가 DB 조회 1번으로 처리되는지 테스트"""
+    user_id = uuid.uuid4()
+    statements = []
+
+    class FakeSession:
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *exc):
+            return False
+
+        async def execute(self, statement):
+            statements.append(statement)
+            await asyncio.sleep(0.01)
+            return SimpleNamespace(scalars=lambda: SimpleNamespace(first=lambda: user_id))
+
+    async def get_profile(requested_id):
+        assert requested_id == user_id
+        return {"firebase_uid": "uid-1", "role": "user", "is_active": True, "is_suspended": False}
+
+    monkeypatch.setattr(auth_service, "AsyncSessionLocal", FakeSession)
+    monkeypatch.setattr(auth_service, "get_user_profile_by_id", get_profile)
+
+    async def burst():
+        return await asyncio.gather(*(auth_service.refresh_access_token("refresh-token") for _ in range(50)))
+
+    tokens = asyncio.run(burst())
+    # access token은 Redis로 공유하지 않음 (프로세스 내 병합만)
+    assert auth_service.refresh_flight.redis_enabled is False
+    assert len(statements) == 1
+    assert len(set(tokens)) == 1
+    assert security.verify_jwt_token(tokens[0])["uid"] == "uid-1"
+
+
+def test_firebase_verification_burst_verifies_once(monkeypatch):
+    """✅ 같은 Firebase 토큰의 동시 검증 50개가 검증 1번으로 처리되는지 테스트"""
+    calls = []
+
+    def fake_verify_id_token(token):
+        calls.append(token)
+        time.sleep(0.02)
+        return {"uid": "uid-1", "email": "a@example.com", "exp": time.time() + 60}
+
+    monkeypatch.setattr(security.auth, "verify_id_token", fake_verify_id_token)
+    monkeypatch.setattr(security.firebase_admin, "_apps", {"[DEFAULT]": object()})
+    security.firebase_token_cache.clear()
+
+    async def burst():
+        return await asyncio.gather(*(security.verify_firebase_token("burst-token") for _ in range(50)))
+
+    results = asyncio.run(burst())
+    assert calls == ["burst-token"]
+    assert all(result == {"uid": "uid-1", "email": "a@example.com"} for result in results)
@@ -0,0 +1,110 @@
+import asyncio
+import random
+import uuid
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+from sqlalchemy.dialects import postgresql
+
+from app.services.spatial_index import SpatialIndex, SpatialEntry
+from app.utils import geohash
+
+
+def make_row(latitude, longitude, updated_at=None, **overrides):
+    row = dict(
+        id=uuid.uuid4(), name="도기 유치원", address="서울특별시 중구", type="사립",
+        latitude=latitude, longitude=longitude,
+        is_active=True, is_suspended=False, is_deleted=False,
+        updated_at=updated_at or datetime(2025, 1, 1),
+    )
+    row.update(overrides)
+    return SimpleNamespace(**row)
+
+
+class FakeSession:
+    """ 배치 조회 쿼리를 기록하고 미리 정한 결과를 순서대로 반환 """
+
+    def __init__(self, batches):
+        self.batches = list(batches)
+        self.queries = []
+
+    async def execute(self, query):
+        self.queries.append(str(query.compile(dialect=postgresql.dialect())))
+        rows = self.batches.pop(0) if self.batches else []
+        return SimpleNamespace(all=lambda: rows)
+
+
+def test_geohash_encode():
+    """✅ geohash 인코딩이 표준 값과 일치하고 셀 경계 안에 좌표가 포함되는지 테스트"""
+    assert geohash.encode(57.64911, 10.40744, 11) == "u4pruydqqvj"
+    min_lat, min_lon, max_lat, max_lon = geohash.decode_bbox(geohash.encode(37.5665, 126.9780))
+    assert min_lat <= 37.5665 < max_lat and min_lon <= 126.9780 < max_lon
+
+def test_covering_cells_contain_points_within_radius():
+    """✅ 반경 안의 모든 좌표가 덮는 셀 집합에 포함되는지 테스트 (날짜 변경선 포함)"""
+    rng = random.Random(7)
+    for center in ((37.5665, 126.9780), (-33.86, 151.21), (0.0, 179.999)):
+        cells = geohash.covering_cells(*center, 3000)
+        for _ in range(500):
+            lat = center[0] + rng.uniform(-0.03, 0.03)
+            lon = center[1] + rng.uniform(-0.04, 0.04)
+            lon = ((lon + 180.0) % 360.0) - 180.0
+            if geohash.haversine_m(center[0], center[1], lat, lon) <= 3000:
+                assert geohash.encode(lat, lon) in cells
+
+def test_nearest_matches_brute_force():
+    """✅ 공간 인덱스의 k-최근접 결과가 전체 탐색 결과와 같은지 테스트"""
+    rng = random.Random(42)
+    index = SpatialIndex()
+    entries = []
+    for i in range(3000):
+        entry = SpatialEntry(uuid.UUID(int=i), f"유치원 {i}", "주소", "사립",
+                             37.4 + rng.random() * 0.3, 126.8 + rng.random() * 0.4)
+        index.upsert(entry)
+        entries.append(entry)
+
+    center = (37.55, 127.0)
+    expected = sorted(
+        (geohash.haversine_m(*center, entry.latitude, entry.longitude), entry.id) for entry in entries
+    )
+    nearest = index.nearest(*center, k=10, max_radius_m=20000)
+    assert [entry.id for _, entry in nearest] == [entry_id for _, entry_id in expected[:10]]
+
+    within = index.within(*center, 2000)
+    assert [entry.id for _, entry in within] == [entry_id for distance, entry_id in expected if distance <= 2000]
+
+def test_apply_removes_unsearchable_rows():
+    """✅ 삭제/정지되거나 좌표가 없어진 유치원은 인덱스에서 제거되는지 테스트"""
+    index = SpatialIndex()
+    row = make_row(37.5665, 126.9780)
+    index.apply(row)
+    assert len(index.nearest(37.5665, 126.9780, k=5, max_radius_m=1000)) == 1
+
+    index.apply(make_row(37.5665, 126.9780, id=row.id, is_deleted=True))
+    assert len(index) == 0
+    assert index.nearest(37.5665, 126.9780, k=5, max_radius_m=1000) == []
+
+    # 이동한 유치원은 새 셀로 옮겨짐
+    index.apply(row)
+    index.apply(make_row(35.1587, 129.1604, id=row.id))
+    assert index.nearest(37.5665, 126.9780, k=5, max_radius_m=1000) == []
+    assert len(index.nearest(35.1587, 129.1604, k=5, max_radius_m=1000)) == 1
+
+def test_refresh_reads_changes_after_watermark():
+    """✅ 첫 갱신은 전체를 배치로 읽고, 이후에는 워터마크(- lag) 이후 변경분만 읽는지 테스트"""
+    index = SpatialIndex()
+    base = datetime(2025, 1, 1)
+    first = [make_row(37.5, 127.0, base + timedelta(seconds=i)) for i in range(2)]
+    second = [make_row(37.6, 127.1, base + timedelta(seconds=2))]
+    session = FakeSession([first, second])
+
+    assert asyncio.run(index.refresh(session, batch_size=2, lag_seconds=60)) == 3
+    assert index.ready and len(index) == 3
+    assert index.watermark == base + timedelta(seconds=2)
+    assert "updated_at >" not in session.queries[0]
+    # 두 번째 배치는 (updated_at, id) keyset으로 이어서 조회
+    assert "(kindergartens.updated_at, kindergartens.id) > (" in session.queries[1]
+
+    session = FakeSession([[]])
+    asyncio.run(index.refresh(session, batch_size=2, lag_seconds=60))
+    assert "kindergartens.updated_at > %(updated_at_1)s" in session.queries[0]
@@ -0,0 +1,122 @@
+import asyncio
+import os
+import subprocess
+import sys
+
+import pytest
+from app.utils.config import Settings
+from app.utils import startup
+from app.utils.startup import DependencyCheck, Readiness, default_checks
+
+
+async def ok():
+    return None
+
+
+async def broken():
+    raise ConnectionError("connection refused")
+
+
+async def slow():
+    await asyncio.sleep(1)
+
+
+def test_warm_up_runs_in_parallel_and_tolerates_failures():
+    """✅ 워밍업이 병렬로 실행되고 실패/시간 초과한 의존성이 있어도 끝까지 진행되는지 테스트"""
+    readiness = Readiness([
+        DependencyCheck("database", ok, ok),
+        DependencyCheck("firebase", broken, ok),
+        DependencyCheck("redis", slow, ok),
+    ])
+
+    async def run():
+        before = await readiness.check()
+        started = asyncio.get_running_loop().time()
+        results = await readiness.warm_up(timeout=0.2)
+        elapsed = asyncio.get_running_loop().time() - started
+        return before, results, elapsed, await readiness.check()
+
+    before, results, elapsed, after = asyncio.run(run())
+    # 워밍업 전에는 의존성이 응답해도 준비되지 않은 상태
+    assert before[0] is False
+    assert results["database"].ok
+    assert results["firebase"].error == "ConnectionError: connection refused"
+    assert results["redis"].error == "timeout"
+    assert elapsed < 0.5
+    # 워밍업 실패와 무관하게 현재 의존성이 모두 응답하면 준비 완료
+    assert after[0] is True
+
+def test_readiness_reports_failing_dependency():
+    """❌ 확인에 실패한 의존성이 있으면 준비되지 않은 상태로 보고하는지 테스트"""
+    readiness = Readiness([DependencyCheck("database", ok, broken), DependencyCheck("firebase", ok, ok)])
+
+    async def run():
+        await readiness.warm_up()
+        return await readiness.check()
+
+    is_ready, checks = asyncio.run(run())
+    assert is_ready is False
+    assert checks["database"]["ok"] is False
+    assert checks["firebase"]["ok"] is True
+
+def test_redis_is_checked_when_any_redis_feature_is_enabled(monkeypatch):
+    """✅ Redis를 쓰는 기능 중 하나라도 켜져 있으면 /ready가 Redis를 확인하는지 테스트"""
+    flags = ("RATE_LIMIT_ENABLED", "USER_CACHE_REDIS_ENABLED", "REVOCATION_REDIS_ENABLED", "SINGLEFLIGHT_REDIS_ENABLED")
+    for flag in flags:
+        monkeypatch.setattr(startup.settings, flag, False)
+    assert "redis" not in [check.name for check in default_checks()]
+
+    for flag in flags:
+        monkeypatch.setattr(startup.settings, flag, True)
+        assert "redis" in [check.name for check in default_checks()], flag
+        monkeypatch.setattr(startup.settings, flag, False)
+
+def test_settings_are_read_at_instantiation(monkeypatch):
+    """✅ 설정을 생성 시점에 읽고, 소문자 DB 접속 정보와 시스템 USER를 구분하는지 테스트"""
+    monkeypatch.setenv("USER", "root")
+    monkeypatch.setenv("user", "doggy")
+    monkeypatch.setenv("password", "secret")
+    monkeypatch.setenv("host", "db.example.com")
+    monkeypatch.setenv("port", "5432")
+    monkeypatch.setenv("dbname", "postgres")
+    monkeypatch.setenv("RATE_LIMIT_ENABLED", "true")
+    monkeypatch.setenv("FIREBASE_PRIVATE_KEY", "line1\\nline2")
+    monkeypatch.delenv("DATABASE_URL", raising=False)
+
+    settings = Settings(_env_file=None)
+    assert settings.USER == "doggy"
+    assert settings.DATABASE_URL.startswith("postgresql+psycopg2://doggy:")
+    assert "@db.example.com:5432/" in settings.ASYNC_DATABASE_URL
+    assert settings.RATE_LIMIT_ENABLED is True
+    assert settings.FIREBASE_PRIVATE_KEY == "line1\nline2"
+
+def test_incomplete_database_settings_fail_on_first_use(monkeypatch):
+    """❌ DB 접속 정보가 일부 비어 있으면 URL을 만들지 않고, 엔진 생성 시 빠진 설정을 알려주는지 테스트"""
+    from app.db import database
+
+    for name in ("DATABASE_URL", "ASYNC_DATABASE_URL", "password", "port", "dbname"):
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.setenv("user", "doggy")
+    monkeypatch.setenv("host", "db.example.com")
+
+    settings = Settings(_env_file=None)
+    assert settings.DATABASE_URL is None and settings.ASYNC_DATABASE_URL is None
+    assert settings.missing_database_settings() == ["password", "port", "dbname"]
+
+    monkeypatch.setattr(database, "settings", settings)
+    monkeypatch.setattr(database, "_async_engine", None)
+    with pytest.raises(RuntimeError, match="password, port, dbname"):
+        database.get_async_engine()
+
+def test_importing_app_has_no_external_side_effects():
+    """✅ 접속 정보 없이도 app.main을 import할 수 있고, Firebase 초기화/Redis import/DB 엔진 생성이 일어나지 않는지 테스트"""
+    code = (
+        "import sys, firebase_admin, app.main; "
+        "from app.db import database; "
+        "assert not firebase_admin._apps; "
+        "assert 'redis' not in sys.modules; "
+        "assert database._engine is None and database._async_engine is None"
+    )
+    env = {key: value for key, value in os.environ.items() if key not in ("user", "password", "host", "port", "dbname")}
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, env=env)
+    assert result.returncode == 0, result.stderr
@@ -0,0 +1,92 @@
+import asyncio
+from app.services.user_service import UserProfileCache
+
+PROFILE = {
+    "id": "8f6f1c1e-0000-0000-0000-000000000001",
+    "firebase_uid": "uid-1",
+    "email": "a@example.com",
+    "role": "user",
+    "is_active": True,
+    "is_suspended": False,
+    "is_deleted": False,
+    "created_at": None,
+}
+
+
+def test_profile_cache_stampede_guard():
+    """✅ cold key에 대한 동시 요청 50개가 DB 로드 1번만 일으키는지 테스트"""
+    cache = UserProfileCache(maxsize=100, ttl=60)
+    loads = []
+
+    async def loader():
+        loads.append(1)
+        await asyncio.sleep(0.01)
+        return dict(PROFILE)
+
+    async def burst():
+        return await asyncio.gather(*(cache.get("uid:uid-1", loader) for _ in range(50)))
+
+    results = asyncio.run(burst())
+    assert len(loads) == 1
+    assert all(result["email"] == "a@example.com" for result in results)
+
+def test_profile_cache_serves_both_keys_and_invalidates():
+    """✅ uid/id 두 키로 캐싱되고, 무효화 후에는 다시 로드되는지 테스트"""
+    cache = UserProfileCache(maxsize=100, ttl=60)
+    loads = []
+
+    async def loader():
+        loads.append(1)
+        return dict(PROFILE)
+
+    async def run():
+        await cache.get("uid:uid-1", loader)
+        await cache.get(f"id:{PROFILE['id']}", loader)
+        await cache.invalidate(firebase_uid="uid-1", user_id=PROFILE["id"])
+        await cache.get(f"id:{PROFILE['id']}", loader)
+
+    asyncio.run(run())
+    assert len(loads) == 2
+    stats = cache.stats()
+    assert stats["db_loads"] == 2
+    assert stats["hits"] == 1
+
+def test_profile_cache_does_not_cache_missing_user():
+    """❌ 존재하지 않는 사용자는 캐싱하지 않는지 테스트"""
+    cache = UserProfileCache(maxsize=100, ttl=60)
+
+    async def loader():
+        return None
+
+    assert asyncio.run(cache.get("uid:missing", loader)) is None
+    assert len(cache.local) == 0
+
+def test_invalidate_during_load_is_not_overwritten():
+    """✅ 로드 도중 무효화되면 이전 행을 캐싱하지 않고, 무효화 이후 조회는 새로 로드하는지 테스트"""
+    cache = UserProfileCache(maxsize=100, ttl=60)
+    rows = [dict(PROFILE), dict(PROFILE, is_suspended=True)]
+    loads = []
+    started = asyncio.Event()
+
+    async def slow_loader():
+        row = rows[len(loads)]
+        loads.append(1)
+        started.set()
+        await asyncio.sleep(0.02)
+        return row
+
+    async def run():
+        before = asyncio.create_task(cache.get("uid:uid-1", slow_loader))
+        await started.wait()
+        # 정지 → 무효화가 진행 중인 로드(정지 이전 행)보다 먼저 끝남
+        await cache.invalidate(firebase_uid="uid-1", user_id=PROFILE["id"])
+        after = await cache.get("uid:uid-1", slow_loader)
+        return await before, after
+
+    before, after = asyncio.run(run())
+    assert before["is_suspended"] is False
+    assert after["is_suspended"] is True
+    assert len(loads) == 2
+    assert cache.local.get("uid:uid-1")["is_suspended"] is True
+    assert cache.local.get(f"id:{PROFILE['id']}")["is_suspended"] is True
+    assert cache._generations == {}